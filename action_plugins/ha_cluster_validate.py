@@ -0,0 +1,386 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+"""
+Validate ha_cluster role variables on the controller
+
+All checks run in one pass and all errors are reported at once, so that users
+do not have to fix their variables one error per role run.
+"""
+
+# make ansible-test happy, even though the plugin requires Python 3
+from __future__ import absolute_import, division, print_function
+
+# make ansible-test happy, even though the plugin requires Python 3
+# pylint: disable=invalid-name
+__metaclass__ = type
+# pylint: enable=invalid-name
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible.plugins.action import ActionBase
+
+# Role variables the checks work with. Variables of other nodes are not
+# available in hostvars when they come from role defaults, so the checks use
+# variables of the current node and facts of other nodes only.
+ROLE_VARS = (
+    "ha_cluster_pacemaker_shell",
+    "ha_cluster_cluster_present",
+    "ha_cluster_qnetd",
+    "ha_cluster_node_options",
+    "ha_cluster_hacluster_password",
+    "ha_cluster_sbd_enabled",
+    "ha_cluster_stonith_levels",
+    "ha_cluster_constraints_location",
+    "ha_cluster_constraints_colocation",
+    "ha_cluster_constraints_order",
+    "ha_cluster_constraints_ticket",
+    "ha_cluster_quorum",
+    "ha_cluster_pcsd_public_key_src",
+    "ha_cluster_pcsd_private_key_src",
+    "ha_cluster_pcsd_certificates",
+    "ha_cluster_restart_strategy",
+    "__ha_cluster_all_node_names",
+    "__ha_cluster_is_booted",
+    "__ha_cluster_sbd_needs_atb",
+)
+
+STONITH_TARGET_KEYS = ("target", "target_pattern", "target_attribute")
+RESTART_STRATEGIES = ("all", "rolling")
+
+
+def _is_true(value: Any) -> bool:
+    return boolean(value, strict=False)
+
+
+def _to_int(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _as_mapping(item: Any) -> Mapping[str, Any]:
+    # Items which are not dictionaries are checked as empty ones, so that they
+    # are reported with the same error as items missing required keys
+    return item if isinstance(item, Mapping) else {}
+
+
+def _has_id(item: Any, key: str = "id") -> bool:
+    return isinstance(item, Mapping) and bool(item.get(key))
+
+
+def _has_resource_sets(constraint: Mapping[str, Any]) -> bool:
+    # Constraint tasks treat constraints with an empty list of sets as simple
+    # constraints
+    return bool(constraint.get("resource_sets"))
+
+
+def _resource_sets_valid(constraint: Mapping[str, Any]) -> bool:
+    return all(
+        isinstance(resource_set, Mapping)
+        and bool(resource_set.get("resource_ids"))
+        for resource_set in constraint["resource_sets"]
+    )
+
+
+def check_cluster_qnetd_consistency(
+    cluster_present: Any, qnetd: Any
+) -> List[str]:
+    """
+    Check that cluster and qnetd are either both managed or both not
+    """
+    if (cluster_present is None) != (qnetd is None):
+        return [
+            "Both 'ha_cluster_cluster_present' and 'ha_cluster_qnetd' must be "
+            "either defined or set to null"
+        ]
+    return []
+
+
+def check_node_options(
+    node_options: Iterable[Mapping[str, Any]], node_names: Iterable[str]
+) -> List[str]:
+    """
+    Check that node options are unique and they belong to cluster nodes
+    """
+    option_names = [options.get("node_name") for options in node_options]
+    known_names = set(node_names)
+    if len(option_names) != len(set(option_names)) or any(
+        name not in known_names for name in option_names
+    ):
+        return [
+            "node_name fields in ha_cluster_node_options must be unique and "
+            "they must match cluster nodes"
+        ]
+    return []
+
+
+def check_password(
+    cluster_present: bool, password: Any, password_needed: bool
+) -> List[str]:
+    """
+    Check that the hacluster password is set
+    """
+    if cluster_present and password_needed and not password:
+        return ["ha_cluster_hacluster_password must be specified"]
+    return []
+
+
+def check_sbd_devices_count(
+    cluster_present: bool,
+    sbd_enabled: bool,
+    node_sbd_devices: Iterable[Optional[List[str]]],
+) -> List[str]:
+    """
+    Check that all nodes have the same number of SBD devices
+    """
+    if not cluster_present or not sbd_enabled:
+        return []
+    if len({len(devices or []) for devices in node_sbd_devices}) > 1:
+        return ["All nodes must have the same number of SBD devices specified"]
+    return []
+
+
+def check_qnetd_on_cluster_node(cluster_present: bool, qnetd: Any) -> List[str]:
+    """
+    Check that qnetd is not configured on a cluster node
+
+    Running a qnetd on a cluster node doesn't make sense, fencing would make
+    the qnetd unavailable, even if temporarily.
+    """
+    if (
+        cluster_present
+        and isinstance(qnetd, Mapping)
+        and _is_true(qnetd.get("present", False))
+    ):
+        return [
+            "Qnetd cannot be configured on a cluster node - "
+            "'ha_cluster_cluster_present' and 'ha_cluster_qnetd.present' "
+            "cannot be both set to true"
+        ]
+    return []
+
+
+def check_stonith_levels(levels: Iterable[Any]) -> List[str]:
+    """
+    Check that each fencing level has a valid level and exactly one target
+    """
+    errors = []
+    for level in map(_as_mapping, levels):
+        if not 0 < _to_int(level.get("level")) < 10:
+            errors.append("Specify 'level' 1..9 for each fencing level")
+        if len([key for key in STONITH_TARGET_KEYS if key in level]) != 1:
+            errors.append(
+                "Specify exactly one of 'target', 'target_pattern', "
+                "'target_attribute' for each fencing level"
+            )
+    return errors
+
+
+def check_constraints(
+    location: Iterable[Any],
+    colocation: Iterable[Any],
+    order: Iterable[Any],
+    ticket: Iterable[Any],
+) -> List[str]:
+    """
+    Check that constraints specify resources they apply to
+    """
+    errors = []
+    for constraint in map(_as_mapping, location):
+        if not (
+            (
+                _has_id(constraint.get("resource"))
+                or _has_id(constraint.get("resource"), "pattern")
+            )
+            and (constraint.get("node") or constraint.get("rule"))
+        ):
+            errors.append(
+                "Specify 'resource' with 'id' or 'pattern' and either 'node' "
+                "or 'rule' for each location constraint"
+            )
+    for constraint in map(_as_mapping, colocation):
+        if not (
+            _resource_sets_valid(constraint)
+            if _has_resource_sets(constraint)
+            else _has_id(constraint.get("resource_follower"))
+            and _has_id(constraint.get("resource_leader"))
+        ):
+            errors.append(
+                "Specify either 'resource_sets' with 'resource_ids' or "
+                "'resource_follower' and 'resource_leader' with 'id' for each "
+                "colocation constraint"
+            )
+    for constraint in map(_as_mapping, order):
+        if not (
+            _resource_sets_valid(constraint)
+            if _has_resource_sets(constraint)
+            else _has_id(constraint.get("resource_first"))
+            and _has_id(constraint.get("resource_then"))
+        ):
+            errors.append(
+                "Specify either 'resource_sets' with 'resource_ids' or "
+                "'resource_first' and 'resource_then' with 'id' for each "
+                "order constraint"
+            )
+    for constraint in map(_as_mapping, ticket):
+        if not (
+            constraint.get("ticket")
+            and (
+                _resource_sets_valid(constraint)
+                if _has_resource_sets(constraint)
+                else _has_id(constraint.get("resource"))
+            )
+        ):
+            errors.append(
+                "Specify 'ticket' and either 'resource_sets' with "
+                "'resource_ids' or 'resource' with 'id' for each ticket "
+                "constraint"
+            )
+    return errors
+
+
+def check_sbd_atb(sbd_needs_atb: bool, quorum: Mapping[str, Any]) -> List[str]:
+    """
+    Check that auto_tie_breaker is not disabled when SBD needs it
+    """
+    if sbd_needs_atb and any(
+        option.get("name") == "auto_tie_breaker"
+        and option.get("value") in ("0", 0)
+        for option in quorum.get("options") or []
+    ):
+        return [
+            "Cannot set auto_tie_breaker to disabled when SBD needs it to be "
+            "enabled"
+        ]
+    return []
+
+
+def check_pcsd_certificates(
+    public_key_src: Any, private_key_src: Any, certificates: Any
+) -> List[str]:
+    """
+    Check that pcsd certificate is not defined in two different ways
+    """
+    if (
+        public_key_src is not None
+        and private_key_src is not None
+        and certificates
+    ):
+        return [
+            "Cannot set ha_cluster_pcsd_public_key_src and "
+            "ha_cluster_pcsd_private_key_src along with "
+            "ha_cluster_pcsd_certificates. Remove "
+            "ha_cluster_pcsd_public_key_src and "
+            "ha_cluster_pcsd_private_key_src or ha_cluster_pcsd_certificates."
+        ]
+    return []
+
+
+def check_restart_strategy(strategy: Any) -> List[str]:
+    """
+    Check that the restart strategy is known
+    """
+    if strategy not in RESTART_STRATEGIES:
+        return [
+            f"ha_cluster_restart_strategy must be one of: "
+            f"{', '.join(RESTART_STRATEGIES)}"
+        ]
+    return []
+
+
+def validate(
+    role_vars: Mapping[str, Any], node_sbd_devices: List[Optional[List[str]]]
+) -> List[str]:
+    """
+    Run all checks, return a list of errors without duplicates
+    """
+    is_pcs = role_vars.get("ha_cluster_pacemaker_shell", "pcs") == "pcs"
+    cluster_present = _is_true(role_vars.get("ha_cluster_cluster_present"))
+    qnetd = role_vars.get("ha_cluster_qnetd")
+
+    errors = check_cluster_qnetd_consistency(
+        role_vars.get("ha_cluster_cluster_present"), qnetd
+    )
+    errors += check_node_options(
+        role_vars.get("ha_cluster_node_options") or [],
+        role_vars.get("__ha_cluster_all_node_names") or [],
+    )
+    errors += check_password(
+        cluster_present,
+        role_vars.get("ha_cluster_hacluster_password"),
+        # passwords will not be set when the role runs at image-build time
+        not is_pcs or _is_true(role_vars.get("__ha_cluster_is_booted", True)),
+    )
+    errors += check_sbd_devices_count(
+        cluster_present,
+        _is_true(role_vars.get("ha_cluster_sbd_enabled")),
+        node_sbd_devices,
+    )
+    errors += check_qnetd_on_cluster_node(cluster_present, qnetd)
+    errors += check_stonith_levels(
+        role_vars.get("ha_cluster_stonith_levels") or []
+    )
+    errors += check_constraints(
+        role_vars.get("ha_cluster_constraints_location") or [],
+        role_vars.get("ha_cluster_constraints_colocation") or [],
+        role_vars.get("ha_cluster_constraints_order") or [],
+        role_vars.get("ha_cluster_constraints_ticket") or [],
+    )
+    errors += check_sbd_atb(
+        _is_true(role_vars.get("__ha_cluster_sbd_needs_atb")),
+        role_vars.get("ha_cluster_quorum") or {},
+    )
+    if is_pcs:
+        errors += check_pcsd_certificates(
+            role_vars.get("ha_cluster_pcsd_public_key_src"),
+            role_vars.get("ha_cluster_pcsd_private_key_src"),
+            role_vars.get("ha_cluster_pcsd_certificates"),
+        )
+    errors += check_restart_strategy(
+        role_vars.get("ha_cluster_restart_strategy", "all")
+    )
+    return list(dict.fromkeys(errors))
+
+
+class ActionModule(ActionBase):
+    """
+    Validate ha_cluster role variables
+    """
+
+    TRANSFERS_FILES = False
+    _requires_connection = False
+
+    def run(
+        self, tmp: Any = None, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        if task_vars is None:
+            task_vars = {}
+        result = super().run(tmp, task_vars)
+        del tmp  # tmp no longer has any effect
+
+        role_vars = {
+            name: self._templar.template(task_vars[name])
+            for name in ROLE_VARS
+            if name in task_vars
+        }
+        hostvars = task_vars.get("hostvars", {})
+        node_sbd_devices = []
+        for host in task_vars.get("ansible_play_hosts", []):
+            local_node = self._templar.template(
+                hostvars[host].get("__ha_cluster_local_node") or {}
+            )
+            node_sbd_devices.append(local_node.get("sbd_devices"))
+
+        errors = validate(role_vars, node_sbd_devices)
+        result["changed"] = False
+        result["errors"] = errors
+        if errors:
+            result["failed"] = True
+            result["msg"] = "\n".join(errors)
+        return result
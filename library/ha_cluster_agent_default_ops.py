@@ -0,0 +1,325 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# make ansible-test happy, even though the module requires Python 3
+from __future__ import absolute_import, division, print_function
+
+# make ansible-test happy, even though the module requires Python 3
+# pylint: disable=invalid-name
+__metaclass__ = type
+# pylint: enable=invalid-name
+
+DOCUMENTATION = r"""
+---
+module: ha_cluster_agent_default_ops
+short_description: Get default operations of resource and stonith agents
+description: >
+    This module loads metadata of each specified resource or stonith agent
+    once and computes operations pcs would copy from the agent to a newly
+    created resource. The computed operations are cached on the node and
+    reused until the package providing the agent changes. Agents which
+    metadata cannot be loaded are not present in the result. The module does
+    not modify the cluster. Check mode is supported, the cache is not updated
+    in check mode.
+author:
+    - Tomas Jelinek (@tomjelinek)
+requirements:
+    - pacemaker (crm_resource) installed on managed nodes
+    - python 3.6 or newer
+options:
+    agents:
+        description: >
+            list of agents in the form of standard:provider:type or
+            standard:type
+        required: true
+        type: list
+        elements: str
+    cache_dir:
+        description: directory to store the cached operations in
+        type: path
+        default: /var/cache/ha_cluster/agent_default_ops
+"""
+
+EXAMPLES = r"""
+- name: Get default operations of agents
+  ha_cluster_agent_default_ops:
+    agents:
+      - ocf:heartbeat:IPaddr2
+      - stonith:fence_xvm
+  register: default_ops
+"""
+
+RETURN = r"""
+default_ops:
+    description: >
+        Default operations of each agent, keyed by the agent name. The
+        operations have the same structure as 'operations' of items of
+        'ha_cluster_resource_primitives'. The 'role' attribute is either
+        'promoted', 'unpromoted' or the role as defined in the agent metadata.
+    type: dict
+    returned: success
+cached:
+    description: Agents whose operations were taken from the cache
+    type: list
+    elements: str
+    returned: success
+"""
+
+import hashlib
+import json
+import os
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, List, Optional
+
+from ansible.module_utils.basic import AnsibleModule
+
+# Actions which are never configured as resource operations
+IGNORED_ACTIONS = frozenset(
+    ("meta-data", "methods", "status", "usage", "validate-all")
+)
+# Only the monitor operation is copied from stonith agents
+STONITH_ACTIONS = frozenset(("monitor",))
+DEFAULT_MONITOR_INTERVAL = "60s"
+DEFAULT_INTERVAL = "0s"
+ROLE_MAP = {
+    "master": "promoted",  # wokeignore:rule=master
+    "promoted": "promoted",
+    "slave": "unpromoted",  # wokeignore:rule=slave
+    "unpromoted": "unpromoted",
+}
+# Version of the cache file format and the operations computing logic
+CACHE_VERSION = 1
+
+AgentOperation = Dict[str, Any]
+
+
+def is_stonith(agent: str) -> bool:
+    """
+    Check whether an agent is a stonith agent
+    """
+    return agent.startswith("stonith:")
+
+
+def default_operations(agent: str, metadata_xml: str) -> List[AgentOperation]:
+    """
+    Compute default operations from agent metadata
+
+    agent -- name of the agent
+    metadata_xml -- metadata of the agent
+    """
+    dom = ET.fromstring(metadata_xml)
+    operations: List[AgentOperation] = []
+    has_monitor = False
+    for action in dom.iterfind("./actions/action"):
+        name = action.get("name", "")
+        if not name or name in IGNORED_ACTIONS:
+            continue
+        if is_stonith(agent) and name not in STONITH_ACTIONS:
+            continue
+        has_monitor = has_monitor or name == "monitor"
+        attrs = [
+            dict(
+                name="interval",
+                value=action.get("interval", "")
+                or (
+                    DEFAULT_MONITOR_INTERVAL
+                    if name == "monitor"
+                    else DEFAULT_INTERVAL
+                ),
+            )
+        ]
+        for attr_name in ("timeout", "start-delay"):
+            value = action.get(attr_name, "")
+            if value:
+                attrs.append(dict(name=attr_name, value=value))
+        role = action.get("role", "")
+        if role:
+            attrs.append(
+                dict(name="role", value=ROLE_MAP.get(role.lower(), role))
+            )
+        depth = action.get("depth", "0")
+        if depth != "0":
+            attrs.append(dict(name="OCF_CHECK_LEVEL", value=depth))
+        operations.append(dict(action=name, attrs=attrs))
+    if not has_monitor:
+        operations.append(
+            dict(
+                action="monitor",
+                attrs=[dict(name="interval", value=DEFAULT_MONITOR_INTERVAL)],
+            )
+        )
+    return operations
+
+
+def _agent_path(module: AnsibleModule, agent: str) -> Optional[str]:
+    """
+    Get path to an executable implementing the agent, if it is a file
+    """
+    parts = agent.split(":")
+    if parts[0] == "ocf" and len(parts) == 3:
+        ocf_root = os.environ.get("OCF_ROOT", "/usr/lib/ocf")
+        return os.path.join(ocf_root, "resource.d", parts[1], parts[2])
+    if parts[0] == "stonith" and len(parts) == 2:
+        return module.get_bin_path(parts[1], opt_dirs=["/usr/sbin"])
+    return None
+
+
+def get_cache_key(module: AnsibleModule, agent: str) -> Optional[str]:
+    """
+    Get a string identifying the installed version of an agent
+
+    The version of the package owning the agent is used. If that is not
+    available, the agent file modification time and size are used instead.
+    Agents not implemented by a file, such as systemd units, are not cached.
+    """
+    path = _agent_path(module, agent)
+    if not path or not os.path.isfile(path):
+        return None
+    rpm = module.get_bin_path("rpm")
+    if rpm:
+        # wokeignore:rule=dummy
+        rc, stdout, dummy_stderr = module.run_command(
+            [rpm, "-qf", "--queryformat", "%{NEVRA}\n", path],
+            environ_update={"LC_ALL": "C"},
+            check_rc=False,
+        )
+        if rc == 0 and stdout.strip():
+            return f"package:{stdout.strip()}"
+    stat = os.stat(path)
+    return f"file:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _cache_file(cache_dir: str, agent: str) -> str:
+    """
+    Get path to a cache file of an agent
+    """
+    return os.path.join(
+        cache_dir, hashlib.sha256(agent.encode("utf-8")).hexdigest() + ".json"
+    )
+
+
+def load_cache(
+    cache_dir: str, agent: str, key: str
+) -> Optional[List[AgentOperation]]:
+    """
+    Load cached operations of an agent, return None if not cached or stale
+    """
+    try:
+        with open(_cache_file(cache_dir, agent), encoding="utf-8") as cache_fd:
+            data = json.load(cache_fd)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != CACHE_VERSION
+        or data.get("agent") != agent
+        or data.get("key") != key
+        or not isinstance(data.get("operations"), list)
+    ):
+        return None
+    return data["operations"]
+
+
+def save_cache(
+    cache_dir: str, agent: str, key: str, operations: List[AgentOperation]
+) -> None:
+    """
+    Store operations of an agent to the cache, errors are ignored
+    """
+    path = _cache_file(cache_dir, agent)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as cache_fd:
+            json.dump(
+                dict(
+                    version=CACHE_VERSION,
+                    agent=agent,
+                    key=key,
+                    operations=operations,
+                ),
+                cache_fd,
+            )
+        os.rename(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def load_metadata(module: AnsibleModule, agent: str) -> Optional[str]:
+    """
+    Run the agent's meta-data action, return None on failure
+    """
+    # wokeignore:rule=dummy
+    rc, stdout, dummy_stderr = module.run_command(
+        ["crm_resource", "--show-metadata", agent],
+        environ_update={"LC_ALL": "C"},
+        check_rc=False,
+    )
+    return stdout if rc == 0 else None
+
+
+def get_default_ops(
+    module: AnsibleModule, agents: List[str], cache_dir: str
+) -> Dict[str, Any]:
+    """
+    Get default operations of agents, each agent is processed only once
+    """
+    default_ops: Dict[str, List[AgentOperation]] = {}
+    cached: List[str] = []
+    for agent in sorted(set(agents)):
+        key = get_cache_key(module, agent)
+        if key is not None:
+            operations = load_cache(cache_dir, agent, key)
+            if operations is not None:
+                default_ops[agent] = operations
+                cached.append(agent)
+                continue
+        metadata = load_metadata(module, agent)
+        if metadata is None:
+            continue
+        try:
+            operations = default_operations(agent, metadata)
+        except ET.ParseError:
+            continue
+        default_ops[agent] = operations
+        if key is not None and not module.check_mode:
+            save_cache(cache_dir, agent, key, operations)
+    return dict(default_ops=default_ops, cached=cached)
+
+
+def run_module() -> None:
+    """
+    Top level module function
+    """
+    module_args = dict(
+        agents=dict(type="list", elements="str", required=True),
+        cache_dir=dict(
+            type="path", default="/var/cache/ha_cluster/agent_default_ops"
+        ),
+    )
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+
+    module.exit_json(
+        changed=False,
+        **get_default_ops(
+            module, module.params["agents"], module.params["cache_dir"]
+        ),
+    )
+
+
+def main() -> None:
+    """
+    Entry point
+    """
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# make ansible-test happy, even though the module requires Python 3
+from __future__ import absolute_import, division, print_function
+
+# make ansible-test happy, even though the module requires Python 3
+# pylint: disable=invalid-name
+__metaclass__ = type
+# pylint: enable=invalid-name
+
+DOCUMENTATION = r"""
+---
+module: ha_cluster_corosync_conf
+short_description: Render corosync.conf on a cluster node
+description: >
+    This module builds corosync configuration from the role variables the same
+    way 'pcs cluster setup' and 'pcs quorum device add' do and compares it
+    with the current corosync.conf on the node. The file is only written if
+    the configurations define different options, formatting differences are
+    ignored. Check mode is supported.
+author:
+    - Tomas Jelinek (@tomjelinek)
+requirements:
+    - python 3.6 or newer
+options:
+    path:
+        description: path to corosync.conf
+        type: path
+        default: /etc/corosync/corosync.conf
+    cluster_name:
+        description: name of the cluster
+        required: true
+        type: str
+    nodes:
+        description: cluster nodes in the order of their node ids
+        required: true
+        type: list
+        elements: dict
+        suboptions:
+            name:
+                description: name of the node
+                required: true
+                type: str
+            addrs:
+                description: >
+                    addresses of the node used by corosync, the node name is
+                    used if no addresses are specified
+                type: list
+                elements: str
+                default: []
+    transport:
+        description: structure of the 'ha_cluster_transport' role variable
+        type: dict
+        default: {}
+    totem:
+        description: structure of the 'ha_cluster_totem' role variable
+        type: dict
+        default: {}
+    quorum:
+        description: structure of the 'ha_cluster_quorum' role variable
+        type: dict
+        default: {}
+    force_auto_tie_breaker:
+        description: >
+            enable auto_tie_breaker regardless of quorum options, needed by SBD
+            without disks in clusters with an even number of nodes
+        type: bool
+        default: false
+    backup:
+        description: >
+            create a backup of the current corosync.conf before replacing it
+        type: bool
+        default: false
+"""
+
+EXAMPLES = r"""
+- name: Render corosync.conf
+  ha_cluster_corosync_conf:
+    cluster_name: my-cluster
+    nodes:
+      - name: node1
+        addrs:
+          - 192.168.1.11
+      - name: node2
+        addrs:
+          - 192.168.1.12
+    totem:
+      options:
+        - name: token
+          value: 5000
+"""
+
+RETURN = r"""
+content:
+    description: rendered corosync.conf
+    type: str
+    returned: success
+backup_file:
+    description: path to the backup of the replaced corosync.conf
+    type: str
+    returned: when the file has been replaced and a backup has been requested
+"""
+
+import os
+from typing import Optional
+
+from ansible.module_utils.basic import AnsibleModule
+
+# pylint: disable=no-name-in-module
+from ansible.module_utils.ha_cluster_lsr import corosync_conf
+
+# pylint: enable=no-name-in-module
+
+
+def read_current(path: str) -> Optional[str]:
+    """
+    Read the current corosync.conf, None if it does not exist
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as conf_file:
+        return conf_file.read()
+
+
+def needs_update(current: Optional[str], new: str) -> bool:
+    """
+    Check whether the current corosync.conf needs to be replaced
+    """
+    if current is None:
+        return True
+    try:
+        return not corosync_conf.is_equivalent(current, new)
+    except corosync_conf.CorosyncConfParseError:
+        return True
+
+
+def write_file(module: AnsibleModule, path: str, content: str) -> None:
+    """
+    Atomically replace a file with a new content
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(
+        os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644),
+        "w",
+        encoding="utf-8",
+    ) as conf_file:
+        conf_file.write(content)
+    module.atomic_move(tmp_path, path)
+
+
+def run_module() -> None:
+    """
+    Top level module function
+    """
+    module_args = dict(
+        path=dict(type="path", default="/etc/corosync/corosync.conf"),
+        cluster_name=dict(type="str", required=True),
+        nodes=dict(
+            type="list",
+            elements="dict",
+            required=True,
+            options=dict(
+                name=dict(type="str", required=True),
+                addrs=dict(type="list", elements="str", default=[]),
+            ),
+        ),
+        transport=dict(type="dict", default={}),
+        totem=dict(type="dict", default={}),
+        quorum=dict(type="dict", default={}),
+        force_auto_tie_breaker=dict(type="bool", default=False),
+        backup=dict(type="bool", default=False),
+    )
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+
+    try:
+        content = corosync_conf.export(
+            corosync_conf.build(
+                module.params["cluster_name"],
+                module.params["nodes"],
+                module.params["transport"],
+                module.params["totem"],
+                module.params["quorum"],
+                module.params["force_auto_tie_breaker"],
+            )
+        )
+    except corosync_conf.CorosyncConfBuildError as e:
+        module.fail_json(msg=e.msg)
+
+    path = module.params["path"]
+    current = read_current(path)
+    changed = needs_update(current, content)
+    result = dict(
+        changed=changed,
+        content=content,
+        diff=dict(before=current or "", after=content) if changed else {},
+    )
+    if changed and not module.check_mode:
+        if module.params["backup"] and current is not None:
+            result["backup_file"] = module.backup_local(path)
+        write_file(module, path, content)
+    module.exit_json(**result)
+
+
+def main() -> None:
+    """
+    Entry point
+    """
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
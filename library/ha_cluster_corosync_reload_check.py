@@ -0,0 +1,308 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# make ansible-test happy, even though the module requires Python 3
+from __future__ import absolute_import, division, print_function
+
+# make ansible-test happy, even though the module requires Python 3
+# pylint: disable=invalid-name
+__metaclass__ = type
+# pylint: enable=invalid-name
+
+DOCUMENTATION = r"""
+---
+module: ha_cluster_corosync_reload_check
+short_description: Check whether corosync.conf changes can be reloaded
+description: >
+    This module compares the current corosync.conf with its new content and
+    decides whether the changes can be applied by reloading corosync
+    configuration or whether corosync has to be restarted. The decision is
+    based on the installed corosync version. Unknown options and changes
+    which cannot be classified are treated as requiring a restart. The module
+    does not modify the node. Check mode is supported.
+author:
+    - Tomas Jelinek (@tomjelinek)
+requirements:
+    - corosync installed on managed nodes
+    - python 3.6 or newer
+options:
+    path:
+        description: path to the current corosync.conf
+        type: path
+        default: /etc/corosync/corosync.conf
+    new_content:
+        description: new content of corosync.conf
+        required: true
+        type: str
+"""
+
+EXAMPLES = r"""
+- name: Check whether corosync.conf changes can be reloaded
+  ha_cluster_corosync_reload_check:
+    new_content: "{{ new_corosync_conf }}"
+  register: reload_check
+"""
+
+RETURN = r"""
+current_config_exists:
+    description: >
+        Whether the current corosync.conf exists. If it does not, the node is
+        not a cluster member yet and no restart is required.
+    type: bool
+    returned: success
+corosync_version:
+    description: Installed corosync version, empty if not detected
+    type: str
+    returned: success
+restart_required:
+    description: Whether corosync must be restarted to apply the changes
+    type: bool
+    returned: success
+qdevice_restart_required:
+    description: >
+        Whether corosync-qdevice must be restarted to apply the changes,
+        corosync-qdevice does not support reloading its configuration
+    type: bool
+    returned: success
+reload_changes:
+    description: Changed options which can be applied by a reload
+    type: list
+    elements: str
+    returned: success
+restart_changes:
+    description: Changed options which require a restart
+    type: list
+    elements: str
+    returned: success
+rolling_restart_possible:
+    description: >
+        Whether the restart can be done node by node. This is not possible if
+        nodes running the current and the new configuration cannot form a
+        membership, e.g. when cluster name, transport, crypto or node
+        addresses change.
+    type: bool
+    returned: success
+"""
+
+import os
+import re
+from fnmatch import fnmatchcase
+from typing import Dict, List, Optional, Tuple
+
+from ansible.module_utils.basic import AnsibleModule
+
+# pylint: disable=no-name-in-module
+from ansible.module_utils.ha_cluster_lsr import corosync_conf
+
+# pylint: enable=no-name-in-module
+
+Version = Tuple[int, ...]
+
+# Options which corosync applies on 'corosync-cfgtool -R' and the first
+# corosync version which does so. Ids of repeated sections are stripped from
+# option paths before matching, e.g. 'totem.interface.knet_ping_timeout'.
+RELOADABLE_OPTIONS: Tuple[Tuple[str, Version], ...] = (
+    ("logging.*", (3, 0, 0)),
+    ("totem.token", (3, 0, 0)),
+    ("totem.token_coefficient", (3, 0, 0)),
+    ("totem.token_retransmit", (3, 0, 0)),
+    ("totem.token_retransmits_before_loss_const", (3, 0, 0)),
+    ("totem.hold", (3, 0, 0)),
+    ("totem.join", (3, 0, 0)),
+    ("totem.send_join", (3, 0, 0)),
+    ("totem.consensus", (3, 0, 0)),
+    ("totem.merge", (3, 0, 0)),
+    ("totem.downcheck", (3, 0, 0)),
+    ("totem.fail_recv_const", (3, 0, 0)),
+    ("totem.seqno_unchanged_const", (3, 0, 0)),
+    ("totem.heartbeat_failures_allowed", (3, 0, 0)),
+    ("totem.max_network_delay", (3, 0, 0)),
+    ("totem.window_size", (3, 0, 0)),
+    ("totem.max_messages", (3, 0, 0)),
+    ("totem.miss_count_const", (3, 0, 0)),
+    ("totem.knet_pmtud_interval", (3, 0, 0)),
+    ("totem.interface.knet_link_priority", (3, 0, 0)),
+    ("totem.interface.knet_ping_interval", (3, 0, 0)),
+    ("totem.interface.knet_ping_timeout", (3, 0, 0)),
+    ("totem.interface.knet_ping_precision", (3, 0, 0)),
+    ("totem.interface.knet_pong_count", (3, 0, 0)),
+    ("totem.block_unlisted_ips", (3, 0, 3)),
+    ("totem.cancel_token_hold_on_retransmit", (3, 1, 0)),
+    ("totem.crypto_cipher", (3, 1, 0)),
+    ("totem.crypto_hash", (3, 1, 0)),
+    ("totem.crypto_model", (3, 1, 0)),
+    ("quorum.expected_votes", (3, 0, 0)),
+    ("quorum.device.*", (3, 0, 0)),
+    ("nodelist.node.quorum_votes", (3, 0, 0)),
+)
+
+# Options which must be the same on all nodes for the nodes to form
+# a membership. Changing them requires all nodes to be restarted at once.
+MEMBERSHIP_OPTIONS = (
+    "totem.cluster_name",
+    "totem.crypto_*",
+    "totem.interface.*",
+    "totem.ip_version",
+    "totem.knet_compression_*",
+    "totem.netmtu",
+    "totem.secauth",
+    "totem.transport",
+    "totem.version",
+    "nodelist.node.*",
+    "quorum.provider",
+)
+
+
+def get_corosync_version(module: AnsibleModule) -> Optional[Version]:
+    """
+    Get version of the installed corosync, None if not detected
+    """
+    corosync = module.get_bin_path("corosync", opt_dirs=["/usr/sbin"])
+    if not corosync:
+        return None
+    # wokeignore:rule=dummy
+    rc, stdout, dummy_stderr = module.run_command(
+        [corosync, "-v"], environ_update={"LC_ALL": "C"}, check_rc=False
+    )
+    if rc != 0:
+        return None
+    match = re.search(r"version '(\d+)\.(\d+)\.(\d+)", stdout)
+    if not match:
+        return None
+    return tuple(int(part) for part in match.groups())
+
+
+def _generic_path(path: str) -> str:
+    """
+    Strip ids of repeated sections from an option path
+    """
+    return re.sub(r"\[[^\]]*\]", "", path)
+
+
+def _added_or_removed_node(
+    path: str, old_options: Dict[str, str], new_options: Dict[str, str]
+) -> bool:
+    """
+    Check whether an option belongs to a node added or removed as a whole
+    """
+    match = re.match(r"(nodelist\.node\[[^\]]*\])\.", path)
+    if not match:
+        return False
+    prefix = match.group(1) + "."
+    in_old = any(key.startswith(prefix) for key in old_options)
+    in_new = any(key.startswith(prefix) for key in new_options)
+    return in_old != in_new
+
+
+def is_reloadable(path: str, version: Version) -> bool:
+    """
+    Check whether a change of an option can be applied by a reload
+    """
+    generic_path = _generic_path(path)
+    return any(
+        fnmatchcase(generic_path, pattern) and version >= min_version
+        for pattern, min_version in RELOADABLE_OPTIONS
+    )
+
+
+def classify_changes(
+    old_conf: str, new_conf: str, version: Optional[Version]
+) -> Dict[str, object]:
+    """
+    Sort changed options to those which can be reloaded and the others
+
+    old_conf -- current content of corosync.conf
+    new_conf -- new content of corosync.conf
+    version -- installed corosync version
+    """
+    old_options = corosync_conf.flatten(corosync_conf.parse(old_conf))
+    new_options = corosync_conf.flatten(corosync_conf.parse(new_conf))
+    reload_changes: List[str] = []
+    restart_changes: List[str] = []
+    for path in sorted(set(old_options) | set(new_options)):
+        if old_options.get(path) == new_options.get(path):
+            continue
+        if version is not None and (
+            # Nodes can be added and removed at runtime, but addresses and
+            # ids of existing nodes cannot be changed.
+            _added_or_removed_node(path, old_options, new_options)
+            or is_reloadable(path, version)
+        ):
+            reload_changes.append(path)
+        else:
+            restart_changes.append(path)
+    return dict(
+        restart_required=bool(restart_changes),
+        qdevice_restart_required=any(
+            path.startswith("quorum.device.")
+            for path in reload_changes + restart_changes
+        ),
+        reload_changes=reload_changes,
+        restart_changes=restart_changes,
+        rolling_restart_possible=not any(
+            fnmatchcase(_generic_path(path), pattern)
+            for path in restart_changes
+            for pattern in MEMBERSHIP_OPTIONS
+        ),
+    )
+
+
+def run_module() -> None:
+    """
+    Top level module function
+    """
+    module_args = dict(
+        path=dict(type="path", default="/etc/corosync/corosync.conf"),
+        new_content=dict(type="str", required=True),
+    )
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+
+    path = module.params["path"]
+    result: Dict[str, object] = dict(
+        changed=False,
+        current_config_exists=os.path.exists(path),
+        corosync_version="",
+        restart_required=False,
+        qdevice_restart_required=False,
+        reload_changes=[],
+        restart_changes=[],
+        rolling_restart_possible=True,
+    )
+    if not result["current_config_exists"]:
+        module.exit_json(**result)
+
+    version = get_corosync_version(module)
+    if version is not None:
+        result["corosync_version"] = ".".join(str(part) for part in version)
+    with open(path, encoding="utf-8") as conf_file:
+        old_conf = conf_file.read()
+    try:
+        result.update(
+            classify_changes(old_conf, module.params["new_content"], version)
+        )
+    except corosync_conf.CorosyncConfParseError as e:
+        # Unable to tell what changed, restart to be on the safe side
+        result.update(
+            restart_required=True,
+            qdevice_restart_required=True,
+            rolling_restart_possible=False,
+            warnings=[
+                f"Unable to parse corosync.conf, line {e.line_number}: {e.msg}"
+            ],
+        )
+    module.exit_json(**result)
+
+
+def main() -> None:
+    """
+    Entry point
+    """
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
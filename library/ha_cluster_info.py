@@ -255,10 +255,12 @@ def export_cluster_configuration(
     # available in recent pcs versions. Check pcs capabilities.
     result: Dict[str, Any] = dict()
 
-    corosync_enabled = loader.is_service_enabled(cmd_runner, "corosync")
-    pacemaker_enabled = loader.is_service_enabled(cmd_runner, "pacemaker")
+    services_status = (
+        loader.get_services_status(cmd_runner, ["corosync", "pacemaker"]) or {}
+    )
     result["ha_cluster_start_on_boot"] = exporter.export_start_on_boot(
-        corosync_enabled, pacemaker_enabled
+        services_status.get("corosync", {}).get("enabled", False),
+        services_status.get("pacemaker", {}).get("enabled", False),
     )
 
     # Convert corosync config to role format
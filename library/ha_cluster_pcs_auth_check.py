@@ -0,0 +1,292 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# make ansible-test happy, even though the module requires Python 3
+from __future__ import absolute_import, division, print_function
+
+# make ansible-test happy, even though the module requires Python 3
+# pylint: disable=invalid-name
+__metaclass__ = type
+# pylint: enable=invalid-name
+
+DOCUMENTATION = r"""
+---
+module: ha_cluster_pcs_auth_check
+short_description: Check whether pcs auth tokens for hosts are present
+description: >
+    This module reads pcs known hosts on the local node and checks that all
+    specified hosts are known with the expected addresses. Tokens of the
+    hosts are only verified by connecting to the hosts if the known hosts
+    file changed since tokens have been successfully verified last time.
+    Digest of the verified known hosts file is stored in a state file. Check
+    mode is supported, the state file is not updated in check mode.
+author:
+    - Tomas Jelinek (@tomjelinek)
+requirements:
+    - pcs-0.10 or newer installed on managed nodes
+    - python 3.6 or newer
+options:
+    hosts:
+        description: hosts expected to be authenticated
+        required: true
+        type: list
+        elements: dict
+        suboptions:
+            name:
+                description: name of the host
+                required: true
+                type: str
+            pcs_address:
+                description: >
+                    address and optionally a port pcs uses to connect to the
+                    host, the host name is used if not specified
+                type: str
+    known_hosts_path:
+        description: path to pcs known hosts file
+        type: path
+        default: /var/lib/pcsd/known-hosts
+    state_path:
+        description: path to the file storing digest of verified known hosts
+        type: path
+        default: /var/lib/pcsd/known-hosts.verified
+    timeout:
+        description: timeout in seconds for verifying a token of a host
+        type: int
+        default: 10
+"""
+
+EXAMPLES = r"""
+- name: Check pcs auth status
+  ha_cluster_pcs_auth_check:
+    hosts:
+      - name: node1
+      - name: node2
+        pcs_address: 192.168.1.12:2224
+  register: pcs_auth_status
+"""
+
+RETURN = r"""
+auth_required:
+    description: whether any of the hosts needs to be authenticated
+    type: bool
+    returned: success
+unauthenticated:
+    description: names of hosts which need to be authenticated
+    type: list
+    elements: str
+    returned: success
+tokens_verified:
+    description: >
+        whether tokens have been verified by connecting to the hosts in this
+        run, false if the known hosts file had been verified before
+    type: bool
+    returned: success
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.urls import open_url
+
+DEFAULT_PORT = 2224
+MAX_PARALLEL_CHECKS = 16
+
+
+def parse_address(address: str) -> Tuple[str, Optional[int]]:
+    """
+    Split an address to a host and an optional port
+    """
+    if address.startswith("["):
+        host, _, rest = address[1:].partition("]")
+        port = rest[1:] if rest.startswith(":") else ""
+    elif address.count(":") == 1:
+        host, _, port = address.partition(":")
+    else:
+        # a host name or an IPv6 address without a port
+        host, port = address, ""
+    return host, int(port) if port.isdigit() else None
+
+
+def load_known_hosts(path: str) -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    Read pcs known hosts, return None if the file is missing or malformed
+    """
+    try:
+        with open(path, "rb") as known_hosts_file:
+            raw = known_hosts_file.read()
+    except FileNotFoundError:
+        return None, ""
+    digest = hashlib.sha256(raw).hexdigest()
+    try:
+        known_hosts = json.loads(raw)["known_hosts"]
+    except (ValueError, KeyError, TypeError):
+        return None, digest
+    if not isinstance(known_hosts, dict):
+        return None, digest
+    return known_hosts, digest
+
+
+def is_known(known_hosts: Dict[str, Any], host: Dict[str, Any]) -> bool:
+    """
+    Check that a host is known with a token and the expected address
+    """
+    known_host = known_hosts.get(host["name"])
+    if not isinstance(known_host, dict) or not known_host.get("token"):
+        return False
+    addr, port = parse_address(host["pcs_address"] or host["name"])
+    return any(
+        dest.get("addr") == addr
+        and (port is None or dest.get("port", DEFAULT_PORT) == port)
+        for dest in known_host.get("dest_list", [])
+        if isinstance(dest, dict)
+    )
+
+
+def check_token(known_host: Dict[str, Any], timeout: int) -> bool:
+    """
+    Check whether a host accepts its token
+    """
+    for dest in known_host.get("dest_list", []):
+        addr = dest["addr"]
+        if ":" in addr:
+            addr = f"[{addr}]"
+        try:
+            response = open_url(
+                f"https://{addr}:{dest.get('port', DEFAULT_PORT)}"
+                "/remote/check_auth",
+                method="POST",
+                data="check_auth_only=1",
+                headers={
+                    "Content-Type": "application/x-www-form-urlencoded",
+                    "Cookie": f"token={known_host['token']}",
+                },
+                validate_certs=False,
+                use_proxy=False,
+                timeout=timeout,
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            # The host is not reachable on this address or rejected the
+            # token, try the next address
+            continue
+        if response.getcode() == 200:
+            return True
+    return False
+
+
+def find_unauthenticated(
+    known_hosts: Optional[Dict[str, Any]],
+    hosts: List[Dict[str, Any]],
+) -> List[str]:
+    """
+    Get names of hosts which are not known with the expected address
+    """
+    if known_hosts is None:
+        return [host["name"] for host in hosts]
+    return [host["name"] for host in hosts if not is_known(known_hosts, host)]
+
+
+def verify_tokens(
+    known_hosts: Dict[str, Any], names: List[str], timeout: int
+) -> List[str]:
+    """
+    Verify tokens of hosts in parallel, return names of rejected hosts
+    """
+    if not names:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=min(len(names), MAX_PARALLEL_CHECKS)
+    ) as executor:
+        results = executor.map(
+            lambda name: check_token(known_hosts[name], timeout), names
+        )
+        return [name for name, valid in zip(names, results) if not valid]
+
+
+def read_state(path: str) -> str:
+    """
+    Read digest of the last verified known hosts file
+    """
+    try:
+        with open(path, encoding="utf-8") as state_file:
+            return state_file.read().strip()
+    except FileNotFoundError:
+        return ""
+
+
+def write_state(path: str, digest: str) -> None:
+    """
+    Store digest of a verified known hosts file
+    """
+    with open(
+        os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600),
+        "w",
+        encoding="utf-8",
+    ) as state_file:
+        state_file.write(f"{digest}\n")
+
+
+def run_module() -> None:
+    """
+    Top level module function
+    """
+    module_args = dict(
+        hosts=dict(
+            type="list",
+            elements="dict",
+            required=True,
+            options=dict(
+                name=dict(type="str", required=True),
+                pcs_address=dict(type="str"),
+            ),
+        ),
+        known_hosts_path=dict(type="path", default="/var/lib/pcsd/known-hosts"),
+        state_path=dict(
+            type="path", default="/var/lib/pcsd/known-hosts.verified"
+        ),
+        timeout=dict(type="int", default=10),
+    )
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+
+    hosts = module.params["hosts"]
+    known_hosts, digest = load_known_hosts(module.params["known_hosts_path"])
+    unauthenticated = find_unauthenticated(known_hosts, hosts)
+    tokens_verified = False
+    if (
+        known_hosts is not None
+        and not unauthenticated
+        and digest != read_state(module.params["state_path"])
+    ):
+        tokens_verified = True
+        unauthenticated = verify_tokens(
+            known_hosts,
+            [host["name"] for host in hosts],
+            module.params["timeout"],
+        )
+        if not unauthenticated and not module.check_mode:
+            write_state(module.params["state_path"], digest)
+
+    module.exit_json(
+        changed=False,
+        auth_required=bool(unauthenticated),
+        unauthenticated=unauthenticated,
+        tokens_verified=tokens_verified,
+    )
+
+
+def main() -> None:
+    """
+    Entry point
+    """
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# make ansible-test happy, even though the module requires Python 3
+from __future__ import absolute_import, division, print_function
+
+# make ansible-test happy, even though the module requires Python 3
+# pylint: disable=invalid-name
+__metaclass__ = type
+# pylint: enable=invalid-name
+
+DOCUMENTATION = r"""
+---
+module: ha_cluster_preshared_keys
+short_description: Get digests of preshared keys and update the keys
+description: >
+    This module reports SHA-256 digests of the specified preshared keys on a
+    node. If a key content is specified, the key file is replaced unless its
+    digest already matches the digest of the specified content. Ownership and
+    mode of existing key files are enforced unless only digests are requested.
+    Key contents are never returned. Check mode is supported.
+author:
+    - Tomas Jelinek (@tomjelinek)
+requirements:
+    - python 3.6 or newer
+options:
+    keys:
+        description: preshared keys to process
+        required: true
+        type: list
+        elements: dict
+        suboptions:
+            name:
+                description: key identifier used in the module result
+                required: true
+                type: str
+            path:
+                description: path to the key file
+                required: true
+                type: path
+            content:
+                description: >
+                    base64 encoded content of the key, if not specified the
+                    key file is not replaced
+                type: str
+            owner:
+                description: owner of the key file
+                type: str
+                default: root
+            group:
+                description: group of the key file
+                type: str
+                default: root
+            mode:
+                description: mode of the key file
+                type: str
+                default: "0400"
+    digest_only:
+        description: only report digests, do not modify any key files
+        type: bool
+        default: false
+"""
+
+EXAMPLES = r"""
+- name: Get digests of preshared keys
+  ha_cluster_preshared_keys:
+    keys:
+      - name: corosync_authkey
+        path: /etc/corosync/authkey
+    digest_only: true
+  register: keys_digests
+
+- name: Update a preshared key
+  ha_cluster_preshared_keys:
+    keys:
+      - name: corosync_authkey
+        path: /etc/corosync/authkey
+        content: "{{ authkey_base64 }}"
+"""
+
+RETURN = r"""
+keys:
+    description: >
+        State of each key keyed by the key name: whether the key file 'exists',
+        its 'sha256' digest, null if the file does not exist, and whether the
+        key file has been 'changed'
+    type: dict
+    returned: success
+"""
+
+import base64
+import binascii
+import hashlib
+import os
+from typing import Any, Dict, Optional
+
+from ansible.module_utils.basic import AnsibleModule
+
+
+def file_digest(path: str) -> Optional[str]:
+    """
+    Get SHA-256 digest of a file, None if the file does not exist
+    """
+    try:
+        with open(path, "rb") as key_file:
+            return hashlib.sha256(key_file.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def write_key(module: AnsibleModule, path: str, content: bytes) -> None:
+    """
+    Atomically replace a key file, the file is never readable by others
+    """
+    os.makedirs(os.path.dirname(path), mode=0o755, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(
+        os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb"
+    ) as key_file:
+        key_file.write(content)
+    module.atomic_move(tmp_path, path)
+
+
+def process_key(module: AnsibleModule, key: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Report the state of a key and update it if its content is specified
+    """
+    path = key["path"]
+    digest = file_digest(path)
+    changed = False
+    if module.params["digest_only"]:
+        return dict(exists=digest is not None, sha256=digest, changed=changed)
+    if key["content"] is not None:
+        try:
+            content = base64.b64decode(key["content"], validate=True)
+        except binascii.Error:
+            module.fail_json(msg=f"Content of key '{key['name']}' is not valid")
+        new_digest = hashlib.sha256(content).hexdigest()
+        if new_digest != digest:
+            changed = True
+            if not module.check_mode:
+                write_key(module, path, content)
+            digest = new_digest
+    if os.path.exists(path):
+        file_args = module.load_file_common_arguments(
+            dict(path=path, owner=key["owner"], group=key["group"])
+        )
+        file_args["mode"] = key["mode"]
+        changed = module.set_fs_attributes_if_different(file_args, changed)
+    return dict(exists=digest is not None, sha256=digest, changed=changed)
+
+
+def run_module() -> None:
+    """
+    Top level module function
+    """
+    module_args = dict(
+        keys=dict(
+            type="list",
+            elements="dict",
+            required=True,
+            options=dict(
+                name=dict(type="str", required=True),
+                path=dict(type="path", required=True),
+                content=dict(type="str", no_log=True),
+                owner=dict(type="str", default="root"),
+                group=dict(type="str", default="root"),
+                mode=dict(type="str", default="0400"),
+            ),
+        ),
+        digest_only=dict(type="bool", default=False),
+    )
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+
+    keys = {
+        key["name"]: process_key(module, key) for key in module.params["keys"]
+    }
+    module.exit_json(
+        changed=any(key["changed"] for key in keys.values()), keys=keys
+    )
+
+
+def main() -> None:
+    """
+    Entry point
+    """
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# make ansible-test happy, even though the module requires Python 3
+from __future__ import absolute_import, division, print_function
+
+# make ansible-test happy, even though the module requires Python 3
+# pylint: disable=invalid-name
+__metaclass__ = type
+# pylint: enable=invalid-name
+
+DOCUMENTATION = r"""
+---
+module: ha_cluster_purge_nodes
+short_description: Purge removed nodes from pacemaker's caches
+description: >
+    This module lists cluster nodes known to pacemaker and removes all nodes
+    which are not expected to be in the cluster from pacemaker's caches.
+    Pacemaker remote and guest nodes are never removed. Check mode is
+    supported.
+author:
+    - Tomas Jelinek (@tomjelinek)
+requirements:
+    - pacemaker running on the managed node
+    - python 3.6 or newer
+options:
+    expected_nodes:
+        description: names of nodes expected to be in the cluster
+        required: true
+        type: list
+        elements: str
+"""
+
+EXAMPLES = r"""
+- name: Purge removed nodes from pacemaker's caches
+  ha_cluster_purge_nodes:
+    expected_nodes:
+      - node1
+      - node2
+"""
+
+RETURN = r"""
+removed_nodes:
+    description: names of nodes removed from pacemaker's caches
+    type: list
+    elements: str
+    returned: success
+"""
+
+from typing import List
+from xml.etree import ElementTree
+
+from ansible.module_utils.basic import AnsibleModule
+
+
+def get_cluster_nodes(status_xml: str) -> List[str]:
+    """
+    Get names of cluster nodes from crm_mon XML output
+    """
+    return [
+        node.attrib["name"]
+        for node in ElementTree.fromstring(status_xml).iterfind("./nodes/node")
+        if node.get("type", "member") == "member" and node.get("name")
+    ]
+
+
+def run_module() -> None:
+    """
+    Top level module function
+    """
+    module_args = dict(
+        expected_nodes=dict(type="list", elements="str", required=True),
+    )
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+
+    # Using crm_node --list would be a preferred solution. However, crm_node
+    # doesn't show nodes removed from a cluster after corosync / pacemaker
+    # restart. Therefore, crm_node is no help when we want to list such
+    # nodes.
+    rc, stdout, stderr = module.run_command(
+        ["crm_mon", "--one-shot", "--inactive", "--output-as=xml"],
+        environ_update={"LC_ALL": "C"},
+        check_rc=False,
+    )
+    if rc != 0:
+        module.fail_json(
+            msg="Unable to get cluster status",
+            rc=rc,
+            stdout=stdout,
+            stderr=stderr,
+        )
+    try:
+        cluster_nodes = get_cluster_nodes(stdout)
+    except ElementTree.ParseError as e:
+        module.fail_json(msg=f"Unable to parse cluster status: {e}")
+
+    removed_nodes = [
+        node
+        for node in cluster_nodes
+        if node not in module.params["expected_nodes"]
+    ]
+    if not module.check_mode:
+        for node in removed_nodes:
+            # This is what 'pcs cluster node clear' does
+            rc, stdout, stderr = module.run_command(
+                ["crm_node", "--force", "--remove", node],
+                environ_update={"LC_ALL": "C"},
+                check_rc=False,
+            )
+            if rc != 0:
+                module.fail_json(
+                    msg=f"Unable to remove node '{node}' from pacemaker",
+                    rc=rc,
+                    stdout=stdout,
+                    stderr=stderr,
+                )
+    module.exit_json(changed=bool(removed_nodes), removed_nodes=removed_nodes)
+
+
+def main() -> None:
+    """
+    Entry point
+    """
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# make ansible-test happy, even though the module requires Python 3
+from __future__ import absolute_import, division, print_function
+
+# make ansible-test happy, even though the module requires Python 3
+# pylint: disable=invalid-name
+__metaclass__ = type
+# pylint: enable=invalid-name
+
+DOCUMENTATION = r"""
+---
+module: ha_cluster_qdevice_certs_cli
+short_description: Obtain and distribute qdevice certificates using pcs CLI
+description: >
+    This module checks that qdevice certificates on the node are present,
+    issued for the specified cluster and signed by the CA of the specified
+    qnetd host. If they are not, the module obtains the certificates from
+    pcsd running on the qnetd host and imports them using pcs. It is meant
+    for pcs versions not capable of handling qdevice certificates locally.
+    Check mode is supported.
+author:
+    - Tomas Jelinek (@tomjelinek)
+requirements:
+    - pcs and corosync-qdevice installed on the managed node
+    - the qnetd host authenticated in pcs on the managed node
+    - python 3.6 or newer
+options:
+    qnetd_host:
+        description: qnetd host name as known to pcs
+        required: true
+        type: str
+    cluster_name:
+        description: name of the cluster
+        required: true
+        type: str
+"""
+
+EXAMPLES = r"""
+- name: Obtain and distribute qdevice certificates
+  ha_cluster_qdevice_certs_cli:
+    qnetd_host: qnetd-node
+    cluster_name: my-cluster
+"""
+
+RETURN = r"""
+certificates_present:
+    description: >
+        whether valid certificates were present on the node before running
+        the module
+    type: bool
+    returned: success
+"""
+
+import json
+import os
+import re
+import ssl
+import tempfile
+from base64 import b64decode, b64encode
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPException, HTTPSConnection
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from ansible.module_utils.basic import AnsibleModule
+
+KNOWN_HOSTS_PATH = "/var/lib/pcsd/known-hosts"
+CERT_DB = "/etc/corosync/qdevice/net/nssdb"
+CERT_REQUEST_PATH = os.path.join(CERT_DB, "qdevice-net-node.crq")
+CERT_P12_PATH = os.path.join(CERT_DB, "qdevice-net-node.p12")
+CA_NICKNAME = "QNet CA"
+CLUSTER_CERT_NICKNAME = "Cluster Cert"
+
+GET_CA_PATH = "/remote/qdevice_net_get_ca_certificate"
+SIGN_CERT_PATH = "/remote/qdevice_net_sign_node_certificate"
+PCSD_TIMEOUT = 30
+
+_PEM_RE = re.compile(
+    r"^-----BEGIN CERTIFICATE-----$.*?^-----END CERTIFICATE-----$",
+    re.DOTALL | re.MULTILINE,
+)
+_SUBJECT_CN_RE = re.compile(r'^\s*Subject: "CN=(.*)"\s*$', re.MULTILINE)
+
+
+class QdeviceCertsError(Exception):
+    """
+    Obtaining or distributing certificates failed
+    """
+
+
+def get_pcsd_address(
+    known_hosts: Dict[str, Any], host: str
+) -> Tuple[str, int, str]:
+    """
+    Get address, port and token of a host from pcs known-hosts data
+    """
+    try:
+        host_data = known_hosts["known_hosts"][host]
+        dest = host_data["dest_list"][0]
+        return str(dest["addr"]), int(dest["port"]), str(host_data["token"])
+    except (KeyError, IndexError, TypeError, ValueError) as exc:
+        raise QdeviceCertsError(
+            f"Host '{host}' is not authenticated in pcs"
+        ) from exc
+
+
+def extract_certificates(pem: str) -> List[str]:
+    """
+    Get PEM certificates from a text with newlines removed
+    """
+    return [
+        re.sub(r"[\r\n]", "", match)
+        for match in _PEM_RE.findall(pem.replace("\r\n", "\n"))
+    ]
+
+
+def get_subject_names(certutil_output: str) -> List[str]:
+    """
+    Get subject common names from certutil -L -n output
+    """
+    return _SUBJECT_CN_RE.findall(certutil_output)
+
+
+class PcsdSession:
+    """
+    Keep-alive HTTPS connection to pcsd on a remote host
+    """
+
+    def __init__(
+        self, addr: str, port: int, token: str, timeout: float = PCSD_TIMEOUT
+    ):
+        # pcsd uses a self-signed certificate by default
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        self._connection = HTTPSConnection(
+            addr, port, timeout=timeout, context=context
+        )
+        self._token = token
+        self._used = False
+
+    def __enter__(self) -> "PcsdSession":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the connection
+        """
+        self._connection.close()
+
+    def _request(
+        self, method: str, path: str, body: Optional[str]
+    ) -> Tuple[int, bytes]:
+        headers = {
+            "Connection": "keep-alive",
+            "Cookie": f"token={self._token}",
+        }
+        if body is not None:
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        self._connection.request(method, path, body=body, headers=headers)
+        response = self._connection.getresponse()
+        data = response.read()
+        if response.will_close:
+            self._connection.close()
+        return response.status, data
+
+    def _send(
+        self, method: str, path: str, body: Optional[str] = None
+    ) -> bytes:
+        try:
+            try:
+                status, data = self._request(method, path, body)
+            except (BrokenPipeError, ConnectionResetError):
+                if not self._used:
+                    raise
+                # pcsd closed the idle connection while local commands were
+                # running, it is safe to send the request again
+                self._connection.close()
+                status, data = self._request(method, path, body)
+        except (OSError, HTTPException) as exc:
+            self._connection.close()
+            raise QdeviceCertsError(
+                f"Unable to communicate with pcsd: {exc}"
+            ) from exc
+        self._used = True
+        if status != 200:
+            raise QdeviceCertsError(
+                f"pcsd returned HTTP status {status}: "
+                f"{data.decode('utf-8', errors='replace')}"
+            )
+        return data
+
+    def get_ca_certificate(self) -> bytes:
+        """
+        Download a base64 encoded CA certificate of qnetd
+        """
+        return self._send("GET", GET_CA_PATH)
+
+    def sign_certificate_request(
+        self, cluster_name: str, request: bytes
+    ) -> bytes:
+        """
+        Let qnetd sign a certificate request, return the signed certificate
+        """
+        data = self._send(
+            "POST",
+            SIGN_CERT_PATH,
+            urlencode(
+                dict(
+                    cluster_name=cluster_name,
+                    certificate_request=b64encode(request).decode("ascii"),
+                )
+            ),
+        )
+        try:
+            return b64decode(data)
+        except ValueError as exc:
+            raise QdeviceCertsError(
+                f"Unable to decode signed certificate: {exc}"
+            ) from exc
+
+
+def _run(
+    module: AnsibleModule, cmd: List[str], data: Optional[str] = None
+) -> str:
+    rc, stdout, stderr = module.run_command(
+        cmd, data=data, environ_update={"LC_ALL": "C"}, check_rc=False
+    )
+    if rc != 0:
+        raise QdeviceCertsError(
+            f"Command '{' '.join(cmd)}' failed: {stderr or stdout}"
+        )
+    return stdout
+
+
+def _read_cert_db(
+    module: AnsibleModule, nickname: str, ascii_output: bool = False
+) -> Optional[str]:
+    # wokeignore:rule=dummy
+    rc, stdout, dummy_stderr = module.run_command(
+        ["certutil", "-d", CERT_DB, "-L", "-n", nickname]
+        + (["-a"] if ascii_output else []),
+        environ_update={"LC_ALL": "C"},
+        check_rc=False,
+    )
+    # certutil fails if there is no certificate with the nickname
+    return stdout if rc == 0 else None
+
+
+def check_certs(
+    module: AnsibleModule, session: PcsdSession, cluster_name: str
+) -> Tuple[bool, bytes]:
+    """
+    Check that the node has certificates for the cluster signed by the qnetd
+    CA, return the check result and the qnetd CA certificate
+    """
+    # The local certificate database and the remote qnetd do not depend on
+    # each other, read them at the same time
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        local_ca_future = executor.submit(
+            _read_cert_db, module, CA_NICKNAME, True
+        )
+        cluster_cert_future = executor.submit(
+            _read_cert_db, module, CLUSTER_CERT_NICKNAME
+        )
+        qnetd_ca_future = executor.submit(session.get_ca_certificate)
+        local_ca = local_ca_future.result()
+        cluster_cert = cluster_cert_future.result()
+        qnetd_ca = qnetd_ca_future.result()
+
+    if local_ca is None or cluster_cert is None:
+        return False, qnetd_ca
+    local_ca_certs = extract_certificates(local_ca)
+    if len(local_ca_certs) != 1:
+        return False, qnetd_ca
+    if get_subject_names(cluster_cert) != [cluster_name]:
+        return False, qnetd_ca
+    try:
+        qnetd_ca_certs = extract_certificates(
+            b64decode(qnetd_ca).decode("utf-8")
+        )
+    except ValueError as exc:
+        raise QdeviceCertsError(
+            f"Unable to decode qnetd CA certificate: {exc}"
+        ) from exc
+    return local_ca_certs == qnetd_ca_certs, qnetd_ca
+
+
+def setup_certs(
+    module: AnsibleModule,
+    session: PcsdSession,
+    cluster_name: str,
+    qnetd_ca: bytes,
+) -> None:
+    """
+    Initialize the certificate database and import a certificate for the
+    cluster signed by qnetd
+    """
+    _run(
+        module,
+        ["pcs", "--", "qdevice", "net-client", "setup"],
+        data=qnetd_ca.decode("ascii"),
+    )
+    _run(module, ["corosync-qdevice-net-certutil", "-r", "-n", cluster_name])
+    with open(CERT_REQUEST_PATH, "rb") as request_file:
+        request = request_file.read()
+    signed_cert = session.sign_certificate_request(cluster_name, request)
+    with tempfile.NamedTemporaryFile(suffix="_ha_cluster_qdevice") as cert:
+        cert.write(signed_cert)
+        cert.flush()
+        _run(module, ["corosync-qdevice-net-certutil", "-M", "-c", cert.name])
+    with open(CERT_P12_PATH, "rb") as p12_file:
+        p12 = b64encode(p12_file.read()).decode("ascii")
+    _run(
+        module,
+        ["pcs", "--", "qdevice", "net-client", "import-certificate"],
+        data=p12,
+    )
+
+
+def run_module() -> None:
+    """
+    Top level module function
+    """
+    module_args = dict(
+        qnetd_host=dict(type="str", required=True),
+        cluster_name=dict(type="str", required=True),
+    )
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+    cluster_name = module.params["cluster_name"]
+
+    try:
+        try:
+            with open(KNOWN_HOSTS_PATH, encoding="utf-8") as known_hosts_file:
+                known_hosts = json.load(known_hosts_file)
+        except (OSError, ValueError) as exc:
+            raise QdeviceCertsError(
+                f"Unable to read pcs known hosts: {exc}"
+            ) from exc
+        addr, port, token = get_pcsd_address(
+            known_hosts, module.params["qnetd_host"]
+        )
+        with PcsdSession(addr, port, token) as session:
+            present, qnetd_ca = check_certs(module, session, cluster_name)
+            if not present and not module.check_mode:
+                setup_certs(module, session, cluster_name, qnetd_ca)
+    except (OSError, QdeviceCertsError) as exc:
+        module.fail_json(msg=str(exc))
+
+    module.exit_json(changed=not present, certificates_present=present)
+
+
+def main() -> None:
+    """
+    Entry point
+    """
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# make ansible-test happy, even though the module requires Python 3
+from __future__ import absolute_import, division, print_function
+
+# make ansible-test happy, even though the module requires Python 3
+# pylint: disable=invalid-name
+__metaclass__ = type
+# pylint: enable=invalid-name
+
+DOCUMENTATION = r"""
+---
+module: ha_cluster_qnetd_state
+short_description: Get state of qnetd certificates and service
+description: >
+    This module inspects the qnetd NSS certificate database and the
+    corosync-qnetd service and reports whether qnetd needs to be set up. The
+    module does not modify the node. Check mode is supported.
+author:
+    - Tomas Jelinek (@tomjelinek)
+requirements:
+    - systemd on the managed node
+    - python 3.6 or newer
+"""
+
+EXAMPLES = r"""
+- name: Get qnetd state
+  ha_cluster_qnetd_state:
+  register: qnetd_state
+
+- name: Set up qnetd
+  command:
+    cmd: pcs --start -- qdevice setup model net
+  when: not qnetd_state.initialized
+"""
+
+RETURN = r"""
+initialized:
+    description: >
+        whether the qnetd certificate database has been initialized, this is
+        what pcs checks before setting qnetd up
+    type: bool
+    returned: success
+certificates:
+    description: nicknames of certificates in the qnetd certificate database
+    type: list
+    elements: str
+    returned: success
+setup_needed:
+    description: >
+        whether the certificate database is not initialized or does not
+        contain the qnetd CA and server certificates
+    type: bool
+    returned: success
+service:
+    description: >
+        Status of the corosync-qnetd service: 'installed', 'running',
+        'enabled' and raw systemd properties 'load_state', 'active_state' and
+        'unit_file_state'
+    type: dict
+    returned: success
+"""
+
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from ansible.module_utils.basic import AnsibleModule
+
+# pylint: disable=no-name-in-module
+from ansible.module_utils.ha_cluster_lsr.info import loader
+
+CERT_DB = "/etc/corosync/qnetd/nssdb"
+# pcs considers qnetd initialized if this file exists
+CA_FILE_PATH = os.path.join(CERT_DB, "qnetd-cacert.crt")
+# nicknames used by corosync-qnetd-certutil
+REQUIRED_CERTIFICATES = ("QNet CA", "QNetd Cert")
+
+_CERT_LINE_RE = re.compile(r"^(?P<nickname>\S.*?)\s+\S*,\S*,\S*$")
+
+
+def parse_certificate_list(certutil_output: str) -> List[str]:
+    """
+    Get certificate nicknames from certutil -L output
+    """
+    nicknames = []
+    for line in certutil_output.splitlines():
+        # skip the header, trust attributes are "SSL,S/MIME,JAR/XPI"
+        if line.startswith("Certificate Nickname") or "S/MIME" in line:
+            continue
+        match = _CERT_LINE_RE.match(line.rstrip())
+        if match:
+            nicknames.append(match.group("nickname"))
+    return nicknames
+
+
+def get_certificates(module: AnsibleModule) -> List[str]:
+    """
+    Get nicknames of certificates in the qnetd certificate database
+    """
+    rc, stdout, stderr = module.run_command(
+        ["certutil", "-d", CERT_DB, "-L"],
+        environ_update={"LC_ALL": "C"},
+        check_rc=False,
+    )
+    if rc != 0:
+        # Do not report a database which cannot be read as incomplete, that
+        # would get a working qnetd destroyed
+        module.fail_json(
+            msg="Unable to list certificates in qnetd certificate database",
+            rc=rc,
+            stdout=stdout,
+            stderr=stderr,
+        )
+    return parse_certificate_list(stdout)
+
+
+def run_module() -> None:
+    """
+    Top level module function
+    """
+    module = AnsibleModule(argument_spec={}, supports_check_mode=True)
+
+    def runner(
+        args: List[str], environ_update: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, str, str]:
+        return module.run_command(
+            args, check_rc=False, environ_update=environ_update
+        )
+
+    services = loader.get_services_status(runner, ["corosync-qnetd"])
+    if services is None:
+        module.fail_json(msg="Unable to get status of services from systemd")
+        return
+
+    initialized = os.path.exists(CA_FILE_PATH)
+    certificates = get_certificates(module) if initialized else []
+    module.exit_json(
+        changed=False,
+        initialized=initialized,
+        certificates=certificates,
+        setup_needed=not all(
+            nickname in certificates for nickname in REQUIRED_CERTIFICATES
+        ),
+        service=services["corosync-qnetd"],
+    )
+
+
+def main() -> None:
+    """
+    Entry point
+    """
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
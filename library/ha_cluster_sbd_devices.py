@@ -0,0 +1,278 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# make ansible-test happy, even though the module requires Python 3
+from __future__ import absolute_import, division, print_function
+
+# make ansible-test happy, even though the module requires Python 3
+# pylint: disable=invalid-name
+__metaclass__ = type
+# pylint: enable=invalid-name
+
+DOCUMENTATION = r"""
+---
+module: ha_cluster_sbd_devices
+short_description: Probe and initialize SBD devices
+description: >
+    This module checks whether SBD devices contain an SBD header. All devices
+    are probed in parallel. Devices listed in 'initialize' are initialized if
+    they do not contain an SBD header. This allows to elect a single node
+    initializing a shared device while other nodes only verify the device.
+    Check mode is supported.
+author:
+    - Tomas Jelinek (@tomjelinek)
+requirements:
+    - sbd installed on managed nodes
+    - python 3.6 or newer
+options:
+    devices:
+        description: SBD devices to probe
+        required: true
+        type: list
+        elements: str
+    initialize:
+        description: >
+            devices to initialize if they do not contain an SBD header, they
+            must be listed in 'devices' as well
+        type: list
+        elements: str
+        default: []
+    watchdog_timeout:
+        description: >
+            watchdog timeout in seconds stored in the header of initialized
+            devices, sbd default is used if not specified
+        type: int
+    msgwait_timeout:
+        description: >
+            msgwait timeout in seconds stored in the header of initialized
+            devices, sbd default is used if not specified
+        type: int
+    require_initialized:
+        description: >
+            fail if any of the devices does not contain an SBD header after
+            the requested devices have been initialized
+        type: bool
+        default: false
+    use_pcs:
+        description: >
+            initialize devices with 'pcs stonith sbd device setup' instead of
+            running sbd directly, pcs validates the devices and timeouts
+        type: bool
+        default: false
+"""
+
+EXAMPLES = r"""
+- name: Probe SBD devices
+  ha_cluster_sbd_devices:
+    devices:
+      - /dev/disk/by-id/sbd-disk-1
+  register: sbd_devices
+
+- name: Initialize SBD devices
+  ha_cluster_sbd_devices:
+    devices:
+      - /dev/disk/by-id/sbd-disk-1
+    initialize:
+      - /dev/disk/by-id/sbd-disk-1
+    watchdog_timeout: 60
+    msgwait_timeout: 120
+    use_pcs: true
+"""
+
+RETURN = r"""
+devices:
+    description: >
+        State of each device keyed by the device path: whether the device
+        contains an SBD header, 'initialized', and whether it has been
+        initialized by the module, 'changed'
+    type: dict
+    returned: success
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from ansible.module_utils.basic import AnsibleModule
+
+# Probing a device only reads its header, no need to limit the number of
+# parallel probes more than this
+MAX_PARALLEL_PROBES = 16
+
+
+def is_initialized(module: AnsibleModule, sbd: str, device: str) -> bool:
+    """
+    Check whether a device contains an SBD header
+    """
+    # wokeignore:rule=dummy
+    rc, dummy_stdout, dummy_stderr = module.run_command(
+        [sbd, "-d", device, "dump"],
+        environ_update={"LC_ALL": "C"},
+        check_rc=False,
+    )
+    return rc == 0
+
+
+def probe_devices(
+    module: AnsibleModule, sbd: str, devices: List[str]
+) -> Dict[str, bool]:
+    """
+    Check which devices contain an SBD header, devices are probed in parallel
+    """
+    if not devices:
+        return {}
+    with ThreadPoolExecutor(
+        max_workers=min(len(devices), MAX_PARALLEL_PROBES)
+    ) as executor:
+        return dict(
+            zip(
+                devices,
+                executor.map(
+                    lambda device: is_initialized(module, sbd, device), devices
+                ),
+            )
+        )
+
+
+def sbd_create_command(
+    sbd: str,
+    devices: List[str],
+    watchdog_timeout: Optional[int],
+    msgwait_timeout: Optional[int],
+) -> List[str]:
+    """
+    Build a command writing an SBD header to devices using sbd
+    """
+    cmd = [sbd]
+    for device in devices:
+        cmd.extend(["-d", device])
+    if watchdog_timeout is not None:
+        cmd.extend(["-1", str(watchdog_timeout)])
+    if msgwait_timeout is not None:
+        cmd.extend(["-4", str(msgwait_timeout)])
+    cmd.append("create")
+    return cmd
+
+
+def pcs_setup_command(
+    pcs: str,
+    devices: List[str],
+    watchdog_timeout: Optional[int],
+    msgwait_timeout: Optional[int],
+) -> List[str]:
+    """
+    Build a command writing an SBD header to devices using pcs
+    """
+    # use --force to skip interactive confirmation
+    cmd = [pcs, "--force", "--", "stonith", "sbd", "device", "setup"]
+    cmd.extend(f"device={device}" for device in devices)
+    if watchdog_timeout is not None:
+        cmd.append(f"watchdog-timeout={watchdog_timeout}")
+    if msgwait_timeout is not None:
+        cmd.append(f"msgwait-timeout={msgwait_timeout}")
+    return cmd
+
+
+def initialize_devices(
+    module: AnsibleModule, cmd: List[str], devices: List[str]
+) -> None:
+    """
+    Write an SBD header to devices by running a command built for them
+    """
+    rc, stdout, stderr = module.run_command(
+        cmd, environ_update={"LC_ALL": "C"}, check_rc=False
+    )
+    if rc != 0:
+        module.fail_json(
+            msg="Unable to initialize SBD devices",
+            devices=devices,
+            rc=rc,
+            stdout=stdout,
+            stderr=stderr,
+        )
+
+
+def run_module() -> None:
+    """
+    Top level module function
+    """
+    module_args = dict(
+        devices=dict(type="list", elements="str", required=True),
+        initialize=dict(type="list", elements="str", default=[]),
+        watchdog_timeout=dict(type="int"),
+        msgwait_timeout=dict(type="int"),
+        require_initialized=dict(type="bool", default=False),
+        use_pcs=dict(type="bool", default=False),
+    )
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+
+    devices = module.params["devices"]
+    unknown = [
+        device
+        for device in module.params["initialize"]
+        if device not in devices
+    ]
+    if unknown:
+        module.fail_json(
+            msg="Devices to initialize must be listed in 'devices'",
+            devices=unknown,
+        )
+
+    sbd = module.get_bin_path("sbd", required=True, opt_dirs=["/usr/sbin"])
+    initialized = probe_devices(module, sbd, devices)
+    to_initialize = [
+        device
+        for device in module.params["initialize"]
+        if not initialized[device]
+    ]
+    if to_initialize and not module.check_mode:
+        if module.params["use_pcs"]:
+            cmd = pcs_setup_command(
+                module.get_bin_path("pcs", required=True),
+                to_initialize,
+                module.params["watchdog_timeout"],
+                module.params["msgwait_timeout"],
+            )
+        else:
+            cmd = sbd_create_command(
+                sbd,
+                to_initialize,
+                module.params["watchdog_timeout"],
+                module.params["msgwait_timeout"],
+            )
+        initialize_devices(module, cmd, to_initialize)
+    result: Dict[str, Any] = dict(
+        changed=bool(to_initialize),
+        devices={
+            device: dict(
+                initialized=initialized[device] or device in to_initialize,
+                changed=device in to_initialize,
+            )
+            for device in devices
+        },
+    )
+
+    uninitialized = [
+        device
+        for device, state in result["devices"].items()
+        if not state["initialized"]
+    ]
+    if module.params["require_initialized"] and uninitialized:
+        module.fail_json(
+            msg="SBD devices have not been initialized", devices=uninitialized
+        )
+    module.exit_json(**result)
+
+
+def main() -> None:
+    """
+    Entry point
+    """
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# make ansible-test happy, even though the module requires Python 3
+from __future__ import absolute_import, division, print_function
+
+# make ansible-test happy, even though the module requires Python 3
+# pylint: disable=invalid-name
+__metaclass__ = type
+# pylint: enable=invalid-name
+
+DOCUMENTATION = r"""
+---
+module: ha_cluster_sbd_watchdog
+short_description: Configure watchdog kernel modules for SBD
+description: >
+    This module blocklists and unloads specified kernel modules, configures
+    specified watchdog kernel modules to be loaded on boot and loads them.
+    If any watchdog modules are specified, it then verifies that a watchdog
+    device is present. Check mode is supported.
+author:
+    - Tomas Jelinek (@tomjelinek)
+requirements:
+    - python 3.6 or newer
+options:
+    modules:
+        description: watchdog kernel modules to load
+        type: list
+        elements: str
+        default: []
+    modules_blocklist:
+        description: watchdog kernel modules to blocklist and unload
+        type: list
+        elements: str
+        default: []
+    device_timeout:
+        description: >
+            seconds to wait for a watchdog device to appear after loading
+            the watchdog kernel modules
+        type: int
+        default: 10
+"""
+
+EXAMPLES = r"""
+- name: Configure watchdog kernel modules
+  ha_cluster_sbd_watchdog:
+    modules:
+      - softdog
+    modules_blocklist:
+      - iTCO_wdt
+"""
+
+RETURN = r"""
+modules:
+    description: >
+        State of each kernel module keyed by the module name: whether its
+        configuration file has been changed, 'config_changed', and whether
+        the module has been loaded or unloaded, 'state_changed'
+    type: dict
+    returned: success
+watchdog_devices:
+    description: watchdog devices present on the node
+    type: list
+    elements: str
+    returned: success
+"""
+
+import glob
+import os
+import re
+import time
+from typing import Any, Dict, List, Set
+
+from ansible.module_utils.basic import AnsibleModule
+
+MODPROBE_DIR = "/etc/modprobe.d"
+MODULES_LOAD_DIR = "/etc/modules-load.d"
+WATCHDOG_DEVICES = "/dev/watchdog*"
+
+
+def ensure_line(
+    module: AnsibleModule, path: str, regexp: str, line: str
+) -> bool:
+    """
+    Make sure a file contains a line, replace the last line matching regexp
+    or append the line if no line matches. Return True if the file changed.
+    """
+    lines: List[str] = []
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as conf_file:
+            lines = conf_file.read().splitlines()
+    matching = [
+        index
+        for index, old_line in enumerate(lines)
+        if re.search(regexp, old_line)
+    ]
+    if matching:
+        if lines[matching[-1]] == line:
+            return False
+        lines[matching[-1]] = line
+    else:
+        lines.append(line)
+    if not module.check_mode:
+        os.makedirs(os.path.dirname(path), mode=0o755, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as conf_file:
+            conf_file.write("\n".join(lines) + "\n")
+        os.chmod(path, 0o644)
+    return True
+
+
+def _normalize(name: str) -> str:
+    """
+    Kernel module names do not distinguish dashes and underscores
+    """
+    return name.replace("-", "_")
+
+
+def get_loaded_modules() -> Set[str]:
+    """
+    Get names of loaded kernel modules
+    """
+    with open("/proc/modules", encoding="utf-8") as proc_modules:
+        return {_normalize(line.split(" ", 1)[0]) for line in proc_modules}
+
+
+def get_builtin_modules() -> Set[str]:
+    """
+    Get names of kernel modules built into the running kernel
+    """
+    modules = set()
+    builtin_path = os.path.join(
+        "/lib/modules", os.uname().release, "modules.builtin"
+    )
+    if os.path.exists(builtin_path):
+        with open(builtin_path, encoding="utf-8") as builtin:
+            for line in builtin:
+                modules.add(
+                    _normalize(os.path.basename(line.strip()).split(".", 1)[0])
+                )
+    return modules
+
+
+def modprobe(module: AnsibleModule, name: str, unload: bool) -> None:
+    """
+    Load or unload a kernel module
+    """
+    cmd = [module.get_bin_path("modprobe", required=True)]
+    if unload:
+        cmd.append("-r")
+    cmd.append(name)
+    rc, stdout, stderr = module.run_command(
+        cmd, environ_update={"LC_ALL": "C"}, check_rc=False
+    )
+    if rc != 0:
+        module.fail_json(
+            msg=f"Unable to {'unload' if unload else 'load'} kernel module "
+            f"'{name}'",
+            rc=rc,
+            stdout=stdout,
+            stderr=stderr,
+        )
+
+
+def wait_for_devices(timeout: int) -> List[str]:
+    """
+    Wait for a watchdog device to appear, return present watchdog devices
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        devices = sorted(glob.glob(WATCHDOG_DEVICES))
+        if devices or time.monotonic() >= deadline:
+            return devices
+        time.sleep(0.5)
+
+
+def run_module() -> None:
+    """
+    Top level module function
+    """
+    module_args = dict(
+        modules=dict(type="list", elements="str", default=[]),
+        modules_blocklist=dict(type="list", elements="str", default=[]),
+        device_timeout=dict(type="int", default=10),
+    )
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+
+    loaded = get_loaded_modules()
+    builtin = get_builtin_modules()
+    modules: Dict[str, Dict[str, Any]] = {}
+
+    for name in module.params["modules_blocklist"]:
+        state_changed = _normalize(name) in loaded
+        modules[name] = dict(
+            config_changed=ensure_line(
+                module,
+                os.path.join(MODPROBE_DIR, f"{name}.conf"),
+                f"^(options|blacklist) {re.escape(name)}",
+                # wokeignore:rule=blacklist
+                f"blacklist {name}",
+            ),
+            state_changed=state_changed,
+        )
+        if state_changed and not module.check_mode:
+            modprobe(module, name, unload=True)
+
+    for name in module.params["modules"]:
+        state_changed = _normalize(name) not in loaded | builtin
+        modules[name] = dict(
+            config_changed=ensure_line(
+                module,
+                os.path.join(MODULES_LOAD_DIR, f"{name}.conf"),
+                f"^{re.escape(name)}",
+                name,
+            ),
+            state_changed=state_changed,
+        )
+        if state_changed and not module.check_mode:
+            modprobe(module, name, unload=False)
+
+    result: Dict[str, Any] = dict(
+        changed=any(
+            state["config_changed"] or state["state_changed"]
+            for state in modules.values()
+        ),
+        modules=modules,
+        watchdog_devices=sorted(glob.glob(WATCHDOG_DEVICES)),
+    )
+    if module.params["modules"] and not module.check_mode:
+        result["watchdog_devices"] = wait_for_devices(
+            module.params["device_timeout"]
+        )
+        if not result["watchdog_devices"]:
+            module.fail_json(
+                msg="No watchdog device is present after loading watchdog "
+                "kernel modules",
+                **result,
+            )
+    module.exit_json(**result)
+
+
+def main() -> None:
+    """
+    Entry point
+    """
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# make ansible-test happy, even though the module requires Python 3
+from __future__ import absolute_import, division, print_function
+
+# make ansible-test happy, even though the module requires Python 3
+# pylint: disable=invalid-name
+__metaclass__ = type
+# pylint: enable=invalid-name
+
+DOCUMENTATION = r"""
+---
+module: ha_cluster_service_status
+short_description: Get status of cluster related services
+description: >
+    This module loads state and enablement of specified systemd services in
+    one systemctl call. Unlike service_facts, it does not list all units
+    present on the node. The module does not modify the node. Check mode is
+    supported.
+author:
+    - Tomas Jelinek (@tomjelinek)
+requirements:
+    - systemd on the managed node
+    - python 3.6 or newer
+options:
+    services:
+        description: names of services without the ".service" suffix
+        type: list
+        elements: str
+        default:
+            - corosync
+            - corosync-qdevice
+            - corosync-qnetd
+            - firewalld
+            - pacemaker
+            - pcsd
+            - sbd
+"""
+
+EXAMPLES = r"""
+- name: Get status of cluster services
+  ha_cluster_service_status:
+  register: service_status
+
+- name: Print whether pacemaker is running
+  debug:
+    msg: "{{ service_status.services.pacemaker.running }}"
+"""
+
+RETURN = r"""
+services:
+    description: >
+        Status of each specified service: 'installed' (unit file exists and
+        is not masked), 'running', 'enabled' (as reported by systemctl
+        is-enabled) and raw systemd properties 'load_state', 'active_state'
+        and 'unit_file_state'
+    type: dict
+    returned: success
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from ansible.module_utils.basic import AnsibleModule
+
+# pylint: disable=no-name-in-module
+from ansible.module_utils.ha_cluster_lsr.info import loader
+
+
+def run_module() -> None:
+    """
+    Top level module function
+    """
+    module_args = dict(
+        services=dict(
+            type="list",
+            elements="str",
+            default=[
+                "corosync",
+                "corosync-qdevice",
+                "corosync-qnetd",
+                "firewalld",
+                "pacemaker",
+                "pcsd",
+                "sbd",
+            ],
+        ),
+    )
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+
+    def runner(
+        args: List[str], environ_update: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, str, str]:
+        return module.run_command(
+            args, check_rc=False, environ_update=environ_update
+        )
+
+    services = loader.get_services_status(runner, module.params["services"])
+    if services is None:
+        module.fail_json(msg="Unable to get status of services from systemd")
+    module.exit_json(changed=False, services=services)
+
+
+def main() -> None:
+    """
+    Entry point
+    """
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# make ansible-test happy, even though the module requires Python 3
+from __future__ import absolute_import, division, print_function
+
+# make ansible-test happy, even though the module requires Python 3
+# pylint: disable=invalid-name
+__metaclass__ = type
+# pylint: enable=invalid-name
+
+DOCUMENTATION = r"""
+---
+module: ha_cluster_transition_summary
+short_description: Estimate a cluster transition caused by a new CIB
+description: >
+    This module simulates the transition pacemaker would schedule if a new CIB
+    was pushed to the cluster. The configuration section is taken from the
+    specified CIB file, the status section is taken from the live cluster. The
+    module reports how many resources would be started, stopped, migrated,
+    promoted and demoted. It does not modify the cluster. Check mode is
+    supported.
+author:
+    - Tomas Jelinek (@tomjelinek)
+requirements:
+    - pacemaker (cibadmin, crm_simulate) installed on managed nodes
+    - python 3.6 or newer
+options:
+    cib_file:
+        description: path to a file with the new CIB
+        required: true
+        type: path
+"""
+
+EXAMPLES = r"""
+- name: Estimate the transition
+  ha_cluster_transition_summary:
+    cib_file: /tmp/new_cib.xml
+  register: transition
+"""
+
+RETURN = r"""
+actions:
+    description: Number of scheduled actions of each monitored type
+    type: dict
+    returned: success
+    contains:
+        start:
+            description: Number of resource start actions
+            type: int
+        stop:
+            description: Number of resource stop actions
+            type: int
+        migrate:
+            description: Number of resource live migrations
+            type: int
+        promote:
+            description: Number of resource promote actions
+            type: int
+        demote:
+            description: Number of resource demote actions
+            type: int
+total:
+    description: Total number of the monitored scheduled actions
+    type: int
+    returned: success
+details:
+    description: >
+        Scheduled monitored actions in a form of 'action resource node', sorted
+    type: list
+    elements: str
+    returned: success
+"""
+
+import os
+import shutil
+import tempfile
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional
+
+from ansible.module_utils.basic import AnsibleModule
+
+# Pacemaker operations reported by the module. A live migration consists of
+# migrate_to and migrate_from operations, only migrate_to is counted to report
+# each migration once.
+_OPERATION_TO_ACTION = {
+    "start": "start",
+    "stop": "stop",
+    "migrate_to": "migrate",
+    "promote": "promote",
+    "demote": "demote",
+}
+ACTIONS = ("start", "stop", "migrate", "promote", "demote")
+
+
+class TransitionError(Exception):
+    """
+    Unable to simulate a transition
+    """
+
+    def __init__(self, msg: str, **kwargs: Optional[str]):
+        super().__init__(msg)
+        self.msg = msg
+        self.kwargs = kwargs
+
+
+def merge_live_status(cib_xml: str, status_xml: str) -> str:
+    """
+    Replace the status section of a CIB with the live cluster status
+
+    cib_xml -- new CIB
+    status_xml -- status section of the live CIB
+    """
+    try:
+        cib = ET.fromstring(cib_xml)
+        status = ET.fromstring(status_xml)
+    except ET.ParseError as e:
+        raise TransitionError(f"Unable to parse CIB: {e}") from e
+
+    for old_status in cib.findall("status"):
+        cib.remove(old_status)
+    cib.append(status)
+
+    return ET.tostring(cib, encoding="unicode")
+
+
+def summarize_graph(graph_xml: str) -> Dict[str, object]:
+    """
+    Count monitored actions in a transition graph saved by crm_simulate
+    """
+    try:
+        graph = ET.fromstring(graph_xml)
+    except ET.ParseError as e:
+        raise TransitionError(f"Unable to parse transition graph: {e}") from e
+
+    counts = {action: 0 for action in ACTIONS}
+    details: List[str] = []
+    for rsc_op in graph.iterfind("./synapse/action_set/rsc_op"):
+        action = _OPERATION_TO_ACTION.get(rsc_op.get("operation", ""))
+        if action is None:
+            continue
+        primitive = rsc_op.find("primitive")
+        resource = (
+            primitive.get("id", "") if primitive is not None else ""
+        ) or rsc_op.get("operation_key", "")
+        counts[action] += 1
+        details.append(f"{action} {resource} {rsc_op.get('on_node', '')}")
+
+    return dict(
+        actions=counts,
+        total=sum(counts.values()),
+        details=sorted(details),
+    )
+
+
+def _run(module: AnsibleModule, cmd: List[str]) -> str:
+    """
+    Run a pacemaker command, raise TransitionError on failure
+    """
+    rc, stdout, stderr = module.run_command(
+        cmd, environ_update={"LC_ALL": "C"}, check_rc=False
+    )
+    if rc != 0:
+        raise TransitionError(
+            f"Command '{' '.join(cmd)}' failed",
+            rc=str(rc),
+            stdout=stdout,
+            stderr=stderr,
+        )
+    return stdout
+
+
+def simulate(module: AnsibleModule, cib_file: str) -> Dict[str, object]:
+    """
+    Simulate the transition of the live cluster to the new CIB
+    """
+    try:
+        with open(cib_file, encoding="utf-8") as cib_fd:
+            cib_xml = cib_fd.read()
+    except OSError as e:
+        raise TransitionError(f"Unable to read '{cib_file}': {e}") from e
+
+    status_xml = _run(module, ["cibadmin", "--query", "--scope", "status"])
+
+    workdir = tempfile.mkdtemp(prefix="ha_cluster_transition_")
+    try:
+        sim_cib_path = os.path.join(workdir, "cib.xml")
+        graph_path = os.path.join(workdir, "graph.xml")
+        with open(sim_cib_path, "w", encoding="utf-8") as sim_cib_fd:
+            sim_cib_fd.write(merge_live_status(cib_xml, status_xml))
+        _run(
+            module,
+            [
+                "crm_simulate",
+                "--simulate",
+                "--xml-file",
+                sim_cib_path,
+                "--save-graph",
+                graph_path,
+            ],
+        )
+        with open(graph_path, encoding="utf-8") as graph_fd:
+            return summarize_graph(graph_fd.read())
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def run_module() -> None:
+    """
+    Top level module function
+    """
+    module_args = dict(
+        cib_file=dict(type="path", required=True),
+    )
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+
+    try:
+        summary = simulate(module, module.params["cib_file"])
+    except TransitionError as e:
+        module.fail_json(msg=e.msg, **e.kwargs)
+    module.exit_json(changed=False, **summary)
+
+
+def main() -> None:
+    """
+    Entry point
+    """
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
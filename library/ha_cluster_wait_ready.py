@@ -0,0 +1,255 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# make ansible-test happy, even though the module requires Python 3
+from __future__ import absolute_import, division, print_function
+
+# make ansible-test happy, even though the module requires Python 3
+# pylint: disable=invalid-name
+__metaclass__ = type
+# pylint: enable=invalid-name
+
+DOCUMENTATION = r"""
+---
+module: ha_cluster_wait_ready
+short_description: Wait for a cluster to start
+description: >
+    This module waits for corosync to become quorate, pacemaker to elect
+    a designated controller (DC) and all specified nodes to be online in
+    pacemaker. It reports how long it took to reach each of the stages. If
+    the cluster does not start in time, the module fails and reports which
+    stage has not been reached and which nodes are lagging. The module does
+    not modify the node. Check mode is supported.
+author:
+    - Tomas Jelinek (@tomjelinek)
+requirements:
+    - corosync and pacemaker running on the managed node
+    - python 3.6 or newer
+options:
+    nodes:
+        description: names of nodes expected to be online
+        required: true
+        type: list
+        elements: str
+    timeout:
+        description: seconds to wait for the cluster to start
+        type: int
+        default: 600
+"""
+
+EXAMPLES = r"""
+- name: Wait for the cluster to start
+  ha_cluster_wait_ready:
+    nodes:
+      - node1
+      - node2
+  register: cluster_ready
+"""
+
+RETURN = r"""
+started:
+    description: time the waiting started, in ISO 8601 format
+    type: str
+    returned: always
+timings:
+    description: >
+        Seconds since the waiting started to reaching each stage: corosync
+        became 'quorate', pacemaker elected a DC, 'dc_elected', and all nodes
+        are online in pacemaker, 'nodes_online'. Stages not reached are
+        missing.
+    type: dict
+    returned: always
+lagging_nodes:
+    description: nodes which have not reached the last stage in time
+    type: list
+    elements: str
+    returned: failure
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Tuple
+from xml.etree import ElementTree
+
+from ansible.module_utils.basic import AnsibleModule
+
+# Cluster start is polled with a short interval at first, the interval grows
+# up to the maximum while waiting for slower stages.
+MIN_POLL_INTERVAL = 0.25
+MAX_POLL_INTERVAL = 2.0
+POLL_INTERVAL_FACTOR = 1.5
+
+STAGES = ("quorate", "dc_elected", "nodes_online")
+
+
+def parse_quorum_status(output: str) -> Tuple[bool, List[str]]:
+    """
+    Get quorum state and names of member nodes from corosync-quorumtool -s
+    """
+    quorate = False
+    members: List[str] = []
+    in_membership = False
+    for line in output.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("Quorate:"):
+            quorate = stripped.split(":", 1)[1].strip() == "Yes"
+        elif stripped == "Membership information":
+            in_membership = True
+        elif in_membership:
+            parts = stripped.split()
+            if parts and parts[-1] == "(local)":
+                parts = parts[:-1]
+            # Nodeid Votes [Qdevice] Name, qdevice itself is listed with
+            # nodeid 0
+            if (
+                len(parts) >= 3
+                and parts[0].isdigit()
+                and parts[1].isdigit()
+                and int(parts[0]) != 0
+            ):
+                members.append(parts[-1])
+    return quorate, members
+
+
+def parse_pacemaker_status(status_xml: str) -> Tuple[bool, List[str]]:
+    """
+    Get DC presence and names of online nodes from crm_mon XML output
+    """
+    dom = ElementTree.fromstring(status_xml)
+    current_dc = dom.find("./summary/current_dc")
+    dc_elected = (
+        current_dc is not None and current_dc.get("present", "") == "true"
+    )
+    online = [
+        str(node.get("name"))
+        for node in dom.iterfind("./nodes/node")
+        if node.get("online", "") == "true"
+    ]
+    return dc_elected, online
+
+
+class ClusterProbe:
+    """
+    Read cluster state using corosync and pacemaker tools
+    """
+
+    def __init__(self, module: AnsibleModule):
+        self._module = module
+
+    def _run(self, cmd: List[str]) -> str:
+        # Both tools return non-zero codes while the cluster is starting,
+        # their output is checked instead
+        # wokeignore:rule=dummy
+        dummy_rc, stdout, dummy_stderr = self._module.run_command(
+            cmd, environ_update={"LC_ALL": "C"}, check_rc=False
+        )
+        return stdout
+
+    def quorum(self) -> Tuple[bool, List[str]]:
+        """
+        Get corosync quorum state and membership
+        """
+        output = self._run(["corosync-quorumtool", "-s"])
+        return parse_quorum_status(output) if output else (False, [])
+
+    def pacemaker(self) -> Tuple[bool, List[str]]:
+        """
+        Get pacemaker DC presence and online nodes
+        """
+        output = self._run(["crm_mon", "--one-shot", "--output-as=xml"])
+        if not output:
+            return False, []
+        try:
+            return parse_pacemaker_status(output)
+        except ElementTree.ParseError:
+            return False, []
+
+
+def wait_ready(
+    probe: ClusterProbe,
+    nodes: List[str],
+    timeout: float,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Tuple[Dict[str, float], List[str]]:
+    """
+    Wait for the cluster to start, return times of reached stages and nodes
+    lagging in the first stage not reached
+    """
+    start = clock()
+    timings: Dict[str, float] = {}
+    lagging: List[str] = list(nodes)
+    interval = MIN_POLL_INTERVAL
+    while True:
+        stage_reached = False
+        if "quorate" not in timings:
+            quorate, members = probe.quorum()
+            lagging = [node for node in nodes if node not in members]
+            if quorate:
+                timings["quorate"] = round(clock() - start, 2)
+                stage_reached = True
+        if "quorate" in timings:
+            dc_elected, online = probe.pacemaker()
+            if "dc_elected" not in timings:
+                lagging = [node for node in nodes if node not in online]
+                if dc_elected:
+                    timings["dc_elected"] = round(clock() - start, 2)
+                    stage_reached = True
+            if "dc_elected" in timings:
+                lagging = [node for node in nodes if node not in online]
+                if not lagging:
+                    timings["nodes_online"] = round(clock() - start, 2)
+                    return timings, []
+        if clock() - start >= timeout:
+            return timings, lagging
+        # Poll quickly again when the cluster is making progress
+        interval = (
+            MIN_POLL_INTERVAL
+            if stage_reached
+            else min(interval * POLL_INTERVAL_FACTOR, MAX_POLL_INTERVAL)
+        )
+        sleep(min(interval, max(0.0, timeout - (clock() - start))))
+
+
+def run_module() -> None:
+    """
+    Top level module function
+    """
+    module_args = dict(
+        nodes=dict(type="list", elements="str", required=True),
+        timeout=dict(type="int", default=600),
+    )
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+
+    started = datetime.now(timezone.utc).isoformat(timespec="microseconds")
+    timings, lagging = wait_ready(
+        ClusterProbe(module), module.params["nodes"], module.params["timeout"]
+    )
+    result = dict(changed=False, started=started, timings=timings)
+    if lagging or len(timings) < len(STAGES):
+        stage = next(stage for stage in STAGES if stage not in timings)
+        module.fail_json(
+            msg=(
+                f"Cluster did not start in {module.params['timeout']} seconds, "
+                f"stage '{stage}' has not been reached, lagging nodes: "
+                f"{', '.join(lagging) or 'unknown'}"
+            ),
+            lagging_nodes=lagging,
+            **result,
+        )
+    module.exit_json(**result)
+
+
+def main() -> None:
+    """
+    Entry point
+    """
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
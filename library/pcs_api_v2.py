@@ -20,9 +20,12 @@ short_description: Exposes pcs API v2 to manage HA Cluster
 description: >
     WARNING: Do not use this module directly. It is meant for role internal
     use. The module directly exposes pcs API v2 so that it is possible to use
-    the API to manage HA Clusters. Since the API doesn't support check mode,
-    the module doesn't support it either. It is the responsibility of the
-    module user to set check mode options for all tasks using this module.
+    the API to manage HA Clusters. Either one command or a list of commands
+    can be specified. The list of commands is run over a single connection to
+    pcsd, in sequence or as asynchronous tasks running at the same time.
+    Since the API doesn't support check mode, the module doesn't support it
+    either. It is the responsibility of the module user to set check mode
+    options for all tasks using this module.
 author:
     - Tomas Jelinek (@tomjelinek)
 requirements:
@@ -30,15 +33,48 @@ requirements:
     - python 3.9 or newer (it is a dependency of pcs anyway)
 options:
     cmd_name:
-        description: pcs API v2 command name
-        required: true
+        description: >
+            pcs API v2 command name, mutually exclusive with commands
         type: str
     cmd_params:
         description: parameters of the command specified in cmd_name
         type: dict
         default: {}
+    commands:
+        description: >
+            list of pcs API v2 commands to run in sequence, mutually exclusive
+            with cmd_name
+        type: list
+        elements: dict
+        suboptions:
+            cmd_name:
+                description: pcs API v2 command name
+                required: true
+                type: str
+            cmd_params:
+                description: parameters of the command
+                type: dict
+                default: {}
+    stop_on_error:
+        description: >
+            do not run remaining commands from the commands list once
+            a command fails
+        type: bool
+        default: true
+    max_parallel:
+        description: >
+            maximal number of commands from the commands list running at the
+            same time, the commands must not depend on each other if set to
+            more than 1, must be at least 1
+        type: int
+        default: 1
+    task_timeout:
+        description: >
+            seconds after which a command from the commands list is killed if
+            it is still running
+        type: int
     cmd_options:
-        description: generic command options
+        description: generic command options, applied to all commands
         type: dict
         default: {}
         suboptions:
@@ -64,6 +100,20 @@ EXAMPLES = r"""
   check_mode: false
   changed_when: false
   register: __ha_cluster_qdevice_certs
+
+- name: Create resources
+  pcs_api_v2:
+    commands:
+      - cmd_name: resource.create
+        cmd_params:
+          resource_id: vip
+          resource_agent_name: ocf:heartbeat:IPaddr2
+          instance_attributes:
+            ip: 192.168.1.100
+      - cmd_name: resource.create
+        cmd_params:
+          resource_id: web
+          resource_agent_name: systemd:httpd
 """
 
 RETURN = r"""
@@ -114,10 +164,33 @@ pcs_result:
             description: Denotes why the command was killed, if that happened.
             type: str
             returned: when the command is valid and accepted by API
+pcs_results:
+    description: Results of commands specified in the commands list
+    type: list
+    elements: dict
+    returned: when commands are specified
+    contains:
+        cmd_name:
+            description: pcs API v2 command name
+            type: str
+        status:
+            description: >
+                'success', 'failed' or 'skipped' if the command has not been
+                run due to a previous command failure
+            type: str
+        msg:
+            description: error message of a failed command
+            type: str
+            returned: when the command failed
+        pcs_result:
+            description: >
+                Result of the pcs API call, same structure as pcs_result
+            type: dict
+            returned: when the command is valid and accepted by API
 """
 
 import traceback
-from typing import Optional
+from typing import Any, Optional
 
 from ansible.module_utils.basic import AnsibleModule
 
@@ -154,13 +227,42 @@ def run_module() -> None:
     Top level module function
     """
     module_args = dict(
-        cmd_name=dict(type="str", required=True),
+        cmd_name=dict(type="str"),
         cmd_params=dict(type="dict", default=dict()),
+        commands=dict(
+            type="list",
+            elements="dict",
+            options=dict(
+                cmd_name=dict(type="str", required=True),
+                cmd_params=dict(type="dict", default=dict()),
+            ),
+        ),
+        stop_on_error=dict(type="bool", default=True),
+        max_parallel=dict(type="int", default=1),
+        task_timeout=dict(type="int"),
         # 'options' has a specific meaning, so we cannot use that name and we
         # need to diverge from CommandDto
         cmd_options=api_utils.cmd_options_params_definition(),
     )
-    module = AnsibleModule(argument_spec=module_args, supports_check_mode=False)
+    module = AnsibleModule(
+        argument_spec=module_args,
+        mutually_exclusive=[("cmd_name", "commands")],
+        required_one_of=[("cmd_name", "commands")],
+        supports_check_mode=False,
+    )
+    if module.params["max_parallel"] < 1:
+        module.fail_json(msg="max_parallel must be at least 1")
+        return
+    if module.params["commands"] is not None:
+        pcs_batch(
+            module,
+            module.params["commands"],
+            api_utils.get_command_options_dto(module),
+            module.params["stop_on_error"],
+            module.params["max_parallel"],
+            module.params["task_timeout"],
+        )
+        return
     command_name = module.params["cmd_name"]
     command_params = module.params.get("cmd_params", dict())
     pcs(
@@ -182,14 +284,14 @@ def pcs(
     """
     api_command = CommandDto(command_name, command_params, command_options)
     try:
-        api_result_dto = api_utils.call_api(module, api_command)
+        api_result = api_utils.call_api(module, api_command)
         return module.exit_json(
             # This is a generic gateway to the pcs API. It doesn't know what
             # the called command does. To be on the safe side, it always
             # returns changed = True. If a read-only command is called using
             # this module, specify changed_when in the ansible task.
             changed=True,
-            pcs_result=api_utils.api_result_to_dict(api_result_dto),
+            pcs_result=api_result.to_dict(),
         )
     except api_utils.TaskFailedError as exc:
         return module.fail_json(
@@ -199,6 +301,71 @@ def pcs(
         return module.fail_json(msg=exc.msg)
 
 
+def pcs_batch(
+    module: AnsibleModule,
+    commands: list[dict[str, Any]],
+    command_options: CommandOptionsDto,
+    stop_on_error: bool,
+    max_parallel: int = 1,
+    task_timeout: Optional[int] = None,
+) -> None:
+    """
+    Run pcs api commands over one connection
+
+    Commands are run in sequence, unless running several of them at once or
+    a timeout is requested. In that case, they are run as asynchronous tasks.
+    """
+    # pylint: disable=too-many-arguments
+    api_commands = [
+        CommandDto(command["cmd_name"], command["cmd_params"], command_options)
+        for command in commands
+    ]
+    with api_utils.ApiConnection(module) as connection:
+        if max_parallel > 1 or task_timeout is not None:
+            outcomes = api_utils.run_tasks(
+                connection,
+                api_commands,
+                stop_on_error,
+                max_parallel,
+                task_timeout,
+            )
+        else:
+            outcomes = api_utils.run_commands(
+                connection, api_commands, stop_on_error
+            )
+
+    results: list[dict[str, Any]] = []
+    failed = 0
+    for command, outcome in zip(commands, outcomes):
+        result: dict[str, Any] = dict(cmd_name=command["cmd_name"])
+        if outcome is None:
+            result["status"] = "skipped"
+        elif isinstance(outcome, api_utils.TaskFailedError):
+            failed += 1
+            result.update(
+                status="failed", msg=outcome.msg, pcs_result=outcome.api_result
+            )
+        elif isinstance(outcome, api_utils.ApiError):
+            failed += 1
+            result.update(status="failed", msg=outcome.msg)
+        else:
+            result.update(
+                status="success",
+                pcs_result=outcome.to_dict(),
+            )
+        results.append(result)
+
+    # See pcs() for why changed is always True when a command has been run
+    changed = any(result["status"] != "skipped" for result in results)
+    if failed:
+        return module.fail_json(
+            msg=f"{failed} of {len(commands)} commands failed",
+            changed=changed,
+            pcs_results=results,
+        )
+    return module.exit_json(changed=changed, pcs_results=results)
+
+
 def main() -> None:
     """
     Entry point
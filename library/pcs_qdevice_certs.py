@@ -19,7 +19,11 @@ module: pcs_qdevice_certs
 short_description: Setup qdevice certificates on a node
 description: >
     This module sets up qdevice certificates for a given qnetd host and cluster
-    name on a cluster node. Check mode is supported.
+    name on a cluster node. Certificates are checked first and only set up if
+    they are missing, both using one connection to pcsd. Several pairs of
+    qnetd hosts and cluster names can be specified, they are processed one
+    after another, as they share the certificate database of the node. Check
+    mode is supported.
 author:
     - Tomas Jelinek (@tomjelinek)
 requirements:
@@ -27,13 +31,29 @@ requirements:
     - python 3.9 or newer (it is a dependency of pcs anyway)
 options:
     qnetd_host:
-        description: address of a qnetd host
-        required: true
+        description: >
+            address of a qnetd host, required unless clusters are specified
         type: str
     cluster_name:
-        description: name of the cluster the node belongs to
-        required: true
+        description: >
+            name of the cluster the node belongs to, required unless clusters
+            are specified
         type: str
+    clusters:
+        description: >
+            list of qnetd hosts and cluster names to set up certificates for,
+            mutually exclusive with qnetd_host and cluster_name
+        type: list
+        elements: dict
+        suboptions:
+            qnetd_host:
+                description: address of a qnetd host
+                required: true
+                type: str
+            cluster_name:
+                description: name of the cluster
+                required: true
+                type: str
     cmd_options:
         description: pcs API v2 command options
         type: dict
@@ -56,13 +76,31 @@ EXAMPLES = r"""
   pcs_qdevice_certs:
     qnetd_host: qnetd-node
     cluster_name: my-cluster
+
+- name: Configure qdevice certificates for several clusters
+  pcs_qdevice_certs:
+    clusters:
+      - qnetd_host: qnetd-node
+        cluster_name: my-cluster
+      - qnetd_host: qnetd-node
+        cluster_name: other-cluster
 """
 
 RETURN = r"""
+results:
+    description: >
+        Results for each item of clusters, keys 'qnetd_host', 'cluster_name',
+        'changed', 'failed', 'msg' when failed and 'pcs_result' with the same
+        structure as the pcs_result return value
+    type: list
+    elements: dict
+    returned: when clusters are specified
 pcs_result:
     description: Result of the pcs API call
     type: dict
-    returned: when the command is valid and accepted by API
+    returned: >
+        when the command is valid and accepted by API and clusters are not
+        specified
     contains:
         task_ident:
             description: Pcs internal task ID, for debugging purposes.
@@ -109,7 +147,7 @@ pcs_result:
 """
 
 import traceback
-from typing import Optional
+from typing import Any, Optional
 
 from ansible.module_utils.basic import AnsibleModule
 
@@ -146,12 +184,42 @@ def run_module() -> None:
     Top level module function
     """
     module_args = dict(
-        qnetd_host=dict(type="str", required=True),
-        cluster_name=dict(type="str", required=True),
+        qnetd_host=dict(type="str"),
+        cluster_name=dict(type="str"),
+        clusters=dict(
+            type="list",
+            elements="dict",
+            options=dict(
+                qnetd_host=dict(type="str", required=True),
+                cluster_name=dict(type="str", required=True),
+            ),
+        ),
         cmd_options=api_utils.cmd_options_params_definition(),
     )
-    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+    module = AnsibleModule(
+        argument_spec=module_args,
+        mutually_exclusive=[
+            ("clusters", "qnetd_host"),
+            ("clusters", "cluster_name"),
+        ],
+        required_together=[("qnetd_host", "cluster_name")],
+        required_one_of=[("clusters", "cluster_name")],
+        supports_check_mode=True,
+    )
 
+    if module.params["clusters"] is not None:
+        pcs_clusters(
+            module,
+            [
+                dict(
+                    qnetd_host=cluster["qnetd_host"],
+                    cluster_name=cluster["cluster_name"],
+                )
+                for cluster in module.params["clusters"]
+            ],
+            api_utils.get_command_options_dto(module),
+        )
+        return
     command_params = dict(
         qnetd_host=module.params["qnetd_host"],
         cluster_name=module.params["cluster_name"],
@@ -159,56 +227,91 @@ def run_module() -> None:
     pcs(module, command_params, api_utils.get_command_options_dto(module))
 
 
-def pcs(
+def check_and_setup(
     module: AnsibleModule,
     command_params: api_utils.CommandParams,
     command_options: CommandOptionsDto,
-) -> None:
+) -> dict[str, Any]:
     """
-    Use pcs api to configure qdevice certificates
+    Check qdevice certificates and set them up if they are missing
+
+    Return changed, pcs_result of the last command run and msg on error
     """
-    # pylint: disable= too-many-return-statements
     check_command = CommandDto(
         command_name="quorum.device_net_certificate_check_local",
         params=command_params,
         options=command_options,
     )
-    try:
-        check_response = api_utils.call_api(module, check_command)
-        if check_response.result is True:
-            return module.exit_json(
-                changed=False,
-                pcs_result=api_utils.api_result_to_dict(check_response),
-            )
-        if module.check_mode:
-            return module.exit_json(
-                changed=True,
-                pcs_result=api_utils.api_result_to_dict(check_response),
-            )
-    except api_utils.TaskFailedError as exc:
-        return module.fail_json(
-            msg=exc.msg, changed=False, pcs_result=exc.api_result
-        )
-    except api_utils.ApiError as exc:
-        return module.fail_json(msg=exc.msg)
-
     setup_command = CommandDto(
         command_name="quorum.device_net_certificate_setup_local",
         params=command_params,
         options=command_options,
     )
-    try:
-        setup_response = api_utils.call_api(module, setup_command)
-        return module.exit_json(
-            changed=True,
-            pcs_result=api_utils.api_result_to_dict(setup_response),
-        )
-    except api_utils.TaskFailedError as exc:
+    changed = False
+    with api_utils.ApiConnection(module) as connection:
+        try:
+            check_response = connection.call_api(check_command)
+            if check_response.result is True or module.check_mode:
+                return dict(
+                    changed=check_response.result is not True,
+                    pcs_result=check_response.to_dict(),
+                )
+            changed = True
+            setup_response = connection.call_api(setup_command)
+            return dict(changed=True, pcs_result=setup_response.to_dict())
+        except api_utils.TaskFailedError as exc:
+            return dict(changed=changed, msg=exc.msg, pcs_result=exc.api_result)
+        except api_utils.ApiError as exc:
+            return dict(changed=changed, msg=exc.msg)
+
+
+def pcs(
+    module: AnsibleModule,
+    command_params: api_utils.CommandParams,
+    command_options: CommandOptionsDto,
+) -> None:
+    """
+    Use pcs api to configure qdevice certificates
+    """
+    result = check_and_setup(module, command_params, command_options)
+    if "msg" in result:
+        if "pcs_result" not in result:
+            return module.fail_json(msg=result["msg"])
+        return module.fail_json(**result)
+    return module.exit_json(**result)
+
+
+def pcs_clusters(
+    module: AnsibleModule,
+    clusters: list[dict[str, str]],
+    command_options: CommandOptionsDto,
+) -> None:
+    """
+    Use pcs api to configure qdevice certificates for several clusters
+    """
+    # All clusters share the qdevice certificate database of the local node,
+    # setting up certificates for several clusters at once would make them
+    # overwrite each other's changes
+    cluster_results = [
+        check_and_setup(module, params, command_options) for params in clusters
+    ]
+
+    results = [
+        dict(**params, failed="msg" in result, **result)
+        for params, result in zip(clusters, cluster_results)
+    ]
+    changed = any(result["changed"] for result in results)
+    failed = [result for result in results if result["failed"]]
+    if failed:
         return module.fail_json(
-            msg=exc.msg, changed=True, pcs_result=exc.api_result
+            msg=(
+                "Unable to set up qdevice certificates for clusters: "
+                + ", ".join(result["cluster_name"] for result in failed)
+            ),
+            changed=changed,
+            results=results,
         )
-    except api_utils.ApiError as exc:
-        return module.fail_json(msg=exc.msg)
+    return module.exit_json(changed=changed, results=results)
 
 
 def main() -> None:
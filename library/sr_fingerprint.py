@@ -18,6 +18,9 @@ description:
       pass C(role_name), C(role_path), C(ansible_play_hosts_all),
       C(distribution), and C(distribution_version) from the task.
     - C(ansible_check_mode) is collected from the module execution context.
+    - The C(begin) record starts a role run identified by C(run_id). Its start
+      time is kept in a node-local state file, the C(success) record then
+      contains the C(run_id) and the C(duration_seconds) of the run.
     - Intended for role-internal or diagnostic use.
 author: Rich Megginson (@richm)
 options:
@@ -28,6 +31,18 @@ options:
         choices:
             - begin
             - success
+    phases:
+        description: >-
+            Seconds since the role started at which role phases finished,
+            keyed by phase names. Included in the C(success) record.
+        type: dict
+        default: {}
+    state_dir:
+        description: >-
+            Directory of node-local state files keeping start times of role
+            runs between the C(begin) and C(success) records.
+        type: path
+        default: /run/sysroles
     write_log_file:
         description: >-
             If C(true), append fingerprint data to the JSONL log file.
@@ -37,16 +52,29 @@ options:
     log_file:
         description: >-
             Path to the JSONL log file. A lock sidecar (C(<log_file>.lock))
-            is created next to the log file for cross-process safety.
+            is created next to the log file for cross-process safety when
+            the log file is trimmed or rotated.
         type: path
         default: /var/log/sysroles.jsonl
     max_log_size:
         description: >-
             Maximum log file size in bytes. When appending a new record
-            would exceed this limit, the oldest records are removed first.
-            Set to C(0) to disable trimming.
+            would exceed this limit, the oldest records are removed first,
+            so that the file shrinks to 75% of this limit. Set to C(0) to
+            disable trimming.
         type: int
         default: 2000000
+    log_segments:
+        description: >-
+            Number of rotated log files to keep. If set to a positive number,
+            a log file which would exceed C(max_log_size) is renamed to
+            C(<log_file>.1) instead of being trimmed, C(<log_file>.1) to
+            C(<log_file>.2) and so on, and the oldest segment is removed.
+            Reading the segments from the highest number to C(<log_file>)
+            gives the complete history. Set to C(0) to trim the log file
+            instead.
+        type: int
+        default: 0
     role_name:
         description: Name of the role, typically C({{ role_name }}).
         type: str
@@ -112,6 +140,11 @@ fingerprint:
         managed_node_distro: RedHat-9.4
         play_hosts_number: 3
         ansible_check_mode: false
+        run_id: 0b4a8f5e-5c1d-4d5e-9b8a-2f6c1e7d3a90
+        duration_seconds: 95.52
+        phases:
+            package_install: 20.13
+            cluster_setup: 71.4
 message:
     description: Informational message shown in check mode.
     returned: check mode
@@ -134,8 +167,11 @@ import errno
 import fcntl
 import json
 import os
+import select
 import stat
 import tempfile
+import time
+import uuid
 
 FINGERPRINT_FIELDS = (
     "date",
@@ -148,16 +184,30 @@ FINGERPRINT_FIELDS = (
     "ansible_check_mode",
 )
 
+# Fields linking begin and success records of a role run, present only when
+# the run state is available.
+FINGERPRINT_RUN_FIELDS = (
+    "run_id",
+    "duration_seconds",
+    "phases",
+)
+
 FINGERPRINT_SYSLOG_SEPARATOR = " "
 
+# When the log file exceeds max_log_size, it is trimmed to this fraction of
+# max_log_size.
+LOG_TRIM_RATIO = 0.75
+LOG_CHUNK_SIZE = 65536
+# Appends up to this size are atomic, records are appended without the lock
+# sidecar if they fit.
+LOG_ATOMIC_WRITE_SIZE = getattr(select, "PIPE_BUF", 512)
+
 
 def _local_iso8601_no_microseconds():
     """System local wall clock with local tz offset, ISO 8601, seconds only."""
     try:
         utc = datetime.timezone.utc
     except AttributeError:
-        import time
-
         return time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime())
     # Prefer the local clock interpreted in the system timezone (not UTC displayed).
     now = datetime.datetime.now()
@@ -189,40 +239,147 @@ def _format_fingerprint_jsonl(record):
     return json.dumps(record, separators=(",", ":"), sort_keys=False)
 
 
+def _find_trim_offset(log_fd, size_needed):
+    """Find the offset of the first record to keep after removing size_needed bytes.
+
+    Only the line crossing the size_needed boundary is read, in fixed-size
+    chunks, the records before it are skipped without reading them.
+    """
+    if size_needed <= 0:
+        return 0
+    offset = size_needed - 1
+    log_fd.seek(offset)
+    while True:
+        chunk = log_fd.read(LOG_CHUNK_SIZE)
+        if not chunk:
+            # the last record does not end with a newline, remove it as well
+            return offset
+        newline = chunk.find(b"\n")
+        if newline >= 0:
+            return offset + newline + 1
+        offset += len(chunk)
+
+
+def _copy_file_range(src_fd, dst_fd, offset, count):
+    """Copy count bytes starting at offset from src_fd to dst_fd."""
+    sendfile = getattr(os, "sendfile", None)
+    if sendfile is not None:
+        try:
+            while count > 0:
+                sent = sendfile(dst_fd, src_fd, offset, count)
+                if sent == 0:
+                    return
+                offset += sent
+                count -= sent
+            return
+        except OSError as exc:
+            # sendfile does not support all kinds of files, copy by chunks
+            if exc.errno not in (errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP):
+                raise
+    os.lseek(src_fd, offset, os.SEEK_SET)
+    while count > 0:
+        chunk = os.read(src_fd, min(LOG_CHUNK_SIZE, count))
+        if not chunk:
+            return
+        while chunk:
+            written = os.write(dst_fd, chunk)
+            chunk = chunk[written:]
+            count -= written
+
+
 def _trim_log_file(log_file, size_needed):
-    """Remove oldest records until the file can accommodate size_needed bytes."""
-    with open(log_file, "r") as log_fd:
-        lines = log_fd.readlines()
-    size_removed = 0
-    while lines and size_removed < size_needed:
-        size_removed += len(lines.pop(0))
-    orig_stat = os.stat(log_file)
+    """Remove oldest records until at least size_needed bytes are freed."""
     dir_name = os.path.dirname(log_file) or "."
-    fd, tmp_path = tempfile.mkstemp(dir=dir_name, suffix=".tmp")
-    try:
-        os.fchmod(fd, stat.S_IMODE(orig_stat.st_mode))
+    with open(log_file, "rb") as log_fd:
+        # Wait for appends in progress and hold off new ones, which would
+        # be lost with the file being replaced
+        fcntl.flock(log_fd, fcntl.LOCK_EX)
+        orig_stat = os.fstat(log_fd.fileno())
+        keep_offset = min(_find_trim_offset(log_fd, size_needed), orig_stat.st_size)
+        fd, tmp_path = tempfile.mkstemp(dir=dir_name, suffix=".tmp")
         try:
-            os.fchown(fd, orig_stat.st_uid, orig_stat.st_gid)
-        except OSError:
-            # not running as root; keep default ownership
-            pass
-        with os.fdopen(fd, "w") as tmp_fd:
-            tmp_fd.writelines(lines)
-            tmp_fd.flush()
-            os.fsync(tmp_fd.fileno())
-        os.rename(tmp_path, log_file)
-    except BaseException:
+            try:
+                os.fchmod(fd, stat.S_IMODE(orig_stat.st_mode))
+                try:
+                    os.fchown(fd, orig_stat.st_uid, orig_stat.st_gid)
+                except OSError:
+                    # not running as root; keep default ownership
+                    pass
+                _copy_file_range(
+                    log_fd.fileno(),
+                    fd,
+                    keep_offset,
+                    orig_stat.st_size - keep_offset,
+                )
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.rename(tmp_path, log_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                # already removed or never created
+                pass
+            raise
+
+
+def _rotate_log_file(log_file, segments):
+    """Rename log_file to log_file.1, log_file.1 to log_file.2 and so on."""
+    for index in range(segments, 0, -1):
+        src = log_file if index == 1 else "%s.%d" % (log_file, index - 1)
         try:
-            os.unlink(tmp_path)
-        except OSError:
-            # already removed or never created
-            pass
-        raise
+            # the oldest segment is replaced by the one before it
+            os.rename(src, "%s.%d" % (log_file, index))
+        except OSError as exc:
+            # fewer segments than allowed have been created so far
+            if exc.errno != errno.ENOENT:
+                raise
+
 
+def _append_jsonl_line(log_file, data, max_size):
+    """Append data to the log file unless it needs to be trimmed or rotated first.
 
-def _write_jsonl_log(log_file, record, max_size=0):
+    Return False if the data has not been appended.
+    """
+    while True:
+        fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+        try:
+            # Appends do not block each other, the shared lock only prevents
+            # a trim from replacing the file while appending.
+            fcntl.flock(fd, fcntl.LOCK_SH)
+            fd_stat = os.fstat(fd)
+            try:
+                path_stat = os.stat(log_file)
+            except OSError:
+                # the file has been rotated, open a new one
+                continue
+            if (path_stat.st_dev, path_stat.st_ino) != (
+                fd_stat.st_dev,
+                fd_stat.st_ino,
+            ):
+                # the file has been trimmed or rotated, open the new one
+                continue
+            if (
+                max_size > 0
+                and fd_stat.st_size > 0
+                and fd_stat.st_size + len(data) > max_size
+            ):
+                return False
+            os.write(fd, data)
+            return True
+        finally:
+            os.close(fd)
+
+
+def _write_jsonl_log(log_file, record, max_size=0, segments=0):
     _ensure_parent_dir(log_file)
     new_line = _format_fingerprint_jsonl(record) + "\n"
+    data = new_line.encode("utf-8")
+    if len(data) <= LOG_ATOMIC_WRITE_SIZE and _append_jsonl_line(
+        log_file, data, max_size
+    ):
+        return
     lock_path = log_file + ".lock"
     lock_fd = open(lock_path, "w")
     try:
@@ -233,7 +390,13 @@ def _write_jsonl_log(log_file, record, max_size=0):
             # file does not exist yet
             cur_size = 0
         if max_size > 0 and cur_size + len(new_line) > max_size and cur_size > 0:
-            _trim_log_file(log_file, len(new_line))
+            if segments > 0:
+                _rotate_log_file(log_file, segments)
+            else:
+                # Trim below the limit so that the following writes do not need
+                # to trim the file again
+                low_water_mark = int(max_size * LOG_TRIM_RATIO)
+                _trim_log_file(log_file, cur_size + len(new_line) - low_water_mark)
         with open(log_file, "a") as log_fd:
             log_fd.write(new_line)
     finally:
@@ -280,12 +443,49 @@ def _collect_fingerprint_record(module, status):
     }
 
 
+def _run_state_path(state_dir, role_name):
+    return os.path.join(state_dir, "%s.json" % role_name.replace(os.sep, "_"))
+
+
+def _begin_run(state_file, record):
+    """Generate a run ID and keep the start time of the run in the state file."""
+    run_id = str(uuid.uuid4())
+    _ensure_parent_dir(state_file)
+    with open(state_file, "w") as state_fd:
+        json.dump({"run_id": run_id, "start": time.time()}, state_fd)
+    record["run_id"] = run_id
+
+
+def _finish_run(state_file, record, phases):
+    """Add the run ID and duration of the run started by the begin record."""
+    try:
+        with open(state_file, "r") as state_fd:
+            state = json.load(state_fd)
+        os.unlink(state_file)
+    except (IOError, OSError, ValueError):
+        # the begin record has not been written in this run
+        return
+    if not isinstance(state, dict) or not isinstance(state.get("start"), (int, float)):
+        return
+    record["run_id"] = state.get("run_id")
+    record["duration_seconds"] = round(time.time() - state["start"], 2)
+    if phases:
+        record["phases"] = phases
+
+
 def _fingerprint_record_items(record):
-    return [(field, record[field]) for field in FINGERPRINT_FIELDS]
+    items = [(field, record[field]) for field in FINGERPRINT_FIELDS]
+    items.extend(
+        (field, record[field]) for field in FINGERPRINT_RUN_FIELDS if field in record
+    )
+    return items
 
 
 def _format_fingerprint_key_value(field, value):
-    text = "" if value is None else str(value)
+    if isinstance(value, dict):
+        text = ",".join("%s:%s" % item for item in value.items())
+    else:
+        text = "" if value is None else str(value)
     if any(char in text for char in ' "='):
         return '%s="%s"' % (field, text.replace('"', '""'))
     return "%s=%s" % (field, text)
@@ -306,8 +506,26 @@ def _handle_fingerprint(module):
         module.fail_json(
             msg="max_log_size must be 0 or a positive integer, got %d" % max_log_size
         )
+    log_segments = module.params["log_segments"]
+    if log_segments < 0:
+        module.fail_json(
+            msg="log_segments must be 0 or a positive integer, got %d" % log_segments
+        )
 
     fingerprint_record = _collect_fingerprint_record(module, module.params["status"])
+    if not module.check_mode:
+        state_file = _run_state_path(
+            module.params["state_dir"], module.params["role_name"]
+        )
+        try:
+            if module.params["status"] == "begin":
+                _begin_run(state_file, fingerprint_record)
+            else:
+                _finish_run(state_file, fingerprint_record, module.params["phases"])
+        except (IOError, OSError) as exc:
+            module.fail_json(
+                msg="Failed to write fingerprint state file %s: %s" % (state_file, exc)
+            )
     log_message = _format_fingerprint_syslog(fingerprint_record)
 
     if module.check_mode:
@@ -326,9 +544,7 @@ def _handle_fingerprint(module):
     if module.params["write_log_file"]:
         log_file = module.params["log_file"]
         try:
-            _write_jsonl_log(
-                log_file, fingerprint_record, module.params["max_log_size"]
-            )
+            _write_jsonl_log(log_file, fingerprint_record, max_log_size, log_segments)
         except (IOError, OSError) as exc:
             module.fail_json(
                 msg="Failed to write fingerprint log file %s: %s" % (log_file, exc)
@@ -343,6 +559,9 @@ def run_module():
         write_log_file=dict(type="bool", default=False),
         log_file=dict(type="path", default="/var/log/sysroles.jsonl"),
         max_log_size=dict(type="int", default=2000000),
+        log_segments=dict(type="int", default=0),
+        phases=dict(type="dict", default={}),
+        state_dir=dict(type="path", default="/run/sysroles"),
         role_name=dict(type="str", required=True),
         role_path=dict(type="path", required=True),
         ansible_play_hosts_all=dict(type="list", elements="str", required=True),
@@ -0,0 +1,707 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# make ansible-test happy, even though the module requires Python 3
+from __future__ import absolute_import, division, print_function
+
+# make ansible-test happy, even though the module requires Python 3
+# pylint: disable=invalid-name
+__metaclass__ = type
+# pylint: enable=invalid-name
+
+import ipaddress
+import re
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+# Repeated sections and the option identifying each of their instances
+SECTION_ID_OPTIONS = {
+    ("nodelist", "node"): ("nodeid", "name", "ring0_addr"),
+    ("totem", "interface"): ("linknumber", "ringnumber"),
+    ("logging", "logger_subsys"): ("subsys",),
+}
+
+
+class CorosyncConfParseError(Exception):
+    """
+    Corosync configuration cannot be parsed
+    """
+
+    def __init__(self, msg: str, line_number: int):
+        super().__init__(msg)
+        self.msg = msg
+        self.line_number = line_number
+
+
+class Section:
+    """
+    A section of a corosync configuration
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.options: List[Tuple[str, str]] = []
+        self.sections: List["Section"] = []
+
+    def add_option(self, name: str, value: Any) -> None:
+        """
+        Append an option to the section
+        """
+        self.options.append((name, str(value)))
+
+    def add_section(self, name: str) -> "Section":
+        """
+        Append a new subsection to the section and return it
+        """
+        section = Section(name)
+        self.sections.append(section)
+        return section
+
+    def get_option(self, name: str, default: str = "") -> str:
+        """
+        Get the value of the last occurrence of an option
+        """
+        for opt_name, opt_value in reversed(self.options):
+            if opt_name == name:
+                return opt_value
+        return default
+
+
+def parse(conf_text: str) -> Section:
+    """
+    Parse a corosync configuration into a tree of sections
+
+    conf_text -- content of corosync.conf
+    """
+    root = Section("")
+    stack = [root]
+    for line_number, raw_line in enumerate(conf_text.splitlines(), 1):
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.endswith("{"):
+            section = Section(line[:-1].strip())
+            stack[-1].sections.append(section)
+            stack.append(section)
+        elif line == "}":
+            if len(stack) < 2:
+                raise CorosyncConfParseError(
+                    "Unexpected closing brace", line_number
+                )
+            stack.pop()
+        elif ":" in line:
+            name, value = line.split(":", 1)
+            stack[-1].options.append((name.strip(), value.strip()))
+        else:
+            raise CorosyncConfParseError(
+                f"Unable to parse line '{line}'", line_number
+            )
+    if len(stack) > 1:
+        raise CorosyncConfParseError(
+            f"Missing closing brace of section '{stack[-1].name}'",
+            len(conf_text.splitlines()),
+        )
+    return root
+
+
+def _section_key(parent: Section, section: Section) -> str:
+    """
+    Get a key uniquely identifying a section among its siblings
+    """
+    for id_option in SECTION_ID_OPTIONS.get((parent.name, section.name), ()):
+        value = section.get_option(id_option)
+        if value:
+            return f"{section.name}[{value}]"
+    return section.name
+
+
+def flatten(root: Section) -> Dict[str, str]:
+    """
+    Transform a tree of sections to a dict of dotted option paths and values
+
+    Instances of repeated sections, such as nodes, are identified by their id
+    option, e.g. 'nodelist.node[2].ring0_addr'.
+    """
+    result: Dict[str, str] = {}
+
+    def _walk(section: Section, path: Tuple[str, ...]) -> None:
+        prefix = ".".join(path)
+        for name, value in section.options:
+            result[f"{prefix}.{name}" if prefix else name] = value
+        for subsection in section.sections:
+            _walk(subsection, path + (_section_key(section, subsection),))
+
+    _walk(root, tuple())
+    return result
+
+
+def export(root: Section) -> str:
+    """
+    Transform a tree of sections to a corosync configuration text
+    """
+    lines: List[str] = []
+
+    def _export(section: Section, level: int) -> None:
+        indent = "    " * level
+        for name, value in section.options:
+            lines.append(f"{indent}{name}: {value}")
+        for subsection in section.sections:
+            if lines and lines[-1] and not lines[-1].endswith("{"):
+                lines.append("")
+            lines.append(f"{indent}{subsection.name} {{")
+            _export(subsection, level + 1)
+            lines.append(f"{indent}}}")
+
+    _export(root, 0)
+    return "\n".join(lines) + "\n"
+
+
+def is_equivalent(conf_text1: str, conf_text2: str) -> bool:
+    """
+    Check whether two corosync configurations define the same options
+    """
+    return flatten(parse(conf_text1)) == flatten(parse(conf_text2))
+
+
+# Options accepted when building a configuration. They follow 'pcs cluster
+# setup' and 'pcs quorum device add' including their names in pcs, mapped to
+# names in corosync.conf, and values pcs allows for them.
+
+
+class ValueSpec:
+    """
+    Values allowed for an option
+    """
+
+    def __init__(self, description: str, is_valid: Callable[[str], bool]):
+        self.description = description
+        self.is_valid = is_valid
+
+
+def _one_of(*values: str) -> ValueSpec:
+    """
+    Allow listed values only
+    """
+    return ValueSpec(
+        ", ".join(f"'{value}'" for value in values),
+        lambda value: value in values,
+    )
+
+
+def _integer(low: int, high: Optional[int] = None) -> ValueSpec:
+    """
+    Allow integers in a range, the upper bound is optional
+    """
+
+    def is_valid(value: str) -> bool:
+        try:
+            number = int(value)
+        except ValueError:
+            return False
+        return low <= number and (high is None or number <= high)
+
+    if high is not None:
+        description = f"{low}..{high}"
+    elif low == 0:
+        description = "a non-negative integer"
+    else:
+        description = f"an integer greater than or equal to {low}"
+    return ValueSpec(description, is_valid)
+
+
+def _either(*specs: ValueSpec) -> ValueSpec:
+    """
+    Allow values allowed by any of the specs
+    """
+    return ValueSpec(
+        " or ".join(spec.description for spec in specs),
+        lambda value: any(spec.is_valid(value) for spec in specs),
+    )
+
+
+def _is_ip_address(value: str) -> bool:
+    """
+    Check whether a value is an IPv4 or IPv6 address
+    """
+    try:
+        ipaddress.ip_address(value)
+    except ValueError:
+        return False
+    return True
+
+
+BOOLEAN = _one_of("0", "1")
+NONNEGATIVE = _integer(0)
+POSITIVE = ValueSpec("a positive integer", _integer(1).is_valid)
+PORT = _integer(1, 65535)
+IP_ADDRESS = ValueSpec("an IP address", _is_ip_address)
+NOT_EMPTY = ValueSpec("a non-empty value", bool)
+IP_VERSION = _one_of("ipv4", "ipv6", "ipv4-6", "ipv6-4")
+
+# pcs option name: (corosync option name, allowed values)
+OptionSpecs = Mapping[str, Tuple[str, ValueSpec]]
+
+
+def _same_names(**options: ValueSpec) -> Dict[str, Tuple[str, ValueSpec]]:
+    """
+    Define options which have the same names in pcs and corosync.conf
+    """
+    return {name: (name, values) for name, values in options.items()}
+
+
+TRANSPORT_TYPES = ("knet", "udp", "udpu")
+TRANSPORT_OPTIONS: Mapping[str, OptionSpecs] = {
+    "knet": _same_names(
+        ip_version=IP_VERSION,
+        knet_pmtud_interval=NONNEGATIVE,
+        link_mode=_one_of("active", "passive", "rr"),
+    ),
+    "udp": _same_names(ip_version=IP_VERSION, netmtu=POSITIVE),
+    "udpu": _same_names(ip_version=IP_VERSION, netmtu=POSITIVE),
+}
+KNET_MAX_LINKS = 8
+KNET_LINK_OPTIONS: OptionSpecs = {
+    "linknumber": ("linknumber", _integer(0, KNET_MAX_LINKS - 1)),
+    "link_priority": ("knet_link_priority", _integer(0, 255)),
+    "mcastport": ("mcastport", PORT),
+    "ping_interval": ("knet_ping_interval", NONNEGATIVE),
+    "ping_precision": ("knet_ping_precision", NONNEGATIVE),
+    "ping_timeout": ("knet_ping_timeout", NONNEGATIVE),
+    "pong_count": ("knet_pong_count", NONNEGATIVE),
+    "transport": ("knet_transport", _one_of("sctp", "udp")),
+}
+UDP_LINK_OPTIONS = _same_names(
+    bindnetaddr=IP_ADDRESS,
+    broadcast=BOOLEAN,
+    mcastaddr=IP_ADDRESS,
+    mcastport=PORT,
+    ttl=_integer(0, 255),
+)
+COMPRESSION_OPTIONS: OptionSpecs = {
+    "level": ("knet_compression_level", NONNEGATIVE),
+    "model": ("knet_compression_model", NOT_EMPTY),
+    "threshold": ("knet_compression_threshold", NONNEGATIVE),
+}
+CRYPTO_OPTIONS: OptionSpecs = {
+    "cipher": (
+        "crypto_cipher",
+        _one_of("none", "aes256", "aes192", "aes128"),
+    ),
+    "hash": (
+        "crypto_hash",
+        _one_of("none", "md5", "sha1", "sha256", "sha384", "sha512"),
+    ),
+    "model": ("crypto_model", _one_of("nss", "openssl")),
+}
+DEFAULT_KNET_CRYPTO = (("crypto_cipher", "aes256"), ("crypto_hash", "sha256"))
+TOTEM_OPTIONS = _same_names(
+    block_unlisted_ips=_one_of("yes", "no"),
+    consensus=NONNEGATIVE,
+    downcheck=NONNEGATIVE,
+    fail_recv_const=NONNEGATIVE,
+    heartbeat_failures_allowed=NONNEGATIVE,
+    hold=NONNEGATIVE,
+    join=NONNEGATIVE,
+    max_messages=NONNEGATIVE,
+    max_network_delay=NONNEGATIVE,
+    merge=NONNEGATIVE,
+    miss_count_const=NONNEGATIVE,
+    send_join=NONNEGATIVE,
+    seqno_unchanged_const=NONNEGATIVE,
+    token=NONNEGATIVE,
+    token_coefficient=NONNEGATIVE,
+    token_retransmit=NONNEGATIVE,
+    token_retransmits_before_loss_const=NONNEGATIVE,
+    window_size=NONNEGATIVE,
+)
+QUORUM_OPTIONS = _same_names(
+    auto_tie_breaker=BOOLEAN,
+    last_man_standing=BOOLEAN,
+    last_man_standing_window=POSITIVE,
+    wait_for_all=BOOLEAN,
+)
+# 'pcs quorum device add' removes these quorum options
+QDEVICE_INCOMPATIBLE_QUORUM_OPTIONS = (
+    "allow_downscale",
+    "auto_tie_breaker",
+    "last_man_standing",
+    "last_man_standing_window",
+)
+QDEVICE_GENERIC_OPTIONS = _same_names(sync_timeout=POSITIVE, timeout=POSITIVE)
+QDEVICE_MODEL_OPTIONS: Mapping[str, OptionSpecs] = {
+    "net": _same_names(
+        algorithm=_one_of("ffsplit", "lms"),
+        connect_timeout=_integer(1000, 120000),
+        force_ip_version=_one_of("0", "4", "6"),
+        host=NOT_EMPTY,
+        keep_active_partition_tie_breaker=_one_of("on", "off"),
+        port=PORT,
+        tls=_one_of("on", "off", "required"),
+    ),
+}
+QDEVICE_REQUIRED_MODEL_OPTIONS = {"net": ("algorithm", "host")}
+QDEVICE_HEURISTICS_OPTIONS = _same_names(
+    interval=POSITIVE,
+    mode=_one_of("off", "on", "sync"),
+    sync_timeout=POSITIVE,
+    timeout=POSITIVE,
+)
+QDEVICE_HEURISTICS_EXEC_OPTION = re.compile(r"exec_[^.:{}#\s]+")
+# Options of the role which are not a part of corosync.conf
+QDEVICE_IGNORED_MODEL_OPTIONS = ("pcs-address",)
+
+NameValueList = Sequence[Mapping[str, Any]]
+
+
+class CorosyncConfBuildError(Exception):
+    """
+    Corosync configuration cannot be built from the specified options
+    """
+
+    def __init__(self, msg: str):
+        super().__init__(msg)
+        self.msg = msg
+
+
+def _get_options(
+    options: NameValueList,
+    allowed: OptionSpecs,
+    description: str,
+) -> Dict[str, str]:
+    """
+    Validate options and translate them to their corosync names
+    """
+    result: Dict[str, str] = {}
+    for option in options:
+        name = _get_option_name(option, description)
+        if name not in allowed:
+            raise CorosyncConfBuildError(
+                f"Invalid {description} option '{name}', allowed options "
+                f"are: {', '.join(sorted(allowed))}"
+            )
+        corosync_name, values = allowed[name]
+        value = str(option.get("value", ""))
+        if not values.is_valid(value):
+            raise CorosyncConfBuildError(
+                f"'{value}' is not a valid value of {description} option "
+                f"'{name}', use {values.description}"
+            )
+        result[corosync_name] = value
+    return result
+
+
+def _set_options(section: Section, options: Mapping[str, str]) -> None:
+    """
+    Add options to a section sorted by their names, the same way pcs does
+    """
+    for name, value in sorted(options.items()):
+        # pcs uses empty values for removing options
+        if value != "":
+            section.add_option(name, value)
+
+
+def _get_option_name(option: Mapping[str, Any], description: str) -> str:
+    """
+    Get a name of an option, make sure it is specified
+    """
+    name = option.get("name")
+    if not name:
+        raise CorosyncConfBuildError(
+            f"Each {description} option must have a name"
+        )
+    return str(name)
+
+
+def _check_knet_link(options: Mapping[str, str]) -> None:
+    """
+    Check options of a knet link which depend on each other
+    """
+    if ("knet_ping_interval" in options) != ("knet_ping_timeout" in options):
+        raise CorosyncConfBuildError(
+            "Link options 'ping_interval' and 'ping_timeout' must be specified "
+            "together"
+        )
+
+
+def _check_udp_link(options: Mapping[str, str]) -> None:
+    """
+    Check options of a udp link which depend on each other
+    """
+    if options.get("broadcast") == "1" and "mcastaddr" in options:
+        raise CorosyncConfBuildError(
+            "Link option 'mcastaddr' cannot be specified when 'broadcast' is "
+            "enabled"
+        )
+
+
+def _add_links(
+    totem: Section,
+    transport_type: str,
+    links: Sequence[NameValueList],
+    link_count: int,
+) -> None:
+    """
+    Add interface sections configuring links sorted by their link numbers
+
+    link_count -- number of links defined by node addresses
+    """
+    if len(links) > link_count:
+        raise CorosyncConfBuildError(
+            f"Cannot specify options for more links ({len(links)}) than how "
+            f"many is defined by any node ({link_count})"
+        )
+    if transport_type == "knet":
+        allowed = dict(
+            KNET_LINK_OPTIONS,
+            linknumber=("linknumber", _integer(0, link_count - 1)),
+        )
+        check_link = _check_knet_link
+    else:
+        allowed = dict(UDP_LINK_OPTIONS)
+        check_link = _check_udp_link
+    link_options = [_get_options(link, allowed, "link") for link in links]
+    for options in link_options:
+        check_link(options)
+    # Links without a linknumber get the lowest unused link numbers
+    used_numbers = [
+        int(options["linknumber"])
+        for options in link_options
+        if "linknumber" in options
+    ]
+    if len(used_numbers) != len(set(used_numbers)):
+        raise CorosyncConfBuildError("Link numbers must be unique")
+    free_numbers = (
+        str(number)
+        for number in range(KNET_MAX_LINKS)
+        if number not in used_numbers
+    )
+    numbered_links = []
+    for options in link_options:
+        if "linknumber" not in options:
+            options["linknumber"] = next(free_numbers, "")
+        if len(options) > 1:
+            numbered_links.append(options)
+    for options in sorted(
+        numbered_links, key=lambda options: int(options["linknumber"])
+    ):
+        # pcs writes 'broadcast: yes' for enabled broadcast and leaves the
+        # option out otherwise
+        if "broadcast" in options:
+            options["broadcast"] = "yes" if options["broadcast"] == "1" else ""
+        _set_options(totem.add_section("interface"), options)
+
+
+def _add_quorum_device(
+    quorum: Section, device: Mapping[str, Any], node_count: int
+) -> None:
+    """
+    Add a section configuring a quorum device
+    """
+    model = str(device.get("model") or "")
+    if not model:
+        raise CorosyncConfBuildError("Quorum device model must be specified")
+    if model not in QDEVICE_MODEL_OPTIONS:
+        raise CorosyncConfBuildError(
+            f"Invalid quorum device model '{model}', allowed models are: "
+            f"{', '.join(QDEVICE_MODEL_OPTIONS)}"
+        )
+    generic_options = _get_options(
+        device.get("generic_options") or [],
+        QDEVICE_GENERIC_OPTIONS,
+        "quorum device",
+    )
+    model_options = _get_options(
+        [
+            option
+            for option in device.get("model_options") or []
+            if option.get("name") not in QDEVICE_IGNORED_MODEL_OPTIONS
+        ],
+        dict(
+            QDEVICE_MODEL_OPTIONS[model],
+            tie_breaker=(
+                "tie_breaker",
+                _either(_one_of("lowest", "highest"), _integer(1, node_count)),
+            ),
+        ),
+        "quorum device model",
+    )
+    for name in QDEVICE_REQUIRED_MODEL_OPTIONS[model]:
+        if not model_options.get(name):
+            raise CorosyncConfBuildError(
+                f"Quorum device model '{model}' requires option '{name}'"
+            )
+    heuristics = device.get("heuristics_options") or []
+    exec_names = [
+        _get_option_name(option, "quorum device heuristics")
+        for option in heuristics
+    ]
+    heuristics_options = _get_options(
+        heuristics,
+        dict(
+            QDEVICE_HEURISTICS_OPTIONS,
+            **_same_names(
+                **{
+                    name: NOT_EMPTY
+                    for name in exec_names
+                    if QDEVICE_HEURISTICS_EXEC_OPTION.fullmatch(name)
+                }
+            ),
+        ),
+        "quorum device heuristics",
+    )
+
+    device_section = quorum.add_section("device")
+    _set_options(device_section, generic_options)
+    device_section.add_option("model", model)
+    _set_options(device_section.add_section(model), model_options)
+    if heuristics_options:
+        _set_options(
+            device_section.add_section("heuristics"), heuristics_options
+        )
+
+
+def build(
+    cluster_name: str,
+    nodes: Sequence[Mapping[str, Any]],
+    transport: Optional[Mapping[str, Any]] = None,
+    totem: Optional[Mapping[str, Any]] = None,
+    quorum: Optional[Mapping[str, Any]] = None,
+    force_auto_tie_breaker: bool = False,
+) -> Section:
+    """
+    Build a corosync configuration the same way 'pcs cluster setup' does
+
+    cluster_name -- name of the cluster
+    nodes -- list of nodes, each with a 'name' and a list of 'addrs'
+    transport -- structure of ha_cluster_transport
+    totem -- structure of ha_cluster_totem
+    quorum -- structure of ha_cluster_quorum
+    force_auto_tie_breaker -- enable auto_tie_breaker regardless of options
+    """
+    transport = transport or {}
+    totem = totem or {}
+    quorum = quorum or {}
+    transport_type = str(transport.get("type") or "knet")
+    if transport_type not in TRANSPORT_TYPES:
+        raise CorosyncConfBuildError(
+            f"Invalid transport type '{transport_type}', allowed types are: "
+            f"{', '.join(TRANSPORT_TYPES)}"
+        )
+    if transport_type != "knet" and (
+        transport.get("compression") or transport.get("crypto")
+    ):
+        raise CorosyncConfBuildError(
+            f"Compression and crypto are not available with '{transport_type}' "
+            "transport"
+        )
+    addr_counts = {len(node.get("addrs") or []) for node in nodes}
+    if len(addr_counts) > 1:
+        raise CorosyncConfBuildError(
+            "All nodes must have the same number of addresses"
+        )
+    # Node names are used as addresses if no addresses are specified
+    link_count = max(addr_counts, default=0) or 1
+    if transport_type != "knet" and link_count > 1:
+        raise CorosyncConfBuildError(
+            f"Only one address per node is allowed with '{transport_type}' "
+            "transport"
+        )
+    if link_count > KNET_MAX_LINKS:
+        raise CorosyncConfBuildError(
+            f"At most {KNET_MAX_LINKS} addresses per node are allowed"
+        )
+    crypto_options = _get_options(
+        transport.get("crypto") or [], CRYPTO_OPTIONS, "crypto"
+    )
+    if crypto_options.get("crypto_cipher", "none") != "none" and (
+        crypto_options.get("crypto_hash", "none") == "none"
+    ):
+        raise CorosyncConfBuildError(
+            "If crypto option 'cipher' is enabled, crypto option 'hash' must "
+            "be enabled also"
+        )
+    quorum_options = _get_options(
+        quorum.get("options") or [], QUORUM_OPTIONS, "quorum"
+    )
+
+    root = Section("")
+
+    # pcs writes totem options first, then transport options, compression
+    # and crypto, each group sorted by option names
+    totem_section = root.add_section("totem")
+    totem_section.add_option("version", 2)
+    totem_section.add_option("cluster_name", cluster_name)
+    totem_section.add_option("transport", transport_type)
+    _set_options(
+        totem_section,
+        _get_options(totem.get("options") or [], TOTEM_OPTIONS, "totem"),
+    )
+    _set_options(
+        totem_section,
+        _get_options(
+            transport.get("options") or [],
+            TRANSPORT_OPTIONS[transport_type],
+            "transport",
+        ),
+    )
+    _set_options(
+        totem_section,
+        _get_options(
+            transport.get("compression") or [],
+            COMPRESSION_OPTIONS,
+            "compression",
+        ),
+    )
+    if transport_type == "knet":
+        _set_options(totem_section, crypto_options or dict(DEFAULT_KNET_CRYPTO))
+    _add_links(
+        totem_section,
+        transport_type,
+        transport.get("links") or [],
+        link_count,
+    )
+
+    nodelist = root.add_section("nodelist")
+    for nodeid, node in enumerate(nodes, 1):
+        node_section = nodelist.add_section("node")
+        for link, addr in enumerate(node.get("addrs") or [node["name"]]):
+            node_section.add_option(f"ring{link}_addr", addr)
+        node_section.add_option("name", node["name"])
+        node_section.add_option("nodeid", nodeid)
+
+    quorum_section = root.add_section("quorum")
+    quorum_section.add_option("provider", "corosync_votequorum")
+    if force_auto_tie_breaker:
+        quorum_options["auto_tie_breaker"] = "1"
+    # Same as the role, a quorum device is in use if it is defined at all
+    if "device" in quorum:
+        for name in QDEVICE_INCOMPATIBLE_QUORUM_OPTIONS:
+            quorum_options.pop(name, None)
+    _set_options(quorum_section, quorum_options)
+    if (
+        len(nodes) == 2
+        and "device" not in quorum
+        and quorum_options.get("auto_tie_breaker") != "1"
+    ):
+        quorum_section.add_option("two_node", 1)
+    if "device" in quorum:
+        _add_quorum_device(quorum_section, quorum["device"] or {}, len(nodes))
+
+    logging = root.add_section("logging")
+    logging.add_option("to_logfile", "yes")
+    logging.add_option("logfile", "/var/log/cluster/corosync.log")
+    logging.add_option("to_syslog", "yes")
+    logging.add_option("timestamp", "on")
+
+    return root
@@ -130,21 +130,76 @@ def get_rpm_installed_packages(
     return stdout.splitlines() if rc == 0 else None
 
 
-def is_service_enabled(run_command: CommandRunner, service: str) -> bool:
+# Properties of a service loaded from systemd
+SERVICE_PROPERTIES = ("LoadState", "ActiveState", "SubState", "UnitFileState")
+# Unit file states for which 'systemctl is-enabled' reports a unit as enabled
+ENABLED_UNIT_FILE_STATES = frozenset(
+    (
+        "enabled",
+        "enabled-runtime",
+        "static",
+        "alias",
+        "indirect",
+        "generated",
+        "transient",
+    )
+)
+
+
+def get_services_status(
+    run_command: CommandRunner, services: List[str]
+) -> Optional[Dict[str, Dict[str, Any]]]:
     """
-    Check whether a specified service is enabled in the OS
+    Get state and enablement of specified services or None on error
 
-    service -- name of the service to check without the ".service" suffix
+    services -- names of the services without the ".service" suffix
     """
+    if not services:
+        return {}
     env = {
         # make sure to get output of external processes in English and ASCII
         "LC_ALL": "C",
     }
+    # All the services are loaded in one call. The output contains one block of
+    # properties for each service in the order the services were specified.
     # wokeignore:rule=dummy
-    rc, dummy_stdout, dummy_stderr = run_command(
-        ["systemctl", "is-enabled", f"{service}.service"], env
+    rc, stdout, dummy_stderr = run_command(
+        ["systemctl", "show", f"--property={','.join(SERVICE_PROPERTIES)}"]
+        + ["--"]
+        + [f"{service}.service" for service in services],
+        env,
     )
-    return rc == 0
+    if rc != 0:
+        return None
+    blocks: List[Dict[str, str]] = [{}]
+    for line in stdout.splitlines():
+        if not line.strip():
+            if blocks[-1]:
+                blocks.append({})
+            continue
+        name, _, value = line.partition("=")
+        blocks[-1][name] = value
+    if not blocks[-1]:
+        blocks.pop()
+    if len(blocks) != len(services):
+        return None
+
+    result: Dict[str, Dict[str, Any]] = {}
+    for service, properties in zip(services, blocks):
+        result[service] = dict(
+            installed=properties.get("LoadState") == "loaded",
+            running=(
+                properties.get("ActiveState") == "active"
+                and properties.get("SubState") == "running"
+            ),
+            enabled=(
+                properties.get("UnitFileState", "") in ENABLED_UNIT_FILE_STATES
+            ),
+            load_state=properties.get("LoadState", ""),
+            active_state=properties.get("ActiveState", ""),
+            unit_file_state=properties.get("UnitFileState", ""),
+        )
+    return result
 
 
 def get_firewall_config(
@@ -12,16 +12,19 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 # pylint: enable=invalid-name
 
+import socket
 import sys
+import time
 import traceback
 
 # Add paths to pcs bundled libraries to make Dacite available
 sys.path.insert(0, "/usr/lib64/pcs/pcs_bundled/packages/")
 sys.path.insert(0, "/usr/lib/pcs/pcs_bundled/packages/")
 
-from http.client import HTTPResponse
+from http.client import HTTPConnection, HTTPException, HTTPResponse
 from json import JSONDecodeError
-from typing import Any, Mapping, Optional, Union
+from typing import Any, Callable, Mapping, Optional, Union
+from urllib.parse import urlencode
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.urls import fetch_url
@@ -42,9 +45,13 @@ try:
         CommandOptionsDto,
         TaskResultDto,
     )
-    from pcs.common.async_tasks.types import TaskFinishType, TaskKillReason
+    from pcs.common.async_tasks.types import (
+        TaskFinishType,
+        TaskKillReason,
+        TaskState,
+    )
     from pcs.common.interface.dto import from_dict, to_dict
-    from pcs.common.reports import ReportItemDto, ReportItemSeverity
+    from pcs.common.reports import ReportItemSeverity
 except ImportError:
     HAS_PCS = False
     # pylint: disable=invalid-name
@@ -59,9 +66,6 @@ except ImportError:
         def __init__(self, **kwargs):  # type: ignore
             pass
 
-    class ReportItemDto:  # type: ignore
-        pass
-
     class TaskResultDto:  # type: ignore
         pass
 
@@ -73,7 +77,18 @@ else:
     PCS_IMPORT_ERROR = None  # pylint: disable=invalid-name
 
 PCSD_SOCKET = "/var/run/pcsd.socket"
-API_ENDPOINT = "http://doesntmatter/api/v2/task/run"
+API_PATH = "/api/v2/task/run"
+API_ENDPOINT = f"http://doesntmatter{API_PATH}"
+API_CREATE_PATH = "/api/v2/task/create"
+API_RESULT_PATH = "/api/v2/task/result"
+API_KILL_PATH = "/api/v2/task/kill"
+# same as the default timeout of fetch_url
+API_TIMEOUT = 10
+# Asynchronous tasks are polled with a short interval at first, the interval
+# grows up to the maximum while no task finishes.
+MIN_POLL_INTERVAL = 0.25
+MAX_POLL_INTERVAL = 2.0
+POLL_INTERVAL_FACTOR = 1.5
 
 
 CommandParams = Mapping[str, Any]
@@ -124,88 +139,161 @@ def get_command_options_dto(module: AnsibleModule) -> CommandOptionsDto:
     )
 
 
-def report_item_to_dict(
-    report_item: ReportItemDto,
-) -> dict[str, Union[None, str, Mapping[str, Any]]]:
+def _report_to_dict(report: Mapping[str, Any]) -> dict[str, Any]:
     """
-    Convert report item structure to a dict passed back to ansible
+    Convert a report item in JSON form to a dict passed back to ansible
     """
-    message = report_item.message.message
-    if report_item.context:
-        message = f"{report_item.context.node}: {message}"
-    message = f"{report_item.severity.level}: {message}"
+    message_data = report["message"]
+    severity = report["severity"]
+    context = report.get("context")
+    node = context.get("node") if context is not None else None
+    message = message_data["message"]
+    if context is not None:
+        message = f"{node}: {message}"
+    message = f"{severity['level']}: {message}"
     return dict(
-        code=report_item.message.code,
+        code=message_data["code"],
         message=message,
-        payload=report_item.message.payload,
-        severity=report_item.severity.level,
-        force_code=report_item.severity.force_code,
-        node=report_item.context.node if report_item.context else None,
+        payload=message_data["payload"],
+        severity=severity["level"],
+        force_code=severity.get("force_code"),
+        node=node,
     )
 
 
-def api_result_to_dict(api_result: TaskResultDto) -> dict[str, Any]:
+class ApiResult:
     """
-    Convert API result structure to a dict passed back to ansible
+    Result of a pcs API task decoded from JSON without building a DTO
+
+    Only the fields needed to process the result are checked. The command
+    result is kept as plain JSON data. Converting a large result to a DTO and
+    back is expensive, a TaskResultDto is only built when requested.
     """
-    return dict(
-        task_ident=api_result.task_ident,
-        command=to_dict(api_result.command),
-        task_finish_type=str(api_result.task_finish_type),
-        result=api_result.result,
-        reports=[
-            report_item_to_dict(report_item)
-            for report_item in api_result.reports
-        ],
-        kill_reason=(
-            str(api_result.kill_reason) if api_result.kill_reason else None
-        ),
+
+    # Fields of TaskResultDto which must be present
+    REQUIRED_FIELDS = (
+        "task_ident",
+        "command",
+        "reports",
+        "state",
+        "task_finish_type",
     )
 
+    def __init__(self, data: Mapping[str, Any]):
+        for field in self.REQUIRED_FIELDS:
+            if field not in data:
+                raise ValueError(f'missing value for field "{field}"')
+        if not isinstance(data["reports"], list):
+            raise ValueError('wrong value type for field "reports"')
+        self._data = data
+        # validate values of the enums
+        self.state = TaskState(data["state"])
+        self.task_finish_type = TaskFinishType(data["task_finish_type"])
+        self.kill_reason = (
+            TaskKillReason(data["kill_reason"])
+            if data.get("kill_reason") is not None
+            else None
+        )
+        self.error_messages = [
+            str(report_dict["message"])
+            for report_dict in (
+                _report_to_dict(report) for report in data["reports"]
+            )
+            if report_dict["severity"] == ReportItemSeverity.ERROR
+        ]
+
+    @property
+    def task_ident(self) -> str:
+        """
+        Pcs internal task ID
+        """
+        return str(self._data["task_ident"])
+
+    @property
+    def result(self) -> Any:
+        """
+        Data returned by the command
+        """
+        return self._data.get("result")
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the result to a dict passed back to ansible
+        """
+        return dict(
+            task_ident=self.task_ident,
+            command=self._data["command"],
+            task_finish_type=str(self.task_finish_type),
+            result=self.result,
+            reports=[
+                _report_to_dict(report) for report in self._data["reports"]
+            ],
+            kill_reason=str(self.kill_reason) if self.kill_reason else None,
+        )
 
-def parse_api_response(
+    def to_dto(self) -> TaskResultDto:
+        """
+        Build a TaskResultDto from the result
+        """
+        try:
+            return from_dict(TaskResultDto, self._data)
+        except DaciteError as exc:
+            raise ResponseFormatError(
+                f"Unable to parse API response: {exc}"
+            ) from exc
+
+
+def decode_api_response(
     module: AnsibleModule, response_data: bytes
-) -> TaskResultDto:
+) -> ApiResult:
     """
-    Process API response, return parsed API call result or raise ApiError
+    Parse API response to a task result or raise ResponseFormatError
     """
-    # pylint: disable=too-many-return-statements
     try:
-        api_result_dto = from_dict(
-            TaskResultDto, module.from_json(response_data)
-        )
-    except (JSONDecodeError, DaciteError) as exc:
+        data = module.from_json(response_data)
+        if not isinstance(data, dict):
+            raise ValueError("response is not an object")
+        return ApiResult(data)
+    except (ValueError, KeyError, TypeError) as exc:
+        # JSONDecodeError is a subclass of ValueError
         raise ResponseFormatError(
             f"Unable to parse API response: {exc}\n{response_data!r}"
         ) from exc
 
+
+def parse_api_response(
+    module: AnsibleModule, response_data: bytes
+) -> ApiResult:
+    """
+    Process API response, return parsed API call result or raise ApiError
+    """
+    return check_api_result(decode_api_response(module, response_data))
+
+
+def check_api_result(api_result: ApiResult) -> ApiResult:
+    """
+    Return a result of a finished task or raise TaskFailedError if it failed
+    """
     # handle errors
-    if api_result_dto.task_finish_type == TaskFinishType.FAIL:
-        raise TaskFailedError("Task failed", api_result_to_dict(api_result_dto))
-    if api_result_dto.task_finish_type == TaskFinishType.KILL:
-        if api_result_dto.kill_reason == TaskKillReason.COMPLETION_TIMEOUT:
-            raise TaskFailedError(
-                "Task processing timed out", api_result_to_dict(api_result_dto)
-            )
-        raise TaskFailedError("Task killed", api_result_to_dict(api_result_dto))
-    if api_result_dto.task_finish_type == TaskFinishType.UNHANDLED_EXCEPTION:
-        raise TaskFailedError(
-            "Unhandled exception", api_result_to_dict(api_result_dto)
+    error_msg = None
+    if api_result.task_finish_type == TaskFinishType.FAIL:
+        error_msg = "Task failed"
+    elif api_result.task_finish_type == TaskFinishType.KILL:
+        error_msg = (
+            "Task processing timed out"
+            if api_result.kill_reason == TaskKillReason.COMPLETION_TIMEOUT
+            else "Task killed"
         )
-
+    elif api_result.task_finish_type == TaskFinishType.UNHANDLED_EXCEPTION:
+        error_msg = "Unhandled exception"
     # search for errors in reports and fail if the command failed
-    error_list = [
-        str(report_item_to_dict(report_item)["message"])
-        for report_item in api_result_dto.reports
-        if report_item.severity.level == ReportItemSeverity.ERROR
-    ]
-    if error_list:
-        raise TaskFailedError(
-            "\n".join([error for error in error_list if error]),
-            api_result_to_dict(api_result_dto),
+    elif api_result.error_messages:
+        error_msg = "\n".join(
+            [error for error in api_result.error_messages if error]
         )
-
-    return api_result_dto
+    if error_msg is not None:
+        raise TaskFailedError(error_msg, api_result.to_dict())
+    return api_result
 
 
 def call_api_raw(
@@ -228,7 +316,7 @@ def call_api_raw(
     return response, info
 
 
-def call_api(module: AnsibleModule, api_command: CommandDto) -> TaskResultDto:
+def call_api(module: AnsibleModule, api_command: CommandDto) -> ApiResult:
     """
     Call API and process common errors, parse response
     """
@@ -241,3 +329,243 @@ def call_api(module: AnsibleModule, api_command: CommandDto) -> TaskResultDto:
             raise ResponseFormatError(info["msg"])
         raise ResponseFormatError(str(info))
     return parse_api_response(module, response.read())
+
+
+class _UnixSocketHTTPConnection(HTTPConnection):
+    """
+    HTTP connection to a local unix socket
+    """
+
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._socket_path)
+
+
+class ApiConnection:
+    """
+    Keep-alive connection to pcsd for running several API commands
+    """
+
+    def __init__(
+        self,
+        module: AnsibleModule,
+        socket_path: str = PCSD_SOCKET,
+        timeout: float = API_TIMEOUT,
+    ):
+        self._module = module
+        self._connection = _UnixSocketHTTPConnection(socket_path, timeout)
+        self._used = False
+
+    def __enter__(self) -> "ApiConnection":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the connection
+        """
+        self._connection.close()
+
+    def _request(
+        self, method: str, path: str, body: Optional[str]
+    ) -> tuple[int, bytes]:
+        headers = {"Connection": "keep-alive"}
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+        self._connection.request(method, path, body=body, headers=headers)
+        response = self._connection.getresponse()
+        data = response.read()
+        if response.will_close:
+            self._connection.close()
+        return response.status, data
+
+    def _send(
+        self, method: str, path: str, body: Optional[str] = None
+    ) -> bytes:
+        try:
+            try:
+                status, data = self._request(method, path, body)
+            except (BrokenPipeError, ConnectionResetError):
+                # RemoteDisconnected is a subclass of ConnectionResetError
+                if not self._used:
+                    raise
+                # pcsd closed the idle connection before it received the
+                # request, it is safe to send the request again
+                self._connection.close()
+                status, data = self._request(method, path, body)
+        except (OSError, HTTPException) as exc:
+            self._connection.close()
+            raise ResponseFormatError(
+                f"Unable to communicate with pcsd: {exc}"
+            ) from exc
+        self._used = True
+        # handle returned API errors
+        if status >= 400:
+            raise ResponseFormatError(data.decode("utf-8", errors="replace"))
+        return data
+
+    def call_api(self, api_command: CommandDto) -> ApiResult:
+        """
+        Call API over the connection and process common errors, parse response
+        """
+        return parse_api_response(
+            self._module,
+            self._send(
+                "POST", API_PATH, self._module.jsonify(to_dict(api_command))
+            ),
+        )
+
+    def create_task(self, api_command: CommandDto) -> str:
+        """
+        Submit a command to be run asynchronously, return the task identifier
+        """
+        data = self._send(
+            "POST", API_CREATE_PATH, self._module.jsonify(to_dict(api_command))
+        )
+        try:
+            return str(self._module.from_json(data)["task_ident"])
+        except (JSONDecodeError, KeyError, TypeError) as exc:
+            raise ResponseFormatError(
+                f"Unable to parse API response: {exc}\n{data!r}"
+            ) from exc
+
+    def get_task_result(self, task_ident: str) -> ApiResult:
+        """
+        Get the current state of an asynchronous task
+        """
+        return decode_api_response(
+            self._module,
+            self._send(
+                "GET",
+                f"{API_RESULT_PATH}?{urlencode(dict(task_ident=task_ident))}",
+            ),
+        )
+
+    def kill_task(self, task_ident: str) -> None:
+        """
+        Request an asynchronous task to be killed
+        """
+        self._send(
+            "POST",
+            API_KILL_PATH,
+            self._module.jsonify(dict(task_ident=task_ident)),
+        )
+
+
+CommandOutcome = Union[None, ApiResult, ApiError]
+
+
+def run_commands(
+    connection: ApiConnection,
+    api_commands: list[CommandDto],
+    stop_on_error: bool,
+) -> list[CommandOutcome]:
+    """
+    Run commands one by one
+
+    Return a result or an error for each command, None for commands which
+    have not been run due to a previous failure
+    """
+    outcomes: list[CommandOutcome] = []
+    failed = False
+    for api_command in api_commands:
+        if failed and stop_on_error:
+            outcomes.append(None)
+            continue
+        try:
+            outcomes.append(connection.call_api(api_command))
+        except ApiError as exc:
+            failed = True
+            outcomes.append(exc)
+    return outcomes
+
+
+def run_tasks(
+    connection: ApiConnection,
+    api_commands: list[CommandDto],
+    stop_on_error: bool,
+    max_parallel: int,
+    timeout: Optional[float] = None,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep,
+) -> list[CommandOutcome]:
+    """
+    Run commands as asynchronous tasks, at most max_parallel of them at once
+
+    Return a result or an error for each command, None for commands which
+    have not been run due to a previous failure. Tasks running longer than
+    timeout seconds are killed.
+    """
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-branches
+    if max_parallel < 1:
+        # No task would ever be started and the loop would never end
+        raise ValueError("max_parallel must be at least 1")
+    outcomes: list[CommandOutcome] = [None] * len(api_commands)
+    waiting = list(range(len(api_commands)))
+    # task_ident: (index of the command, time the task was created)
+    running: dict[str, tuple[int, float]] = {}
+    killed: set[str] = set()
+    failed = False
+    interval = MIN_POLL_INTERVAL
+    while waiting or running:
+        if failed and stop_on_error:
+            # let already running tasks finish, do not start new ones
+            waiting = []
+        while waiting and len(running) < max_parallel:
+            index = waiting.pop(0)
+            try:
+                running[connection.create_task(api_commands[index])] = (
+                    index,
+                    clock(),
+                )
+            except ApiError as exc:
+                failed = True
+                outcomes[index] = exc
+                if stop_on_error:
+                    waiting = []
+        if not running:
+            continue
+
+        finished = False
+        for task_ident, (index, started) in list(running.items()):
+            try:
+                api_result = connection.get_task_result(task_ident)
+                if api_result.state != TaskState.FINISHED:
+                    if (
+                        timeout is not None
+                        and task_ident not in killed
+                        and clock() - started >= timeout
+                    ):
+                        connection.kill_task(task_ident)
+                        killed.add(task_ident)
+                    continue
+                del running[task_ident]
+                finished = True
+                if task_ident in killed:
+                    raise TaskFailedError(
+                        "Task processing timed out", api_result.to_dict()
+                    )
+                outcomes[index] = check_api_result(api_result)
+            except ApiError as exc:
+                running.pop(task_ident, None)
+                finished = True
+                failed = True
+                outcomes[index] = exc
+
+        if running:
+            # Poll quickly again when tasks are finishing
+            interval = (
+                MIN_POLL_INTERVAL
+                if finished
+                else min(interval * POLL_INTERVAL_FACTOR, MAX_POLL_INTERVAL)
+            )
+            sleep(interval)
+    return outcomes
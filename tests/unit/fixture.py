@@ -47,6 +47,7 @@ def task_result_dto(
     kill_reason: Optional[TaskKillReason] = None,
     result: Any = None,
     command: Optional[CommandDto] = None,
+    state: TaskState = TaskState.FINISHED,
 ) -> TaskResultDto:
     command = command or CommandDto(
         command_name="test-command",
@@ -57,7 +58,7 @@ def task_result_dto(
         task_ident="identifier",
         command=command,
         reports=list(reports),
-        state=TaskState.FINISHED,
+        state=state,
         task_finish_type=finish_type,
         kill_reason=kill_reason,
         result=result,
@@ -0,0 +1,615 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+from typing import Any
+from unittest import TestCase
+
+from ha_cluster_lsr import corosync_conf
+
+COROSYNC_CONF = """
+# comment
+totem {
+    version: 2
+    cluster_name: test-cluster
+    transport: knet
+
+    interface {
+        linknumber: 1
+        knet_ping_timeout: 1000
+    }
+}
+
+nodelist {
+    node {
+        ring0_addr: node1
+        name: node1
+        nodeid: 1
+    }
+
+    node {
+        ring0_addr: node2
+        name: node2
+        nodeid: 2
+    }
+}
+
+quorum {
+    provider: corosync_votequorum
+}
+"""
+
+
+class Parse(TestCase):
+    def test_success(self) -> None:
+        root = corosync_conf.parse(COROSYNC_CONF)
+        self.assertEqual(
+            [section.name for section in root.sections],
+            ["totem", "nodelist", "quorum"],
+        )
+        self.assertEqual(root.sections[0].get_option("transport"), "knet")
+        self.assertEqual(len(root.sections[1].sections), 2)
+
+    def test_unexpected_brace(self) -> None:
+        with self.assertRaises(corosync_conf.CorosyncConfParseError) as cm:
+            corosync_conf.parse("totem {\n}\n}\n")
+        self.assertEqual(cm.exception.line_number, 3)
+
+    def test_missing_brace(self) -> None:
+        with self.assertRaises(corosync_conf.CorosyncConfParseError) as cm:
+            corosync_conf.parse("totem {\nversion: 2\n")
+        self.assertEqual(
+            cm.exception.msg, "Missing closing brace of section 'totem'"
+        )
+
+    def test_invalid_line(self) -> None:
+        with self.assertRaises(corosync_conf.CorosyncConfParseError) as cm:
+            corosync_conf.parse("totem {\nversion 2\n}\n")
+        self.assertEqual(cm.exception.line_number, 2)
+
+
+class Flatten(TestCase):
+    def test_success(self) -> None:
+        self.assertEqual(
+            corosync_conf.flatten(corosync_conf.parse(COROSYNC_CONF)),
+            {
+                "totem.version": "2",
+                "totem.cluster_name": "test-cluster",
+                "totem.transport": "knet",
+                "totem.interface[1].linknumber": "1",
+                "totem.interface[1].knet_ping_timeout": "1000",
+                "nodelist.node[1].ring0_addr": "node1",
+                "nodelist.node[1].name": "node1",
+                "nodelist.node[1].nodeid": "1",
+                "nodelist.node[2].ring0_addr": "node2",
+                "nodelist.node[2].name": "node2",
+                "nodelist.node[2].nodeid": "2",
+                "quorum.provider": "corosync_votequorum",
+            },
+        )
+
+
+def _options(**options: str) -> list[dict[str, str]]:
+    return [dict(name=name, value=value) for name, value in options.items()]
+
+
+NODES = [
+    dict(name="node1", addrs=["10.0.0.1", "10.0.1.1"]),
+    dict(name="node2", addrs=["10.0.0.2", "10.0.1.2"]),
+]
+
+
+class Export(TestCase):
+    def test_roundtrip(self) -> None:
+        exported = corosync_conf.export(corosync_conf.parse(COROSYNC_CONF))
+        self.assertTrue(exported.startswith("totem {\n    version: 2\n"))
+        self.assertTrue(corosync_conf.is_equivalent(COROSYNC_CONF, exported))
+
+    def test_not_equivalent(self) -> None:
+        self.assertFalse(
+            corosync_conf.is_equivalent(
+                COROSYNC_CONF, COROSYNC_CONF.replace("node2", "node3")
+            )
+        )
+
+
+class Build(TestCase):
+    def test_defaults(self) -> None:
+        self.assertEqual(
+            corosync_conf.export(
+                corosync_conf.build(
+                    "test-cluster", [dict(name="node1"), dict(name="node2")]
+                )
+            ),
+            """\
+totem {
+    version: 2
+    cluster_name: test-cluster
+    transport: knet
+    crypto_cipher: aes256
+    crypto_hash: sha256
+}
+
+nodelist {
+    node {
+        ring0_addr: node1
+        name: node1
+        nodeid: 1
+    }
+
+    node {
+        ring0_addr: node2
+        name: node2
+        nodeid: 2
+    }
+}
+
+quorum {
+    provider: corosync_votequorum
+    two_node: 1
+}
+
+logging {
+    to_logfile: yes
+    logfile: /var/log/cluster/corosync.log
+    to_syslog: yes
+    timestamp: on
+}
+""",
+        )
+
+    def test_all_options(self) -> None:
+        options = corosync_conf.flatten(
+            corosync_conf.build(
+                "test-cluster",
+                NODES,
+                dict(
+                    options=_options(link_mode="passive"),
+                    links=[
+                        _options(link_priority="5"),
+                        _options(
+                            linknumber="0",
+                            ping_interval="250",
+                            ping_timeout="1000",
+                        ),
+                    ],
+                    compression=_options(model="zlib"),
+                    crypto=_options(cipher="aes128", hash="sha1"),
+                ),
+                dict(options=_options(token="5000")),
+                dict(
+                    options=_options(wait_for_all="1"),
+                    device=dict(
+                        model="net",
+                        model_options=_options(
+                            host="qnetd", algorithm="ffsplit"
+                        )
+                        + [{"name": "pcs-address", "value": "qnetd-pcs"}],
+                        generic_options=_options(timeout="20000"),
+                        heuristics_options=_options(mode="on"),
+                    ),
+                ),
+            )
+        )
+        self.assertEqual(options["totem.link_mode"], "passive")
+        self.assertEqual(options["totem.knet_compression_model"], "zlib")
+        self.assertEqual(options["totem.crypto_cipher"], "aes128")
+        self.assertEqual(options["totem.crypto_hash"], "sha1")
+        self.assertEqual(options["totem.token"], "5000")
+        self.assertEqual(options["totem.interface[1].knet_link_priority"], "5")
+        self.assertEqual(
+            options["totem.interface[0].knet_ping_timeout"], "1000"
+        )
+        self.assertEqual(options["nodelist.node[2].ring1_addr"], "10.0.1.2")
+        self.assertEqual(options["quorum.wait_for_all"], "1")
+        self.assertNotIn("quorum.two_node", options)
+        self.assertEqual(options["quorum.device.timeout"], "20000")
+        self.assertEqual(options["quorum.device.net.host"], "qnetd")
+        self.assertNotIn("quorum.device.net.pcs-address", options)
+        self.assertEqual(options["quorum.device.heuristics.mode"], "on")
+
+    def test_pcs_layout(self) -> None:
+        # Same input and output as in tests_cluster_advanced_knet_full.yml
+        self.assertEqual(
+            corosync_conf.export(
+                corosync_conf.build(
+                    "test-cluster",
+                    NODES,
+                    dict(
+                        options=_options(
+                            ip_version="ipv4-6", link_mode="active"
+                        ),
+                        links=[
+                            _options(transport="udp", link_priority="10"),
+                            _options(linknumber="0", link_priority="5"),
+                        ],
+                        compression=_options(level="5", model="zlib"),
+                        crypto=_options(cipher="none", hash="none"),
+                    ),
+                    dict(
+                        options=_options(
+                            token_retransmits_before_loss_const="5",
+                            send_join="0",
+                        )
+                    ),
+                    dict(
+                        options=_options(wait_for_all="1", auto_tie_breaker="1")
+                    ),
+                )
+            ),
+            """\
+totem {
+    version: 2
+    cluster_name: test-cluster
+    transport: knet
+    send_join: 0
+    token_retransmits_before_loss_const: 5
+    ip_version: ipv4-6
+    link_mode: active
+    knet_compression_level: 5
+    knet_compression_model: zlib
+    crypto_cipher: none
+    crypto_hash: none
+
+    interface {
+        knet_link_priority: 5
+        linknumber: 0
+    }
+
+    interface {
+        knet_link_priority: 10
+        knet_transport: udp
+        linknumber: 1
+    }
+}
+
+nodelist {
+    node {
+        ring0_addr: 10.0.0.1
+        ring1_addr: 10.0.1.1
+        name: node1
+        nodeid: 1
+    }
+
+    node {
+        ring0_addr: 10.0.0.2
+        ring1_addr: 10.0.1.2
+        name: node2
+        nodeid: 2
+    }
+}
+
+quorum {
+    provider: corosync_votequorum
+    auto_tie_breaker: 1
+    wait_for_all: 1
+}
+
+logging {
+    to_logfile: yes
+    logfile: /var/log/cluster/corosync.log
+    to_syslog: yes
+    timestamp: on
+}
+""",
+        )
+
+    def test_pcs_layout_quorum_device(self) -> None:
+        # Same input and output as in tests_qdevice_all_options.yml
+        conf = corosync_conf.export(
+            corosync_conf.build(
+                "test-cluster",
+                NODES,
+                quorum=dict(
+                    device=dict(
+                        model="net",
+                        model_options=_options(host="qnetd", algorithm="lms"),
+                        generic_options=_options(
+                            timeout="1000", sync_timeout="3000"
+                        ),
+                        heuristics_options=_options(
+                            mode="on", exec_ping="/usr/bin/ping -c 1 127.0.0.1"
+                        ),
+                    )
+                ),
+            )
+        )
+        self.assertIn(
+            """\
+quorum {
+    provider: corosync_votequorum
+
+    device {
+        sync_timeout: 3000
+        timeout: 1000
+        model: net
+
+        net {
+            algorithm: lms
+            host: qnetd
+        }
+
+        heuristics {
+            exec_ping: /usr/bin/ping -c 1 127.0.0.1
+            mode: on
+        }
+    }
+}
+""",
+            conf,
+        )
+
+    def test_force_auto_tie_breaker(self) -> None:
+        options = corosync_conf.flatten(
+            corosync_conf.build(
+                "test-cluster",
+                NODES,
+                quorum=dict(options=_options(auto_tie_breaker="0")),
+                force_auto_tie_breaker=True,
+            )
+        )
+        self.assertEqual(options["quorum.auto_tie_breaker"], "1")
+        self.assertNotIn("quorum.two_node", options)
+
+    def test_quorum_device_removes_incompatible_options(self) -> None:
+        options = corosync_conf.flatten(
+            corosync_conf.build(
+                "test-cluster",
+                NODES,
+                quorum=dict(
+                    options=_options(
+                        auto_tie_breaker="1",
+                        last_man_standing="1",
+                        last_man_standing_window="1000",
+                        wait_for_all="1",
+                    ),
+                    device=dict(
+                        model="net",
+                        model_options=_options(host="qnetd", algorithm="lms"),
+                    ),
+                ),
+            )
+        )
+        self.assertEqual(
+            {
+                name: value
+                for name, value in options.items()
+                if name.startswith("quorum.") and "device" not in name
+            },
+            {
+                "quorum.provider": "corosync_votequorum",
+                "quorum.wait_for_all": "1",
+            },
+        )
+
+    def test_udp(self) -> None:
+        options = corosync_conf.flatten(
+            corosync_conf.build(
+                "test-cluster",
+                [dict(name="node1", addrs=["10.0.0.1"])],
+                dict(type="udpu", links=[_options(ttl="2", broadcast="1")]),
+            )
+        )
+        self.assertEqual(options["totem.transport"], "udpu")
+        self.assertNotIn("totem.crypto_cipher", options)
+        self.assertEqual(options["totem.interface[0].ttl"], "2")
+        self.assertEqual(options["totem.interface[0].broadcast"], "yes")
+
+    def test_errors(self) -> None:
+        for kwargs, msg in (
+            (
+                dict(transport=dict(type="sctp")),
+                "Invalid transport type 'sctp'",
+            ),
+            (
+                dict(transport=dict(type="udp", crypto=_options(cipher="x"))),
+                "Compression and crypto are not available",
+            ),
+            (
+                dict(totem=dict(options=_options(bad="1"))),
+                "Invalid totem option 'bad'",
+            ),
+            (
+                dict(transport=dict(links=[_options(ttl="1")])),
+                "Invalid link option 'ttl'",
+            ),
+            (
+                dict(quorum=dict(device=dict(model=""))),
+                "Quorum device model must be specified",
+            ),
+            (
+                dict(quorum=dict(device={})),
+                "Quorum device model must be specified",
+            ),
+            (
+                dict(
+                    quorum=dict(
+                        device=dict(
+                            model="net", model_options=_options(algorithm="lms")
+                        )
+                    )
+                ),
+                "Quorum device model 'net' requires option 'host'",
+            ),
+            (
+                dict(
+                    quorum=dict(
+                        device=dict(
+                            model="net",
+                            model_options=_options(host="qnetd")
+                            + [dict(value="on")],
+                        )
+                    )
+                ),
+                "Each quorum device model option must have a name",
+            ),
+            (
+                dict(
+                    quorum=dict(
+                        device=dict(
+                            model="net",
+                            model_options=_options(
+                                host="qnetd", algorithm="lms"
+                            ),
+                            heuristics_options=[dict(value="on")],
+                        )
+                    )
+                ),
+                "Each quorum device heuristics option must have a name",
+            ),
+            (
+                dict(nodes=[dict(name="node1"), NODES[1]]),
+                "All nodes must have the same number of addresses",
+            ),
+            (
+                dict(totem=dict(options=_options(token="abc"))),
+                "'abc' is not a valid value of totem option 'token', use a "
+                "non-negative integer",
+            ),
+            (
+                dict(transport=dict(options=_options(ip_version="ipv5"))),
+                "'ipv5' is not a valid value of transport option 'ip_version'",
+            ),
+            (
+                dict(transport=dict(links=[_options(link_priority="256")])),
+                "'256' is not a valid value of link option 'link_priority', "
+                "use 0..255",
+            ),
+            (
+                dict(transport=dict(links=[_options(linknumber="2")])),
+                "'2' is not a valid value of link option 'linknumber', use 0..1",
+            ),
+            (
+                dict(transport=dict(links=[[], [], []])),
+                "Cannot specify options for more links (3) than how many is "
+                "defined by any node (2)",
+            ),
+            (
+                dict(
+                    transport=dict(
+                        links=[
+                            _options(linknumber="1"),
+                            _options(linknumber="1"),
+                        ]
+                    )
+                ),
+                "Link numbers must be unique",
+            ),
+            (
+                dict(transport=dict(links=[_options(ping_interval="250")])),
+                "Link options 'ping_interval' and 'ping_timeout' must be "
+                "specified together",
+            ),
+            (
+                dict(
+                    nodes=[dict(name="node1"), dict(name="node2")],
+                    transport=dict(
+                        type="udp",
+                        links=[_options(broadcast="1", mcastaddr="239.0.0.1")],
+                    ),
+                ),
+                "Link option 'mcastaddr' cannot be specified when 'broadcast' "
+                "is enabled",
+            ),
+            (
+                dict(transport=dict(crypto=_options(cipher="aes256"))),
+                "If crypto option 'cipher' is enabled, crypto option 'hash' "
+                "must be enabled also",
+            ),
+            (
+                dict(quorum=dict(options=_options(wait_for_all="yes"))),
+                "'yes' is not a valid value of quorum option 'wait_for_all', "
+                "use '0', '1'",
+            ),
+            (
+                dict(quorum=dict(device=dict(model="disk"))),
+                "Invalid quorum device model 'disk', allowed models are: net",
+            ),
+            (
+                dict(
+                    quorum=dict(
+                        device=dict(
+                            model="net", model_options=_options(host="qnetd")
+                        )
+                    )
+                ),
+                "Quorum device model 'net' requires option 'algorithm'",
+            ),
+            (
+                dict(
+                    quorum=dict(
+                        device=dict(
+                            model="net",
+                            model_options=_options(
+                                host="qnetd", algorithm="lms", tie_breaker="3"
+                            ),
+                        )
+                    )
+                ),
+                "'3' is not a valid value of quorum device model option "
+                "'tie_breaker', use 'lowest', 'highest' or 1..2",
+            ),
+            (
+                dict(
+                    quorum=dict(
+                        device=dict(
+                            model="net",
+                            model_options=_options(
+                                host="qnetd", algorithm="lms"
+                            ),
+                            generic_options=_options(timeout="0"),
+                        )
+                    )
+                ),
+                "'0' is not a valid value of quorum device option 'timeout', "
+                "use a positive integer",
+            ),
+            (
+                dict(
+                    quorum=dict(
+                        device=dict(
+                            model="net",
+                            model_options=_options(
+                                host="qnetd", algorithm="lms"
+                            ),
+                            heuristics_options=_options(exec_="/bin/true"),
+                        )
+                    )
+                ),
+                "Invalid quorum device heuristics option 'exec_'",
+            ),
+            (
+                dict(
+                    quorum=dict(
+                        device=dict(
+                            model="net",
+                            model_options=_options(
+                                host="qnetd", algorithm="lms"
+                            ),
+                            heuristics_options=_options(exec_ping=""),
+                        )
+                    )
+                ),
+                "'' is not a valid value of quorum device heuristics option "
+                "'exec_ping', use a non-empty value",
+            ),
+            (
+                dict(transport=dict(type="udp")),
+                "Only one address per node is allowed",
+            ),
+        ):
+            with self.subTest(msg=msg):
+                args: dict[str, Any] = dict(
+                    cluster_name="test-cluster", nodes=NODES
+                )
+                args.update(kwargs)
+                with self.assertRaises(
+                    corosync_conf.CorosyncConfBuildError
+                ) as cm:
+                    corosync_conf.build(**args)
+                self.assertTrue(cm.exception.msg.startswith(msg))
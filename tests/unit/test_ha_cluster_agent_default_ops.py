@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+import os
+import shutil
+import tempfile
+from typing import Any, List
+from unittest import TestCase, mock
+
+import ha_cluster_agent_default_ops as default_ops
+
+METADATA_STATEFUL = """
+<resource-agent name="Stateful">
+  <actions>
+    <action name="start" timeout="20s" />
+    <action name="stop" timeout="20s" />
+    <action name="monitor" depth="0" timeout="20s" interval="10s"
+        role="Master" />
+    <action name="monitor" depth="0" timeout="20s" interval="11s"
+        role="Slave" />
+    <action name="promote" timeout="10s" />
+    <action name="demote" timeout="10s" />
+    <action name="notify" timeout="5s" />
+    <action name="meta-data" timeout="5s" />
+    <action name="reload-agent" timeout="10s" />
+    <action name="validate-all" timeout="30s" depth="0" />
+  </actions>
+</resource-agent>
+"""
+
+METADATA_FENCE = """
+<resource-agent name="fence_xvm">
+  <actions>
+    <action name="on" automatic="0"/>
+    <action name="off" />
+    <action name="reboot" />
+    <action name="status" />
+    <action name="monitor" />
+    <action name="metadata" />
+    <action name="validate-all" />
+  </actions>
+</resource-agent>
+"""
+
+
+def _op(action: str, **attrs: str) -> dict[str, Any]:
+    return dict(
+        action=action,
+        attrs=[
+            dict(name=name.replace("_", "-"), value=value)
+            for name, value in attrs.items()
+        ],
+    )
+
+
+class DefaultOperations(TestCase):
+    def test_resource(self) -> None:
+        self.assertEqual(
+            default_ops.default_operations(
+                "ocf:pacemaker:Stateful", METADATA_STATEFUL
+            ),
+            [
+                _op("start", interval="0s", timeout="20s"),
+                _op("stop", interval="0s", timeout="20s"),
+                _op("monitor", interval="10s", timeout="20s", role="promoted"),
+                _op(
+                    "monitor", interval="11s", timeout="20s", role="unpromoted"
+                ),
+                _op("promote", interval="0s", timeout="10s"),
+                _op("demote", interval="0s", timeout="10s"),
+                _op("notify", interval="0s", timeout="5s"),
+                _op("reload-agent", interval="0s", timeout="10s"),
+            ],
+        )
+
+    def test_stonith(self) -> None:
+        self.assertEqual(
+            default_ops.default_operations("stonith:fence_xvm", METADATA_FENCE),
+            [_op("monitor", interval="60s")],
+        )
+
+    def test_depth_and_missing_monitor(self) -> None:
+        self.assertEqual(
+            default_ops.default_operations(
+                "ocf:heartbeat:Some",
+                """
+                <resource-agent>
+                  <actions>
+                    <action name="start" start-delay="5s" depth="10" />
+                  </actions>
+                </resource-agent>
+                """,
+            ),
+            [
+                dict(
+                    action="start",
+                    attrs=[
+                        dict(name="interval", value="0s"),
+                        dict(name="start-delay", value="5s"),
+                        dict(name="OCF_CHECK_LEVEL", value="10"),
+                    ],
+                ),
+                _op("monitor", interval="60s"),
+            ],
+        )
+
+
+class Cache(TestCase):
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+
+    def test_roundtrip(self) -> None:
+        operations = [_op("monitor", interval="60s")]
+        default_ops.save_cache(self.cache_dir, "ocf:a:b", "key1", operations)
+        self.assertEqual(
+            default_ops.load_cache(self.cache_dir, "ocf:a:b", "key1"),
+            operations,
+        )
+
+    def test_stale(self) -> None:
+        operations = [_op("monitor", interval="60s")]
+        default_ops.save_cache(self.cache_dir, "ocf:a:b", "key1", operations)
+        self.assertIsNone(
+            default_ops.load_cache(self.cache_dir, "ocf:a:b", "key2")
+        )
+
+    def test_missing_or_invalid(self) -> None:
+        self.assertIsNone(
+            default_ops.load_cache(self.cache_dir, "ocf:a:b", "key1")
+        )
+        # pylint: disable=protected-access
+        with open(
+            default_ops._cache_file(self.cache_dir, "ocf:a:b"), "w"
+        ) as cache_fd:
+            cache_fd.write("not a json")
+        self.assertIsNone(
+            default_ops.load_cache(self.cache_dir, "ocf:a:b", "key1")
+        )
+
+
+class GetDefaultOps(TestCase):
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        self.module = mock.Mock()
+        self.module.check_mode = False
+        self.metadata_calls: List[str] = []
+
+        def run_command(cmd: List[str], **kwargs: Any) -> Any:
+            if cmd[0] == "crm_resource":
+                self.metadata_calls.append(cmd[2])
+                if cmd[2].startswith("stonith:"):
+                    return 0, METADATA_FENCE, ""
+                if cmd[2] == "ocf:pacemaker:Stateful":
+                    return 0, METADATA_STATEFUL, ""
+                return 1, "", "agent not found"
+            return 0, "pacemaker-2.1.7-1.el9.x86_64\n", ""
+
+        self.module.run_command.side_effect = run_command
+        self.module.get_bin_path.return_value = "/usr/bin/rpm"
+
+        key_patcher = mock.patch.object(default_ops, "_agent_path")
+        self.agent_path_mock = key_patcher.start()
+        self.addCleanup(key_patcher.stop)
+        fd, agent_file = tempfile.mkstemp(dir=self.cache_dir)
+        os.close(fd)
+        self.agent_path_mock.return_value = agent_file
+
+    def test_metadata_loaded_once_per_agent(self) -> None:
+        result = default_ops.get_default_ops(
+            self.module,
+            [
+                "ocf:pacemaker:Stateful",
+                "stonith:fence_xvm",
+                "ocf:pacemaker:Stateful",
+                "ocf:heartbeat:missing",
+            ],
+            self.cache_dir,
+        )
+        self.assertEqual(
+            sorted(self.metadata_calls),
+            [
+                "ocf:heartbeat:missing",
+                "ocf:pacemaker:Stateful",
+                "stonith:fence_xvm",
+            ],
+        )
+        self.assertEqual(
+            sorted(result["default_ops"].keys()),
+            ["ocf:pacemaker:Stateful", "stonith:fence_xvm"],
+        )
+        self.assertEqual(result["cached"], [])
+
+        self.metadata_calls = []
+        result_cached = default_ops.get_default_ops(
+            self.module,
+            ["ocf:pacemaker:Stateful", "stonith:fence_xvm"],
+            self.cache_dir,
+        )
+        self.assertEqual(self.metadata_calls, [])
+        self.assertEqual(result_cached["default_ops"], result["default_ops"])
+        self.assertEqual(
+            result_cached["cached"],
+            ["ocf:pacemaker:Stateful", "stonith:fence_xvm"],
+        )
+
+    def test_check_mode_does_not_cache(self) -> None:
+        self.module.check_mode = True
+        default_ops.get_default_ops(
+            self.module, ["stonith:fence_xvm"], self.cache_dir
+        )
+        default_ops.get_default_ops(
+            self.module, ["stonith:fence_xvm"], self.cache_dir
+        )
+        self.assertEqual(
+            self.metadata_calls, ["stonith:fence_xvm", "stonith:fence_xvm"]
+        )
+
+    def test_not_cached_without_file(self) -> None:
+        self.agent_path_mock.return_value = None
+        result = default_ops.get_default_ops(
+            self.module, ["stonith:fence_xvm"], self.cache_dir
+        )
+        self.assertEqual(
+            result["default_ops"],
+            {"stonith:fence_xvm": [_op("monitor", interval="60s")]},
+        )
+        self.assertEqual(
+            [
+                name
+                for name in os.listdir(self.cache_dir)
+                if name.endswith("json")
+            ],
+            [],
+        )
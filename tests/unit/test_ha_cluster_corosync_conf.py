@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+import sys
+from importlib import import_module
+from unittest import TestCase
+
+sys.modules["ansible.module_utils.ha_cluster_lsr"] = import_module(
+    "ha_cluster_lsr"
+)
+
+# pylint: disable=wrong-import-position
+import ha_cluster_corosync_conf
+
+NEW_CONF = """\
+totem {
+    version: 2
+    cluster_name: test-cluster
+}
+"""
+
+
+class NeedsUpdate(TestCase):
+    def test_missing(self) -> None:
+        self.assertTrue(ha_cluster_corosync_conf.needs_update(None, NEW_CONF))
+
+    def test_formatting_ignored(self) -> None:
+        self.assertFalse(
+            ha_cluster_corosync_conf.needs_update(
+                "# created by pcs\ntotem {\n"
+                "\tcluster_name: test-cluster\n\tversion: 2\n}\n",
+                NEW_CONF,
+            )
+        )
+
+    def test_changed(self) -> None:
+        self.assertTrue(
+            ha_cluster_corosync_conf.needs_update(
+                NEW_CONF.replace("test-cluster", "other"), NEW_CONF
+            )
+        )
+
+    def test_unparsable(self) -> None:
+        self.assertTrue(
+            ha_cluster_corosync_conf.needs_update("totem {\n", NEW_CONF)
+        )
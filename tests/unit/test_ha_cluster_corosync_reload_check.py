@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+import sys
+from importlib import import_module
+from unittest import TestCase, mock
+
+sys.modules["ansible.module_utils.ha_cluster_lsr"] = import_module(
+    "ha_cluster_lsr"
+)
+
+# pylint: disable=wrong-import-position
+import ha_cluster_corosync_reload_check as reload_check
+
+CONF_TEMPLATE = """
+totem {{
+    cluster_name: test-cluster
+    transport: knet
+    token: {token}
+    crypto_cipher: {cipher}
+}}
+
+nodelist {{
+    node {{
+        ring0_addr: {node1_addr}
+        name: node1
+        nodeid: 1
+    }}
+{extra_node}}}
+
+quorum {{
+    provider: corosync_votequorum
+{device}}}
+"""
+
+EXTRA_NODE = """
+    node {
+        ring0_addr: node3
+        name: node3
+        nodeid: 3
+    }
+"""
+
+DEVICE = """
+    device {
+        model: net
+        net {
+            host: qnetd
+        }
+    }
+"""
+
+
+def _conf(**kwargs: str) -> str:
+    options = dict(
+        token="3000",
+        cipher="aes256",
+        node1_addr="node1",
+        extra_node="",
+        device="",
+    )
+    options.update(kwargs)
+    return CONF_TEMPLATE.format(**options)
+
+
+class ClassifyChanges(TestCase):
+    def test_no_changes(self) -> None:
+        self.assertEqual(
+            reload_check.classify_changes(_conf(), _conf(), (3, 1, 8)),
+            dict(
+                restart_required=False,
+                qdevice_restart_required=False,
+                reload_changes=[],
+                restart_changes=[],
+                rolling_restart_possible=True,
+            ),
+        )
+
+    def test_reloadable(self) -> None:
+        self.assertEqual(
+            reload_check.classify_changes(
+                _conf(),
+                _conf(token="5000", extra_node=EXTRA_NODE),
+                (3, 1, 8),
+            ),
+            dict(
+                restart_required=False,
+                qdevice_restart_required=False,
+                reload_changes=[
+                    "nodelist.node[3].name",
+                    "nodelist.node[3].nodeid",
+                    "nodelist.node[3].ring0_addr",
+                    "totem.token",
+                ],
+                restart_changes=[],
+                rolling_restart_possible=True,
+            ),
+        )
+
+    def test_restart_required(self) -> None:
+        result = reload_check.classify_changes(
+            _conf(), _conf(node1_addr="10.0.0.1", token="5000"), (3, 1, 8)
+        )
+        self.assertTrue(result["restart_required"])
+        self.assertEqual(result["reload_changes"], ["totem.token"])
+        self.assertEqual(
+            result["restart_changes"], ["nodelist.node[1].ring0_addr"]
+        )
+        self.assertFalse(result["rolling_restart_possible"])
+
+    def test_rolling_restart_possible(self) -> None:
+        result = reload_check.classify_changes(
+            _conf(), _conf(token="5000"), (2, 4, 5)
+        )
+        self.assertTrue(result["restart_required"])
+        self.assertTrue(result["rolling_restart_possible"])
+
+    def test_depends_on_version(self) -> None:
+        self.assertFalse(
+            reload_check.classify_changes(
+                _conf(), _conf(cipher="aes128"), (3, 1, 0)
+            )["restart_required"]
+        )
+        self.assertTrue(
+            reload_check.classify_changes(
+                _conf(), _conf(cipher="aes128"), (3, 0, 4)
+            )["restart_required"]
+        )
+        self.assertTrue(
+            reload_check.classify_changes(
+                _conf(), _conf(token="5000"), (2, 4, 5)
+            )["restart_required"]
+        )
+
+    def test_unknown_version(self) -> None:
+        self.assertEqual(
+            reload_check.classify_changes(_conf(), _conf(token="5000"), None)[
+                "restart_changes"
+            ],
+            ["totem.token"],
+        )
+
+    def test_qdevice(self) -> None:
+        result = reload_check.classify_changes(
+            _conf(), _conf(device=DEVICE), (3, 1, 8)
+        )
+        self.assertFalse(result["restart_required"])
+        self.assertTrue(result["qdevice_restart_required"])
+
+
+class GetCorosyncVersion(TestCase):
+    def setUp(self) -> None:
+        self.module = mock.Mock()
+        self.module.get_bin_path.return_value = "/usr/sbin/corosync"
+
+    def test_success(self) -> None:
+        self.module.run_command.return_value = (
+            0,
+            "Corosync Cluster Engine, version '3.1.8'\nCopyright ...\n",
+            "",
+        )
+        self.assertEqual(
+            reload_check.get_corosync_version(self.module), (3, 1, 8)
+        )
+
+    def test_failure(self) -> None:
+        self.module.run_command.return_value = (1, "", "not found")
+        self.assertIsNone(reload_check.get_corosync_version(self.module))
+
+    def test_not_installed(self) -> None:
+        self.module.get_bin_path.return_value = None
+        self.assertIsNone(reload_check.get_corosync_version(self.module))
+        self.module.run_command.assert_not_called()
+
+    def test_unexpected_output(self) -> None:
+        self.module.run_command.return_value = (0, "corosync", "")
+        self.assertIsNone(reload_check.get_corosync_version(self.module))
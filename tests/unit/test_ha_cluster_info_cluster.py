@@ -13,14 +13,27 @@ from .ha_cluster_info import ha_cluster_info, mocked_cmd_runner
 
 CMD_OPTIONS = dict(environ_update={"LC_ALL": "C"}, check_rc=False)
 
-CMD_ENABLED_COROSYNC = mock.call(
-    ["systemctl", "is-enabled", "corosync.service"], **CMD_OPTIONS
-)
-CMD_ENABLED_PCMK = mock.call(
-    ["systemctl", "is-enabled", "pacemaker.service"], **CMD_OPTIONS
+CMD_SERVICES_STATUS = mock.call(
+    [
+        "systemctl",
+        "show",
+        "--property=LoadState,ActiveState,SubState,UnitFileState",
+        "--",
+        "corosync.service",
+        "pacemaker.service",
+    ],
+    **CMD_OPTIONS,
 )
 
 
+def services_status(corosync_enabled: bool, pacemaker_enabled: bool) -> str:
+    return "\n".join(
+        "LoadState=loaded\nActiveState=inactive\nSubState=dead\n"
+        f"UnitFileState={'enabled' if enabled else 'disabled'}\n"
+        for enabled in (corosync_enabled, pacemaker_enabled)
+    )
+
+
 class ExportClusterConfiguration(TestCase):
     maxDiff = None
 
@@ -49,8 +62,14 @@ class ExportClusterConfiguration(TestCase):
         )
         with mocked_cmd_runner(
             [
-                (CMD_ENABLED_COROSYNC, (0 if corosync_enabled else 1, "", "")),
-                (CMD_ENABLED_PCMK, (0 if pacemaker_enabled else 1, "", "")),
+                (
+                    CMD_SERVICES_STATUS,
+                    (
+                        0,
+                        services_status(corosync_enabled, pacemaker_enabled),
+                        "",
+                    ),
+                ),
             ]
         ) as cmd_runner:
             self.assertEqual(
@@ -96,8 +115,7 @@ class ExportClusterConfiguration(TestCase):
 
         with mocked_cmd_runner(
             [
-                (CMD_ENABLED_COROSYNC, (0, "", "")),
-                (CMD_ENABLED_PCMK, (0, "", "")),
+                (CMD_SERVICES_STATUS, (0, services_status(True, True), "")),
             ]
         ) as cmd_runner:
             self.assertEqual(
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+import hashlib
+import json
+import os
+import shutil
+from tempfile import mkdtemp
+from typing import Any, Dict, Optional
+from unittest import TestCase, mock
+
+import ha_cluster_pcs_auth_check
+
+KNOWN_HOSTS: Dict[str, Any] = {
+    "node1": {
+        "dest_list": [{"addr": "node1", "port": 2224}],
+        "token": "token1",
+    },
+    "node2": {
+        "dest_list": [{"addr": "192.168.1.12", "port": 2225}],
+        "token": "token2",
+    },
+    "node3": {
+        "dest_list": [{"addr": "fd00::3", "port": 2224}],
+        "token": "",
+    },
+}
+
+
+def _host(name: str, pcs_address: Optional[str] = None) -> Dict[str, Any]:
+    return dict(name=name, pcs_address=pcs_address)
+
+
+class ParseAddress(TestCase):
+    def test_addresses(self) -> None:
+        for address, expected in (
+            ("node1", ("node1", None)),
+            ("node1:2225", ("node1", 2225)),
+            ("192.168.1.1", ("192.168.1.1", None)),
+            ("192.168.1.1:2225", ("192.168.1.1", 2225)),
+            ("fd00::1", ("fd00::1", None)),
+            ("[fd00::1]", ("fd00::1", None)),
+            ("[fd00::1]:2225", ("fd00::1", 2225)),
+        ):
+            with self.subTest(address=address):
+                self.assertEqual(
+                    ha_cluster_pcs_auth_check.parse_address(address), expected
+                )
+
+
+class FindUnauthenticated(TestCase):
+    def test_no_known_hosts(self) -> None:
+        self.assertEqual(
+            ha_cluster_pcs_auth_check.find_unauthenticated(
+                None, [_host("node1"), _host("node2")]
+            ),
+            ["node1", "node2"],
+        )
+
+    def test_all_known(self) -> None:
+        self.assertEqual(
+            ha_cluster_pcs_auth_check.find_unauthenticated(
+                KNOWN_HOSTS,
+                [_host("node1"), _host("node2", "192.168.1.12:2225")],
+            ),
+            [],
+        )
+
+    def test_port_not_specified(self) -> None:
+        self.assertEqual(
+            ha_cluster_pcs_auth_check.find_unauthenticated(
+                KNOWN_HOSTS, [_host("node2", "192.168.1.12")]
+            ),
+            [],
+        )
+
+    def test_unknown_or_different(self) -> None:
+        self.assertEqual(
+            ha_cluster_pcs_auth_check.find_unauthenticated(
+                KNOWN_HOSTS,
+                [
+                    _host("node1", "192.168.1.11"),
+                    _host("node2", "192.168.1.12:2224"),
+                    _host("node3", "fd00::3"),
+                    _host("node4"),
+                ],
+            ),
+            ["node1", "node2", "node3", "node4"],
+        )
+
+
+class VerifyTokens(TestCase):
+    @mock.patch.object(ha_cluster_pcs_auth_check, "check_token")
+    def test_verify(self, mock_check_token: mock.Mock) -> None:
+        mock_check_token.side_effect = (
+            lambda known_host, timeout: known_host["token"] == "token1"
+        )
+        self.assertEqual(
+            ha_cluster_pcs_auth_check.verify_tokens(
+                KNOWN_HOSTS, ["node1", "node2"], 5
+            ),
+            ["node2"],
+        )
+        mock_check_token.assert_any_call(KNOWN_HOSTS["node1"], 5)
+        mock_check_token.assert_any_call(KNOWN_HOSTS["node2"], 5)
+
+    @mock.patch.object(ha_cluster_pcs_auth_check, "check_token")
+    def test_no_hosts(self, mock_check_token: mock.Mock) -> None:
+        self.assertEqual(
+            ha_cluster_pcs_auth_check.verify_tokens(KNOWN_HOSTS, [], 5), []
+        )
+        mock_check_token.assert_not_called()
+
+
+class KnownHostsFiles(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = mkdtemp()
+        self.known_hosts_path = os.path.join(self.tmp_dir, "known-hosts")
+        self.state_path = os.path.join(self.tmp_dir, "known-hosts.verified")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp_dir)
+
+    def test_missing(self) -> None:
+        self.assertEqual(
+            ha_cluster_pcs_auth_check.load_known_hosts(self.known_hosts_path),
+            (None, ""),
+        )
+        self.assertEqual(
+            ha_cluster_pcs_auth_check.read_state(self.state_path), ""
+        )
+
+    def test_malformed(self) -> None:
+        with open(self.known_hosts_path, "wb") as known_hosts_file:
+            known_hosts_file.write(b"not json")
+        self.assertEqual(
+            ha_cluster_pcs_auth_check.load_known_hosts(self.known_hosts_path),
+            (None, hashlib.sha256(b"not json").hexdigest()),
+        )
+
+    def test_load(self) -> None:
+        raw = json.dumps(
+            dict(format_version=1, data_version=3, known_hosts=KNOWN_HOSTS)
+        ).encode()
+        with open(self.known_hosts_path, "wb") as known_hosts_file:
+            known_hosts_file.write(raw)
+        self.assertEqual(
+            ha_cluster_pcs_auth_check.load_known_hosts(self.known_hosts_path),
+            (KNOWN_HOSTS, hashlib.sha256(raw).hexdigest()),
+        )
+
+    def test_state(self) -> None:
+        ha_cluster_pcs_auth_check.write_state(self.state_path, "abcd")
+        self.assertEqual(
+            ha_cluster_pcs_auth_check.read_state(self.state_path), "abcd"
+        )
+        self.assertEqual(os.stat(self.state_path).st_mode & 0o777, 0o600)
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+import base64
+import hashlib
+import os
+import shutil
+from tempfile import mkdtemp
+from typing import Any, Dict
+from unittest import TestCase, mock
+
+import ha_cluster_preshared_keys
+
+KEY = b"\x00\x01secret key\xff"
+KEY_B64 = base64.b64encode(KEY).decode()
+KEY_SHA256 = hashlib.sha256(KEY).hexdigest()
+
+
+def _atomic_move(src: str, dest: str) -> None:
+    os.rename(src, dest)
+
+
+class FileDigest(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp_dir)
+
+    def test_missing(self) -> None:
+        self.assertIsNone(
+            ha_cluster_preshared_keys.file_digest(
+                os.path.join(self.tmp_dir, "authkey")
+            )
+        )
+
+    def test_existing(self) -> None:
+        path = os.path.join(self.tmp_dir, "authkey")
+        with open(path, "wb") as key_file:
+            key_file.write(KEY)
+        self.assertEqual(
+            ha_cluster_preshared_keys.file_digest(path), KEY_SHA256
+        )
+
+
+class ProcessKey(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "corosync", "authkey")
+        self.module = mock.Mock()
+        self.module.check_mode = False
+        self.module.params = dict(digest_only=False)
+        self.module.atomic_move.side_effect = _atomic_move
+        self.module.load_file_common_arguments.side_effect = dict
+        self.module.set_fs_attributes_if_different.side_effect = (
+            lambda file_args, changed: changed
+        )
+        self.module.fail_json.side_effect = SystemExit
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp_dir)
+
+    def _key(self, content: Any = None) -> Dict[str, Any]:
+        return dict(
+            name="corosync_authkey",
+            path=self.path,
+            content=content,
+            owner="root",
+            group="root",
+            mode="0400",
+        )
+
+    def _write(self, content: bytes) -> None:
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "wb") as key_file:
+            key_file.write(content)
+
+    def _read(self) -> bytes:
+        with open(self.path, "rb") as key_file:
+            return key_file.read()
+
+    def test_missing_no_content(self) -> None:
+        self.assertEqual(
+            ha_cluster_preshared_keys.process_key(self.module, self._key()),
+            dict(exists=False, sha256=None, changed=False),
+        )
+        self.module.set_fs_attributes_if_different.assert_not_called()
+
+    def test_missing_key_written(self) -> None:
+        self.assertEqual(
+            ha_cluster_preshared_keys.process_key(
+                self.module, self._key(KEY_B64)
+            ),
+            dict(exists=True, sha256=KEY_SHA256, changed=True),
+        )
+        self.assertEqual(self._read(), KEY)
+        self.module.set_fs_attributes_if_different.assert_called_once_with(
+            dict(path=self.path, owner="root", group="root", mode="0400"),
+            True,
+        )
+
+    def test_same_key_not_written(self) -> None:
+        self._write(KEY)
+        self.assertEqual(
+            ha_cluster_preshared_keys.process_key(
+                self.module, self._key(KEY_B64)
+            ),
+            dict(exists=True, sha256=KEY_SHA256, changed=False),
+        )
+        self.module.atomic_move.assert_not_called()
+
+    def test_different_key_written(self) -> None:
+        self._write(b"old key")
+        self.assertEqual(
+            ha_cluster_preshared_keys.process_key(
+                self.module, self._key(KEY_B64)
+            ),
+            dict(exists=True, sha256=KEY_SHA256, changed=True),
+        )
+        self.assertEqual(self._read(), KEY)
+
+    def test_check_mode(self) -> None:
+        self.module.check_mode = True
+        self._write(b"old key")
+        self.assertEqual(
+            ha_cluster_preshared_keys.process_key(
+                self.module, self._key(KEY_B64)
+            ),
+            dict(exists=True, sha256=KEY_SHA256, changed=True),
+        )
+        self.assertEqual(self._read(), b"old key")
+
+    def test_digest_only(self) -> None:
+        self.module.params["digest_only"] = True
+        self._write(KEY)
+        self.assertEqual(
+            ha_cluster_preshared_keys.process_key(
+                self.module, self._key(base64.b64encode(b"new").decode())
+            ),
+            dict(exists=True, sha256=KEY_SHA256, changed=False),
+        )
+        self.assertEqual(self._read(), KEY)
+        self.module.set_fs_attributes_if_different.assert_not_called()
+
+    def test_invalid_content(self) -> None:
+        with self.assertRaises(SystemExit):
+            ha_cluster_preshared_keys.process_key(
+                self.module, self._key("not base64!")
+            )
+        self.module.fail_json.assert_called_once_with(
+            msg="Content of key 'corosync_authkey' is not valid"
+        )
+        self.assertFalse(os.path.exists(self.path))
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+from unittest import TestCase, mock
+
+import ha_cluster_purge_nodes
+
+STATUS_XML = """
+<pacemaker-result api-version="2.30" request="crm_mon --output-as=xml">
+  <nodes>
+    <node name="node1" id="1" online="true" type="member"/>
+    <node name="node2" id="2" online="false" type="member"/>
+    <node name="node3" id="3" online="false" type="member"/>
+    <node name="remote1" id="remote1" online="true" type="remote"/>
+  </nodes>
+</pacemaker-result>
+"""
+
+LEGACY_STATUS_XML = """
+<crm_mon version="2.0.5">
+  <nodes>
+    <node name="node1" id="1" online="true" type="member"/>
+    <node name="node4" id="4" online="false" type="member"/>
+  </nodes>
+</crm_mon>
+"""
+
+
+class GetClusterNodes(TestCase):
+    def test_nodes(self) -> None:
+        self.assertEqual(
+            ha_cluster_purge_nodes.get_cluster_nodes(STATUS_XML),
+            ["node1", "node2", "node3"],
+        )
+
+    def test_legacy_format(self) -> None:
+        self.assertEqual(
+            ha_cluster_purge_nodes.get_cluster_nodes(LEGACY_STATUS_XML),
+            ["node1", "node4"],
+        )
+
+    def test_no_nodes(self) -> None:
+        self.assertEqual(
+            ha_cluster_purge_nodes.get_cluster_nodes(
+                "<pacemaker-result><nodes/></pacemaker-result>"
+            ),
+            [],
+        )
+
+
+class RunModule(TestCase):
+    def setUp(self) -> None:
+        module_patcher = mock.patch.object(
+            ha_cluster_purge_nodes, "AnsibleModule"
+        )
+        self.module_mock = module_patcher.start().return_value
+        self.addCleanup(module_patcher.stop)
+        self.module_mock.params = dict(expected_nodes=["node1", "node2"])
+        self.module_mock.check_mode = False
+        self.module_mock.run_command.side_effect = [
+            (0, STATUS_XML, ""),
+            (0, "", ""),
+        ]
+        self.module_mock.fail_json.side_effect = SystemExit
+
+    def test_purge(self) -> None:
+        ha_cluster_purge_nodes.run_module()
+        self.module_mock.run_command.assert_called_with(
+            ["crm_node", "--force", "--remove", "node3"],
+            environ_update={"LC_ALL": "C"},
+            check_rc=False,
+        )
+        self.assertEqual(self.module_mock.run_command.call_count, 2)
+        self.module_mock.exit_json.assert_called_once_with(
+            changed=True, removed_nodes=["node3"]
+        )
+
+    def test_check_mode(self) -> None:
+        self.module_mock.check_mode = True
+        ha_cluster_purge_nodes.run_module()
+        self.assertEqual(self.module_mock.run_command.call_count, 1)
+        self.module_mock.exit_json.assert_called_once_with(
+            changed=True, removed_nodes=["node3"]
+        )
+
+    def test_nothing_to_purge(self) -> None:
+        self.module_mock.params["expected_nodes"] = ["node1", "node2", "node3"]
+        ha_cluster_purge_nodes.run_module()
+        self.assertEqual(self.module_mock.run_command.call_count, 1)
+        self.module_mock.exit_json.assert_called_once_with(
+            changed=False, removed_nodes=[]
+        )
+
+    def test_remove_failed(self) -> None:
+        self.module_mock.run_command.side_effect = [
+            (0, STATUS_XML, ""),
+            (1, "", "error"),
+        ]
+        with self.assertRaises(SystemExit):
+            ha_cluster_purge_nodes.run_module()
+        self.module_mock.fail_json.assert_called_once_with(
+            msg="Unable to remove node 'node3' from pacemaker",
+            rc=1,
+            stdout="",
+            stderr="error",
+        )
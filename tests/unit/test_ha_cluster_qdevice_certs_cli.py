@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+import os
+import tempfile
+from base64 import b64encode
+from typing import Dict, List, Optional, Tuple
+from unittest import TestCase, mock
+
+import ha_cluster_qdevice_certs_cli
+
+CA_PEM = """\
+-----BEGIN CERTIFICATE-----
+MIIBqDCCAVKgAwIBAgIFAJ
+Yz6LkwDQYJKoZIhvcNAQEL
+-----END CERTIFICATE-----
+"""
+CA_PEM_FLAT = (
+    "-----BEGIN CERTIFICATE-----MIIBqDCCAVKgAwIBAgIFAJ"
+    "Yz6LkwDQYJKoZIhvcNAQEL-----END CERTIFICATE-----"
+)
+QNETD_CA = b64encode(CA_PEM.encode("utf-8"))
+
+CLUSTER_CERT = """\
+Certificate:
+    Data:
+        Version: 3 (0x2)
+        Issuer: "CN=QNet CA"
+        Subject: "CN=my-cluster"
+"""
+
+
+class GetPcsdAddress(TestCase):
+    def test_success(self) -> None:
+        self.assertEqual(
+            ha_cluster_qdevice_certs_cli.get_pcsd_address(
+                dict(
+                    known_hosts=dict(
+                        qnetd=dict(
+                            token="TOKEN",
+                            dest_list=[
+                                dict(addr="::1", port=2224),
+                                dict(addr="10.0.0.1", port=2225),
+                            ],
+                        )
+                    )
+                ),
+                "qnetd",
+            ),
+            ("::1", 2224, "TOKEN"),
+        )
+
+    def test_unknown_host(self) -> None:
+        with self.assertRaises(
+            ha_cluster_qdevice_certs_cli.QdeviceCertsError
+        ) as cm:
+            ha_cluster_qdevice_certs_cli.get_pcsd_address(
+                dict(known_hosts={}), "qnetd"
+            )
+        self.assertEqual(
+            str(cm.exception), "Host 'qnetd' is not authenticated in pcs"
+        )
+
+
+class ExtractCertificates(TestCase):
+    def test_success(self) -> None:
+        self.assertEqual(
+            ha_cluster_qdevice_certs_cli.extract_certificates(
+                "garbage\n" + CA_PEM.replace("\n", "\r\n") + CA_PEM
+            ),
+            [CA_PEM_FLAT, CA_PEM_FLAT],
+        )
+
+    def test_no_certificate(self) -> None:
+        self.assertEqual(
+            ha_cluster_qdevice_certs_cli.extract_certificates("garbage"), []
+        )
+
+
+class GetSubjectNames(TestCase):
+    def test_success(self) -> None:
+        self.assertEqual(
+            ha_cluster_qdevice_certs_cli.get_subject_names(CLUSTER_CERT),
+            ["my-cluster"],
+        )
+
+
+class CheckCerts(TestCase):
+    def _check(
+        self, local_ca: Optional[str], cluster_cert: Optional[str]
+    ) -> Tuple[bool, bytes]:
+        outputs: Dict[str, Optional[str]] = {
+            ha_cluster_qdevice_certs_cli.CA_NICKNAME: local_ca,
+            ha_cluster_qdevice_certs_cli.CLUSTER_CERT_NICKNAME: cluster_cert,
+        }
+
+        def run_command(
+            cmd: List[str], **kwargs: object
+        ) -> Tuple[int, str, str]:
+            output = outputs[cmd[5]]
+            if output is None:
+                return 255, "", "certutil: Could not find cert"
+            return 0, output, ""
+
+        module = mock.Mock()
+        module.run_command.side_effect = run_command
+        session = mock.Mock()
+        session.get_ca_certificate.return_value = QNETD_CA
+        result = ha_cluster_qdevice_certs_cli.check_certs(
+            module, session, "my-cluster"
+        )
+        self.assertEqual(module.run_command.call_count, 2)
+        session.get_ca_certificate.assert_called_once_with()
+        return result
+
+    def test_present(self) -> None:
+        self.assertEqual(self._check(CA_PEM, CLUSTER_CERT), (True, QNETD_CA))
+
+    def test_missing_ca(self) -> None:
+        self.assertEqual(self._check(None, CLUSTER_CERT), (False, QNETD_CA))
+
+    def test_missing_cluster_cert(self) -> None:
+        self.assertEqual(self._check(CA_PEM, None), (False, QNETD_CA))
+
+    def test_duplicate_ca(self) -> None:
+        self.assertEqual(
+            self._check(CA_PEM + CA_PEM, CLUSTER_CERT), (False, QNETD_CA)
+        )
+
+    def test_other_cluster(self) -> None:
+        self.assertEqual(
+            self._check(
+                CA_PEM, CLUSTER_CERT.replace("my-cluster", "other-cluster")
+            ),
+            (False, QNETD_CA),
+        )
+
+    def test_other_ca(self) -> None:
+        self.assertEqual(
+            self._check(CA_PEM.replace("MIIB", "MIIC"), CLUSTER_CERT),
+            (False, QNETD_CA),
+        )
+
+
+class SetupCerts(TestCase):
+    def test_success(self) -> None:
+        module = mock.Mock()
+        module.run_command.return_value = (0, "", "")
+        session = mock.Mock()
+        session.sign_certificate_request.return_value = b"signed"
+        with tempfile.TemporaryDirectory() as cert_db:
+            request_path = os.path.join(cert_db, "node.crq")
+            p12_path = os.path.join(cert_db, "node.p12")
+            with open(request_path, "wb") as request_file:
+                request_file.write(b"request")
+            with open(p12_path, "wb") as p12_file:
+                p12_file.write(b"p12")
+            with mock.patch.multiple(
+                ha_cluster_qdevice_certs_cli,
+                CERT_REQUEST_PATH=request_path,
+                CERT_P12_PATH=p12_path,
+            ):
+                ha_cluster_qdevice_certs_cli.setup_certs(
+                    module, session, "my-cluster", QNETD_CA
+                )
+        session.sign_certificate_request.assert_called_once_with(
+            "my-cluster", b"request"
+        )
+        calls = module.run_command.call_args_list
+        self.assertEqual(
+            [call.args[0][:4] for call in calls],
+            [
+                ["pcs", "--", "qdevice", "net-client"],
+                ["corosync-qdevice-net-certutil", "-r", "-n", "my-cluster"],
+                ["corosync-qdevice-net-certutil", "-M", "-c", mock.ANY],
+                ["pcs", "--", "qdevice", "net-client"],
+            ],
+        )
+        self.assertEqual(calls[0].kwargs["data"], QNETD_CA.decode("ascii"))
+        self.assertEqual(calls[3].args[0][4], "import-certificate")
+        self.assertEqual(calls[3].kwargs["data"], "cDEy")
+
+    def test_command_failed(self) -> None:
+        module = mock.Mock()
+        module.run_command.return_value = (1, "", "Error: bad certificate")
+        with self.assertRaises(
+            ha_cluster_qdevice_certs_cli.QdeviceCertsError
+        ) as cm:
+            ha_cluster_qdevice_certs_cli.setup_certs(
+                module, mock.Mock(), "my-cluster", QNETD_CA
+            )
+        self.assertEqual(
+            str(cm.exception),
+            "Command 'pcs -- qdevice net-client setup' failed: "
+            "Error: bad certificate",
+        )
+
+
+class RunModule(TestCase):
+    def setUp(self) -> None:
+        patchers = dict(
+            module=mock.patch.object(
+                ha_cluster_qdevice_certs_cli, "AnsibleModule"
+            ),
+            session=mock.patch.object(
+                ha_cluster_qdevice_certs_cli, "PcsdSession"
+            ),
+            check=mock.patch.object(
+                ha_cluster_qdevice_certs_cli, "check_certs"
+            ),
+            setup=mock.patch.object(
+                ha_cluster_qdevice_certs_cli, "setup_certs"
+            ),
+            open=mock.patch.object(
+                ha_cluster_qdevice_certs_cli,
+                "open",
+                mock.mock_open(
+                    read_data=(
+                        '{"known_hosts": {"qnetd": {"token": "TOKEN", '
+                        '"dest_list": [{"addr": "10.0.0.1", "port": 2224}]}}}'
+                    )
+                ),
+                create=True,
+            ),
+        )
+        mocks = {}
+        for name, patcher in patchers.items():
+            mocks[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+        self.session_mock = mocks["session"]
+        self.check_mock = mocks["check"]
+        self.setup_mock = mocks["setup"]
+        self.module_mock = mocks["module"].return_value
+        self.module_mock.params = dict(
+            qnetd_host="qnetd", cluster_name="my-cluster"
+        )
+        self.module_mock.check_mode = False
+        self.module_mock.fail_json.side_effect = SystemExit
+
+    def test_present(self) -> None:
+        self.check_mock.return_value = (True, QNETD_CA)
+        ha_cluster_qdevice_certs_cli.run_module()
+        self.session_mock.assert_called_once_with("10.0.0.1", 2224, "TOKEN")
+        self.setup_mock.assert_not_called()
+        self.module_mock.exit_json.assert_called_once_with(
+            changed=False, certificates_present=True
+        )
+
+    def test_setup(self) -> None:
+        self.check_mock.return_value = (False, QNETD_CA)
+        ha_cluster_qdevice_certs_cli.run_module()
+        session = self.session_mock.return_value.__enter__.return_value
+        self.setup_mock.assert_called_once_with(
+            self.module_mock, session, "my-cluster", QNETD_CA
+        )
+        self.module_mock.exit_json.assert_called_once_with(
+            changed=True, certificates_present=False
+        )
+
+    def test_check_mode(self) -> None:
+        self.module_mock.check_mode = True
+        self.check_mock.return_value = (False, QNETD_CA)
+        ha_cluster_qdevice_certs_cli.run_module()
+        self.setup_mock.assert_not_called()
+        self.module_mock.exit_json.assert_called_once_with(
+            changed=True, certificates_present=False
+        )
+
+    def test_error(self) -> None:
+        self.check_mock.side_effect = (
+            ha_cluster_qdevice_certs_cli.QdeviceCertsError(
+                "Unable to communicate with pcsd: timed out"
+            )
+        )
+        with self.assertRaises(SystemExit):
+            ha_cluster_qdevice_certs_cli.run_module()
+        self.setup_mock.assert_not_called()
+        self.module_mock.fail_json.assert_called_once_with(
+            msg="Unable to communicate with pcsd: timed out"
+        )
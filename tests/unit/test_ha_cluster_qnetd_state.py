@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+import sys
+from importlib import import_module
+from typing import List, Tuple
+from unittest import TestCase, mock
+
+sys.modules["ansible.module_utils.ha_cluster_lsr"] = import_module(
+    "ha_cluster_lsr"
+)
+sys.modules["ansible.module_utils.ha_cluster_lsr.info"] = import_module(
+    "ha_cluster_lsr.info"
+)
+
+# pylint: disable=wrong-import-position
+import ha_cluster_qnetd_state
+
+CERTUTIL_OUTPUT = """
+
+Certificate Nickname                                         Trust Attributes
+                                                             SSL,S/MIME,JAR/XPI
+
+QNet CA                                                      CT,c,c
+QNetd Cert                                                   u,u,u
+"""
+
+SERVICE_OUTPUT = (
+    "LoadState=loaded\nActiveState=active\nSubState=running\n"
+    "UnitFileState=enabled\n"
+)
+SERVICE_STATUS = dict(
+    installed=True,
+    running=True,
+    enabled=True,
+    load_state="loaded",
+    active_state="active",
+    unit_file_state="enabled",
+)
+
+
+class ParseCertificateList(TestCase):
+    def test_success(self) -> None:
+        self.assertEqual(
+            ha_cluster_qnetd_state.parse_certificate_list(CERTUTIL_OUTPUT),
+            ["QNet CA", "QNetd Cert"],
+        )
+
+    def test_empty(self) -> None:
+        self.assertEqual(
+            ha_cluster_qnetd_state.parse_certificate_list(
+                CERTUTIL_OUTPUT.split("QNet CA", maxsplit=1)[0]
+            ),
+            [],
+        )
+
+
+class RunModule(TestCase):
+    def setUp(self) -> None:
+        module_patcher = mock.patch.object(
+            ha_cluster_qnetd_state, "AnsibleModule"
+        )
+        self.module_mock = module_patcher.start().return_value
+        self.module_mock.fail_json.side_effect = SystemExit
+        self.addCleanup(module_patcher.stop)
+        exists_patcher = mock.patch("ha_cluster_qnetd_state.os.path.exists")
+        self.exists_mock = exists_patcher.start()
+        self.addCleanup(exists_patcher.stop)
+
+    def _outputs(self, outputs: List[Tuple[int, str, str]]) -> None:
+        self.module_mock.run_command.side_effect = outputs
+
+    def test_set_up(self) -> None:
+        self.exists_mock.return_value = True
+        self._outputs(
+            [(0, SERVICE_OUTPUT, ""), (0, CERTUTIL_OUTPUT, "")],
+        )
+        ha_cluster_qnetd_state.run_module()
+        self.exists_mock.assert_called_once_with(
+            "/etc/corosync/qnetd/nssdb/qnetd-cacert.crt"
+        )
+        self.module_mock.run_command.assert_called_with(
+            ["certutil", "-d", "/etc/corosync/qnetd/nssdb", "-L"],
+            environ_update={"LC_ALL": "C"},
+            check_rc=False,
+        )
+        self.module_mock.exit_json.assert_called_once_with(
+            changed=False,
+            initialized=True,
+            certificates=["QNet CA", "QNetd Cert"],
+            setup_needed=False,
+            service=SERVICE_STATUS,
+        )
+
+    def test_not_initialized(self) -> None:
+        self.exists_mock.return_value = False
+        self._outputs([(0, SERVICE_OUTPUT, "")])
+        ha_cluster_qnetd_state.run_module()
+        self.assertEqual(self.module_mock.run_command.call_count, 1)
+        self.module_mock.exit_json.assert_called_once_with(
+            changed=False,
+            initialized=False,
+            certificates=[],
+            setup_needed=True,
+            service=SERVICE_STATUS,
+        )
+
+    def test_missing_server_certificate(self) -> None:
+        self.exists_mock.return_value = True
+        self._outputs(
+            [
+                (0, SERVICE_OUTPUT, ""),
+                (0, CERTUTIL_OUTPUT.replace("QNetd Cert", "Other Cert"), ""),
+            ],
+        )
+        ha_cluster_qnetd_state.run_module()
+        self.module_mock.exit_json.assert_called_once_with(
+            changed=False,
+            initialized=True,
+            certificates=["QNet CA", "Other Cert"],
+            setup_needed=True,
+            service=SERVICE_STATUS,
+        )
+
+    def test_certutil_failed(self) -> None:
+        self.exists_mock.return_value = True
+        self._outputs(
+            [(0, SERVICE_OUTPUT, ""), (255, "", "certutil: bad database")],
+        )
+        with self.assertRaises(SystemExit):
+            ha_cluster_qnetd_state.run_module()
+        self.module_mock.fail_json.assert_called_once_with(
+            msg="Unable to list certificates in qnetd certificate database",
+            rc=255,
+            stdout="",
+            stderr="certutil: bad database",
+        )
+
+    def test_systemctl_failed(self) -> None:
+        self._outputs([(1, "", "System has not been booted")])
+        with self.assertRaises(SystemExit):
+            ha_cluster_qnetd_state.run_module()
+        self.exists_mock.assert_not_called()
+        self.module_mock.fail_json.assert_called_once_with(
+            msg="Unable to get status of services from systemd"
+        )
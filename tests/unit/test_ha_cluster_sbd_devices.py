@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+from typing import Any, List, Tuple
+from unittest import TestCase, mock
+
+import ha_cluster_sbd_devices
+
+SBD = "/usr/sbin/sbd"
+PCS = "/usr/sbin/pcs"
+
+
+class ProbeDevices(TestCase):
+    def setUp(self) -> None:
+        self.module = mock.Mock()
+
+        def run_command(cmd: List[str], **kwargs: Any) -> Tuple[int, str, str]:
+            return (0 if cmd[2] == "/dev/sdb" else 1, "", "")
+
+        self.module.run_command.side_effect = run_command
+
+    def test_no_devices(self) -> None:
+        self.assertEqual(
+            ha_cluster_sbd_devices.probe_devices(self.module, SBD, []), {}
+        )
+        self.module.run_command.assert_not_called()
+
+    def test_devices(self) -> None:
+        self.assertEqual(
+            ha_cluster_sbd_devices.probe_devices(
+                self.module, SBD, ["/dev/sda", "/dev/sdb", "/dev/sdc"]
+            ),
+            {"/dev/sda": False, "/dev/sdb": True, "/dev/sdc": False},
+        )
+        self.assertEqual(self.module.run_command.call_count, 3)
+        self.module.run_command.assert_any_call(
+            [SBD, "-d", "/dev/sdb", "dump"],
+            environ_update={"LC_ALL": "C"},
+            check_rc=False,
+        )
+
+
+class SbdCreateCommand(TestCase):
+    def test_default_timeouts(self) -> None:
+        self.assertEqual(
+            ha_cluster_sbd_devices.sbd_create_command(
+                SBD, ["/dev/sda"], None, None
+            ),
+            [SBD, "-d", "/dev/sda", "create"],
+        )
+
+    def test_timeouts(self) -> None:
+        self.assertEqual(
+            ha_cluster_sbd_devices.sbd_create_command(
+                SBD, ["/dev/sda", "/dev/sdb"], 60, 120
+            ),
+            [
+                SBD,
+                "-d",
+                "/dev/sda",
+                "-d",
+                "/dev/sdb",
+                "-1",
+                "60",
+                "-4",
+                "120",
+                "create",
+            ],
+        )
+
+
+class PcsSetupCommand(TestCase):
+    def test_default_timeouts(self) -> None:
+        self.assertEqual(
+            ha_cluster_sbd_devices.pcs_setup_command(
+                PCS, ["/dev/sda"], None, None
+            ),
+            [PCS, "--force", "--", "stonith", "sbd", "device", "setup"]
+            + ["device=/dev/sda"],
+        )
+
+    def test_timeouts(self) -> None:
+        self.assertEqual(
+            ha_cluster_sbd_devices.pcs_setup_command(
+                PCS, ["/dev/sda", "/dev/sdb"], 5, 10
+            ),
+            [PCS, "--force", "--", "stonith", "sbd", "device", "setup"]
+            + ["device=/dev/sda", "device=/dev/sdb"]
+            + ["watchdog-timeout=5", "msgwait-timeout=10"],
+        )
+
+
+class InitializeDevices(TestCase):
+    def setUp(self) -> None:
+        self.module = mock.Mock()
+        self.module.run_command.return_value = (0, "", "")
+        self.module.fail_json.side_effect = SystemExit
+
+    def test_success(self) -> None:
+        ha_cluster_sbd_devices.initialize_devices(
+            self.module, [SBD, "-d", "/dev/sda", "create"], ["/dev/sda"]
+        )
+        self.module.run_command.assert_called_once_with(
+            [SBD, "-d", "/dev/sda", "create"],
+            environ_update={"LC_ALL": "C"},
+            check_rc=False,
+        )
+        self.module.fail_json.assert_not_called()
+
+    def test_failure(self) -> None:
+        self.module.run_command.return_value = (1, "out", "err")
+        with self.assertRaises(SystemExit):
+            ha_cluster_sbd_devices.initialize_devices(
+                self.module, [SBD, "-d", "/dev/sda", "create"], ["/dev/sda"]
+            )
+        self.module.fail_json.assert_called_once_with(
+            msg="Unable to initialize SBD devices",
+            devices=["/dev/sda"],
+            rc=1,
+            stdout="out",
+            stderr="err",
+        )
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+import os
+import shutil
+from tempfile import mkdtemp
+from unittest import TestCase, mock
+
+import ha_cluster_sbd_watchdog
+
+REGEXP = "^(options|blacklist) iTCO_wdt"
+# wokeignore:rule=blacklist
+LINE = "blacklist iTCO_wdt"
+
+
+class EnsureLine(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "modprobe.d", "iTCO_wdt.conf")
+        self.module = mock.Mock()
+        self.module.check_mode = False
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp_dir)
+
+    def _write(self, content: str) -> None:
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w", encoding="utf-8") as conf_file:
+            conf_file.write(content)
+
+    def _read(self) -> str:
+        with open(self.path, encoding="utf-8") as conf_file:
+            return conf_file.read()
+
+    def test_create(self) -> None:
+        self.assertTrue(
+            ha_cluster_sbd_watchdog.ensure_line(
+                self.module, self.path, REGEXP, LINE
+            )
+        )
+        self.assertEqual(self._read(), f"{LINE}\n")
+
+    def test_present(self) -> None:
+        self._write(f"# comment\n{LINE}\n")
+        self.assertFalse(
+            ha_cluster_sbd_watchdog.ensure_line(
+                self.module, self.path, REGEXP, LINE
+            )
+        )
+        self.assertEqual(self._read(), f"# comment\n{LINE}\n")
+
+    def test_replace(self) -> None:
+        self._write("# comment\noptions iTCO_wdt nowayout=1\n")
+        self.assertTrue(
+            ha_cluster_sbd_watchdog.ensure_line(
+                self.module, self.path, REGEXP, LINE
+            )
+        )
+        self.assertEqual(self._read(), f"# comment\n{LINE}\n")
+
+    def test_append(self) -> None:
+        self._write("# comment\n")
+        self.assertTrue(
+            ha_cluster_sbd_watchdog.ensure_line(
+                self.module, self.path, REGEXP, LINE
+            )
+        )
+        self.assertEqual(self._read(), f"# comment\n{LINE}\n")
+
+    def test_check_mode(self) -> None:
+        self.module.check_mode = True
+        self.assertTrue(
+            ha_cluster_sbd_watchdog.ensure_line(
+                self.module, self.path, REGEXP, LINE
+            )
+        )
+        self.assertFalse(os.path.exists(self.path))
+
+
+class WaitForDevices(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp_dir)
+
+    def test_present(self) -> None:
+        for name in ("watchdog1", "watchdog", "other"):
+            with open(os.path.join(self.tmp_dir, name), "w", encoding="utf-8"):
+                pass
+        with mock.patch.object(
+            ha_cluster_sbd_watchdog,
+            "WATCHDOG_DEVICES",
+            os.path.join(self.tmp_dir, "watchdog*"),
+        ):
+            self.assertEqual(
+                ha_cluster_sbd_watchdog.wait_for_devices(0),
+                [
+                    os.path.join(self.tmp_dir, "watchdog"),
+                    os.path.join(self.tmp_dir, "watchdog1"),
+                ],
+            )
+
+    def test_missing(self) -> None:
+        with mock.patch.object(
+            ha_cluster_sbd_watchdog,
+            "WATCHDOG_DEVICES",
+            os.path.join(self.tmp_dir, "watchdog*"),
+        ):
+            self.assertEqual(ha_cluster_sbd_watchdog.wait_for_devices(0), [])
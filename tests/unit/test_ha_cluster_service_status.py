@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+import sys
+from importlib import import_module
+from unittest import TestCase, mock
+
+sys.modules["ansible.module_utils.ha_cluster_lsr"] = import_module(
+    "ha_cluster_lsr"
+)
+sys.modules["ansible.module_utils.ha_cluster_lsr.info"] = import_module(
+    "ha_cluster_lsr.info"
+)
+
+# pylint: disable=wrong-import-position
+import ha_cluster_service_status
+
+
+class RunModule(TestCase):
+    def setUp(self) -> None:
+        module_patcher = mock.patch.object(
+            ha_cluster_service_status, "AnsibleModule"
+        )
+        self.module_mock = module_patcher.start().return_value
+        self.addCleanup(module_patcher.stop)
+        self.module_mock.params = dict(services=["pacemaker", "sbd"])
+        self.module_mock.fail_json.side_effect = SystemExit
+
+    def test_success(self) -> None:
+        self.module_mock.run_command.return_value = (
+            0,
+            "LoadState=loaded\nActiveState=active\nSubState=running\n"
+            "UnitFileState=disabled\n\n"
+            "LoadState=not-found\nActiveState=inactive\nSubState=dead\n"
+            "UnitFileState=\n",
+            "",
+        )
+        ha_cluster_service_status.run_module()
+        self.module_mock.run_command.assert_called_once_with(
+            [
+                "systemctl",
+                "show",
+                "--property=LoadState,ActiveState,SubState,UnitFileState",
+                "--",
+                "pacemaker.service",
+                "sbd.service",
+            ],
+            check_rc=False,
+            environ_update={"LC_ALL": "C"},
+        )
+        self.module_mock.exit_json.assert_called_once_with(
+            changed=False,
+            services=dict(
+                pacemaker=dict(
+                    installed=True,
+                    running=True,
+                    enabled=False,
+                    load_state="loaded",
+                    active_state="active",
+                    unit_file_state="disabled",
+                ),
+                sbd=dict(
+                    installed=False,
+                    running=False,
+                    enabled=False,
+                    load_state="not-found",
+                    active_state="inactive",
+                    unit_file_state="",
+                ),
+            ),
+        )
+
+    def test_systemctl_failed(self) -> None:
+        self.module_mock.run_command.return_value = (
+            1,
+            "",
+            "System has not been booted",
+        )
+        with self.assertRaises(SystemExit):
+            ha_cluster_service_status.run_module()
+        self.module_mock.fail_json.assert_called_once_with(
+            msg="Unable to get status of services from systemd"
+        )
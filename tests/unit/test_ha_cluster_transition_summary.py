@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+import os
+import tempfile
+from typing import List, Tuple
+from unittest import TestCase, mock
+
+import ha_cluster_transition_summary as transition
+
+CIB = """
+<cib epoch="5">
+  <configuration>
+    <crm_config>
+      <cluster_property_set id="cib-bootstrap-options">
+        <nvpair id="opt-mm" name="maintenance-mode" value="true"/>
+        <nvpair id="opt-st" name="stonith-enabled" value="false"/>
+      </cluster_property_set>
+    </crm_config>
+    <nodes/>
+    <resources/>
+    <constraints/>
+  </configuration>
+  <status/>
+</cib>
+"""
+
+STATUS = """<status><node_state id="1" uname="node1"/></status>"""
+
+GRAPH = """
+<transition_graph>
+  <synapse id="0">
+    <action_set>
+      <rsc_op id="1" operation="start" operation_key="A_start_0"
+          on_node="node1">
+        <primitive id="A" class="ocf" provider="pacemaker" type="Dummy"/>
+      </rsc_op>
+    </action_set>
+  </synapse>
+  <synapse id="1">
+    <action_set>
+      <rsc_op id="2" operation="monitor" operation_key="A_monitor_10000"
+          on_node="node1">
+        <primitive id="A" class="ocf" provider="pacemaker" type="Dummy"/>
+      </rsc_op>
+    </action_set>
+  </synapse>
+  <synapse id="2">
+    <action_set>
+      <rsc_op id="3" operation="migrate_to" operation_key="B_migrate_to_0"
+          on_node="node1">
+        <primitive id="B" class="ocf" provider="pacemaker" type="Dummy"/>
+      </rsc_op>
+    </action_set>
+  </synapse>
+  <synapse id="3">
+    <action_set>
+      <rsc_op id="4" operation="migrate_from"
+          operation_key="B_migrate_from_0" on_node="node2">
+        <primitive id="B" class="ocf" provider="pacemaker" type="Dummy"/>
+      </rsc_op>
+    </action_set>
+  </synapse>
+  <synapse id="4">
+    <action_set>
+      <rsc_op id="5" operation="stop" operation_key="C_stop_0"
+          on_node="node2">
+        <primitive id="C" class="ocf" provider="pacemaker" type="Dummy"/>
+      </rsc_op>
+    </action_set>
+  </synapse>
+  <synapse id="5">
+    <action_set>
+      <rsc_op id="6" operation="promote" operation_key="D_promote_0"
+          on_node="node2">
+        <primitive id="D" long-id="D:0" class="ocf" provider="pacemaker"
+            type="Stateful"/>
+      </rsc_op>
+    </action_set>
+  </synapse>
+  <synapse id="6">
+    <action_set>
+      <pseudo_event id="7" operation="running" operation_key="G_running_0"/>
+    </action_set>
+  </synapse>
+</transition_graph>
+"""
+
+
+class MergeLiveStatus(TestCase):
+    def test_replace_status(self) -> None:
+        merged = transition.merge_live_status(CIB, STATUS)
+        self.assertIn('<node_state id="1" uname="node1" />', merged)
+        self.assertEqual(merged.count("<status"), 1)
+        self.assertIn('name="maintenance-mode"', merged)
+
+    def test_invalid_xml(self) -> None:
+        with self.assertRaises(transition.TransitionError) as cm:
+            transition.merge_live_status("<cib>", STATUS)
+        self.assertTrue(cm.exception.msg.startswith("Unable to parse CIB"))
+
+
+class SummarizeGraph(TestCase):
+    def test_success(self) -> None:
+        self.assertEqual(
+            transition.summarize_graph(GRAPH),
+            dict(
+                actions=dict(start=1, stop=1, migrate=1, promote=1, demote=0),
+                total=4,
+                details=[
+                    "migrate B node1",
+                    "promote D node2",
+                    "start A node1",
+                    "stop C node2",
+                ],
+            ),
+        )
+
+    def test_empty_graph(self) -> None:
+        self.assertEqual(
+            transition.summarize_graph("<transition_graph/>"),
+            dict(
+                actions=dict(start=0, stop=0, migrate=0, promote=0, demote=0),
+                total=0,
+                details=[],
+            ),
+        )
+
+
+class Simulate(TestCase):
+    def setUp(self) -> None:
+        fd, self.cib_file = tempfile.mkstemp()
+        with os.fdopen(fd, "w") as cib_fd:
+            cib_fd.write(CIB)
+        self.addCleanup(os.unlink, self.cib_file)
+        self.module = mock.Mock()
+        self.commands: List[List[str]] = []
+
+    def _run_command(
+        self, cmd: List[str], **kwargs: object
+    ) -> Tuple[int, str, str]:
+        self.commands.append(cmd)
+        if cmd[0] == "cibadmin":
+            return 0, STATUS, ""
+        with open(cmd[cmd.index("--xml-file") + 1]) as sim_cib:
+            self.assertIn("node_state", sim_cib.read())
+        with open(cmd[cmd.index("--save-graph") + 1], "w") as graph:
+            graph.write(GRAPH)
+        return 0, "", ""
+
+    def test_success(self) -> None:
+        self.module.run_command.side_effect = self._run_command
+        summary = transition.simulate(self.module, self.cib_file)
+        self.assertEqual(summary["total"], 4)
+        self.assertEqual(
+            self.commands[0], ["cibadmin", "--query", "--scope", "status"]
+        )
+        self.assertEqual(self.commands[1][:2], ["crm_simulate", "--simulate"])
+        # the working directory has been removed
+        self.assertFalse(os.path.exists(os.path.dirname(self.commands[1][3])))
+
+    def test_simulate_fails(self) -> None:
+        self.module.run_command.side_effect = [
+            (0, STATUS, ""),
+            (1, "", "some error"),
+        ]
+        with self.assertRaises(transition.TransitionError) as cm:
+            transition.simulate(self.module, self.cib_file)
+        self.assertEqual(
+            cm.exception.kwargs, dict(rc="1", stdout="", stderr="some error")
+        )
+
+    def test_status_fails(self) -> None:
+        self.module.run_command.return_value = (1, "", "not running")
+        with self.assertRaises(transition.TransitionError) as cm:
+            transition.simulate(self.module, self.cib_file)
+        self.assertEqual(
+            cm.exception.msg,
+            "Command 'cibadmin --query --scope status' failed",
+        )
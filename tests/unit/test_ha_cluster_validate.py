@@ -0,0 +1,463 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+from typing import Any, Dict, List
+from unittest import TestCase, mock
+
+import ha_cluster_validate
+
+LEVEL_ERROR = "Specify 'level' 1..9 for each fencing level"
+TARGET_ERROR = (
+    "Specify exactly one of 'target', 'target_pattern', 'target_attribute' "
+    "for each fencing level"
+)
+NODE_OPTIONS_ERROR = (
+    "node_name fields in ha_cluster_node_options must be unique and they "
+    "must match cluster nodes"
+)
+PASSWORD_ERROR = "ha_cluster_hacluster_password must be specified"
+SBD_ERROR = "All nodes must have the same number of SBD devices specified"
+
+
+def _role_vars(**kwargs: Any) -> Dict[str, Any]:
+    role_vars = dict(
+        ha_cluster_pacemaker_shell="pcs",
+        ha_cluster_cluster_present=True,
+        ha_cluster_qnetd=dict(present=False),
+        ha_cluster_node_options=[],
+        ha_cluster_hacluster_password="password",
+        ha_cluster_sbd_enabled=False,
+        ha_cluster_stonith_levels=[],
+        ha_cluster_constraints_location=[],
+        ha_cluster_constraints_colocation=[],
+        ha_cluster_constraints_order=[],
+        ha_cluster_constraints_ticket=[],
+        ha_cluster_quorum={},
+        ha_cluster_pcsd_public_key_src=None,
+        ha_cluster_pcsd_private_key_src=None,
+        ha_cluster_pcsd_certificates=[],
+        ha_cluster_restart_strategy="all",
+        __ha_cluster_all_node_names=["node1", "node2"],
+        __ha_cluster_is_booted=True,
+        __ha_cluster_sbd_needs_atb=False,
+    )
+    role_vars.update(kwargs)
+    return role_vars
+
+
+class CheckClusterQnetdConsistency(TestCase):
+    def test_consistent(self) -> None:
+        self.assertEqual(
+            ha_cluster_validate.check_cluster_qnetd_consistency(True, {}), []
+        )
+        self.assertEqual(
+            ha_cluster_validate.check_cluster_qnetd_consistency(None, None), []
+        )
+
+    def test_inconsistent(self) -> None:
+        for cluster_present, qnetd in ((None, {}), (True, None)):
+            with self.subTest(cluster_present=cluster_present, qnetd=qnetd):
+                self.assertEqual(
+                    ha_cluster_validate.check_cluster_qnetd_consistency(
+                        cluster_present, qnetd
+                    ),
+                    [
+                        "Both 'ha_cluster_cluster_present' and "
+                        "'ha_cluster_qnetd' must be either defined or set to "
+                        "null"
+                    ],
+                )
+
+
+class CheckNodeOptions(TestCase):
+    def test_valid(self) -> None:
+        self.assertEqual(
+            ha_cluster_validate.check_node_options(
+                [dict(node_name="node1"), dict(node_name="node2")],
+                ["node1", "node2", "node3"],
+            ),
+            [],
+        )
+
+    def test_duplicate(self) -> None:
+        self.assertEqual(
+            ha_cluster_validate.check_node_options(
+                [dict(node_name="node1"), dict(node_name="node1")],
+                ["node1", "node2"],
+            ),
+            [NODE_OPTIONS_ERROR],
+        )
+
+    def test_unknown(self) -> None:
+        self.assertEqual(
+            ha_cluster_validate.check_node_options(
+                [dict(node_name="node3")], ["node1", "node2"]
+            ),
+            [NODE_OPTIONS_ERROR],
+        )
+
+
+class CheckSbdDevicesCount(TestCase):
+    def test_same_count(self) -> None:
+        self.assertEqual(
+            ha_cluster_validate.check_sbd_devices_count(
+                True, True, [["/dev/a"], ["/dev/b"]]
+            ),
+            [],
+        )
+
+    def test_missing_devices_count_as_empty(self) -> None:
+        self.assertEqual(
+            ha_cluster_validate.check_sbd_devices_count(True, True, [None, []]),
+            [],
+        )
+
+    def test_different_count(self) -> None:
+        self.assertEqual(
+            ha_cluster_validate.check_sbd_devices_count(
+                True, True, [["/dev/a"], None]
+            ),
+            [SBD_ERROR],
+        )
+
+    def test_sbd_disabled(self) -> None:
+        self.assertEqual(
+            ha_cluster_validate.check_sbd_devices_count(
+                True, False, [["/dev/a"], None]
+            ),
+            [],
+        )
+
+
+class CheckStonithLevels(TestCase):
+    def test_valid(self) -> None:
+        self.assertEqual(
+            ha_cluster_validate.check_stonith_levels(
+                [
+                    dict(level=1, target="node1"),
+                    dict(level="9", target_pattern="node.*"),
+                    dict(level=2, target_attribute="name=value"),
+                ]
+            ),
+            [],
+        )
+
+    def test_invalid_level(self) -> None:
+        for level in (None, 0, 10, "x"):
+            with self.subTest(level=level):
+                self.assertEqual(
+                    ha_cluster_validate.check_stonith_levels(
+                        [dict(level=level, target="node1")]
+                    ),
+                    [LEVEL_ERROR],
+                )
+
+    def test_invalid_target(self) -> None:
+        for level in (
+            dict(level=1),
+            dict(level=1, target="node1", target_pattern="node.*"),
+        ):
+            with self.subTest(level=level):
+                self.assertEqual(
+                    ha_cluster_validate.check_stonith_levels([level]),
+                    [TARGET_ERROR],
+                )
+
+    def test_not_a_dictionary(self) -> None:
+        self.assertEqual(
+            ha_cluster_validate.check_stonith_levels(["node1"]),
+            [LEVEL_ERROR, TARGET_ERROR],
+        )
+
+
+class CheckConstraints(TestCase):
+    def _check(self, **kwargs: List[Any]) -> List[str]:
+        constraints: Dict[str, List[Any]] = dict(
+            location=[], colocation=[], order=[], ticket=[]
+        )
+        constraints.update(kwargs)
+        return ha_cluster_validate.check_constraints(**constraints)
+
+    def test_valid(self) -> None:
+        resource_sets = [dict(resource_ids=["d1", "d2"])]
+        self.assertEqual(
+            self._check(
+                location=[
+                    dict(resource=dict(id="d1"), node="node1"),
+                    dict(resource=dict(pattern="d.*"), rule="#uname eq node1"),
+                ],
+                colocation=[
+                    dict(
+                        resource_follower=dict(id="d1"),
+                        resource_leader=dict(id="d2"),
+                    ),
+                    dict(resource_sets=resource_sets),
+                ],
+                order=[
+                    dict(
+                        resource_first=dict(id="d1"),
+                        resource_then=dict(id="d2"),
+                    ),
+                    dict(resource_sets=resource_sets),
+                ],
+                ticket=[
+                    dict(resource=dict(id="d1"), ticket="t1"),
+                    dict(resource_sets=resource_sets, ticket="t1"),
+                ],
+            ),
+            [],
+        )
+
+    def test_location(self) -> None:
+        constraint: Any
+        for constraint in (
+            "d1",
+            dict(node="node1"),
+            dict(resource=dict(role="Started"), node="node1"),
+            dict(resource=dict(id="d1")),
+        ):
+            with self.subTest(constraint=constraint):
+                self.assertEqual(
+                    self._check(location=[constraint]),
+                    [
+                        "Specify 'resource' with 'id' or 'pattern' and either "
+                        "'node' or 'rule' for each location constraint"
+                    ],
+                )
+
+    def test_colocation(self) -> None:
+        constraint: Any
+        for constraint in (
+            "d1",
+            dict(resource_follower=dict(id="d1")),
+            dict(resource_sets=[], resource_leader=dict(id="d2")),
+            dict(resource_sets=[dict(options=[])]),
+        ):
+            with self.subTest(constraint=constraint):
+                self.assertEqual(
+                    self._check(colocation=[constraint]),
+                    [
+                        "Specify either 'resource_sets' with 'resource_ids' or "
+                        "'resource_follower' and 'resource_leader' with 'id' "
+                        "for each colocation constraint"
+                    ],
+                )
+
+    def test_order(self) -> None:
+        self.assertEqual(
+            self._check(order=[dict(resource_then=dict(id="d2"))]),
+            [
+                "Specify either 'resource_sets' with 'resource_ids' or "
+                "'resource_first' and 'resource_then' with 'id' for each "
+                "order constraint"
+            ],
+        )
+
+    def test_ticket(self) -> None:
+        constraint: Any
+        for constraint in (
+            "t1",
+            dict(resource=dict(id="d1")),
+            dict(resource_sets=[dict(resource_ids=[])], ticket="t1"),
+        ):
+            with self.subTest(constraint=constraint):
+                self.assertEqual(
+                    self._check(ticket=[constraint]),
+                    [
+                        "Specify 'ticket' and either 'resource_sets' with "
+                        "'resource_ids' or 'resource' with 'id' for each "
+                        "ticket constraint"
+                    ],
+                )
+
+
+class CheckSbdAtb(TestCase):
+    def test_atb_disabled(self) -> None:
+        for value in ("0", 0):
+            with self.subTest(value=value):
+                self.assertEqual(
+                    ha_cluster_validate.check_sbd_atb(
+                        True,
+                        dict(
+                            options=[dict(name="auto_tie_breaker", value=value)]
+                        ),
+                    ),
+                    [
+                        "Cannot set auto_tie_breaker to disabled when SBD "
+                        "needs it to be enabled"
+                    ],
+                )
+
+    def test_atb_not_needed(self) -> None:
+        self.assertEqual(
+            ha_cluster_validate.check_sbd_atb(
+                False, dict(options=[dict(name="auto_tie_breaker", value="0")])
+            ),
+            [],
+        )
+
+
+class CheckRestartStrategy(TestCase):
+    def test_valid(self) -> None:
+        for strategy in ("all", "rolling"):
+            with self.subTest(strategy=strategy):
+                self.assertEqual(
+                    ha_cluster_validate.check_restart_strategy(strategy), []
+                )
+
+    def test_invalid(self) -> None:
+        for strategy in ("rolling_", "", None):
+            with self.subTest(strategy=strategy):
+                self.assertEqual(
+                    ha_cluster_validate.check_restart_strategy(strategy),
+                    [
+                        "ha_cluster_restart_strategy must be one of: all, "
+                        "rolling"
+                    ],
+                )
+
+
+class Validate(TestCase):
+    def test_valid(self) -> None:
+        self.assertEqual(ha_cluster_validate.validate(_role_vars(), []), [])
+
+    def test_all_errors_reported(self) -> None:
+        self.assertEqual(
+            ha_cluster_validate.validate(
+                _role_vars(
+                    ha_cluster_node_options=[dict(node_name="node3")],
+                    ha_cluster_hacluster_password="",
+                    ha_cluster_sbd_enabled=True,
+                    ha_cluster_stonith_levels=[
+                        dict(level=10),
+                        dict(level=0, target="node1"),
+                    ],
+                ),
+                [["/dev/a"], []],
+            ),
+            [
+                NODE_OPTIONS_ERROR,
+                PASSWORD_ERROR,
+                SBD_ERROR,
+                LEVEL_ERROR,
+                TARGET_ERROR,
+            ],
+        )
+
+    def test_password_not_needed_when_not_booted(self) -> None:
+        self.assertEqual(
+            ha_cluster_validate.validate(
+                _role_vars(
+                    ha_cluster_hacluster_password="",
+                    __ha_cluster_is_booted=False,
+                ),
+                [],
+            ),
+            [],
+        )
+        self.assertEqual(
+            ha_cluster_validate.validate(
+                _role_vars(
+                    ha_cluster_pacemaker_shell="crmsh",
+                    ha_cluster_hacluster_password="",
+                    __ha_cluster_is_booted=False,
+                ),
+                [],
+            ),
+            [PASSWORD_ERROR],
+        )
+
+    def test_pcs_only_checks(self) -> None:
+        order_error = (
+            "Specify either 'resource_sets' with 'resource_ids' or "
+            "'resource_first' and 'resource_then' with 'id' for each "
+            "order constraint"
+        )
+        role_vars = _role_vars(
+            ha_cluster_constraints_order=[dict(resource_first=dict(id="d1"))],
+            ha_cluster_pcsd_public_key_src="pcsd.crt",
+            ha_cluster_pcsd_private_key_src="pcsd.key",
+            ha_cluster_pcsd_certificates=[dict(name="pcsd")],
+        )
+        errors = ha_cluster_validate.validate(role_vars, [])
+        self.assertEqual(len(errors), 2)
+        self.assertIn(order_error, errors)
+        role_vars["ha_cluster_pacemaker_shell"] = "crmsh"
+        self.assertEqual(
+            ha_cluster_validate.validate(role_vars, []), [order_error]
+        )
+
+    def test_qnetd_on_cluster_node(self) -> None:
+        self.assertEqual(
+            ha_cluster_validate.validate(
+                _role_vars(ha_cluster_qnetd=dict(present=True)), []
+            ),
+            [
+                "Qnetd cannot be configured on a cluster node - "
+                "'ha_cluster_cluster_present' and 'ha_cluster_qnetd.present' "
+                "cannot be both set to true"
+            ],
+        )
+        self.assertEqual(
+            ha_cluster_validate.validate(
+                _role_vars(
+                    ha_cluster_cluster_present=False,
+                    ha_cluster_qnetd=dict(present=True),
+                ),
+                [],
+            ),
+            [],
+        )
+
+
+class ActionModuleRun(TestCase):
+    def _action(self) -> ha_cluster_validate.ActionModule:
+        templar = mock.Mock()
+        templar.template.side_effect = lambda value: value
+        return ha_cluster_validate.ActionModule(
+            task=mock.MagicMock(),
+            connection=mock.Mock(),
+            play_context=mock.Mock(),
+            loader=mock.Mock(),
+            templar=templar,
+            shared_loader_obj=mock.Mock(),
+        )
+
+    def _task_vars(self, **kwargs: Any) -> Dict[str, Any]:
+        task_vars = _role_vars(**kwargs)
+        task_vars["ansible_play_hosts"] = ["node1", "node2"]
+        task_vars["hostvars"] = dict(
+            node1=dict(__ha_cluster_local_node=dict(sbd_devices=["/dev/a"])),
+            node2=dict(__ha_cluster_local_node={}),
+        )
+        return task_vars
+
+    @mock.patch.object(ha_cluster_validate.ActionBase, "run")
+    def test_success(self, mock_run: mock.Mock) -> None:
+        mock_run.return_value = {}
+        result = self._action().run(task_vars=self._task_vars())
+        self.assertEqual(result, dict(changed=False, errors=[]))
+
+    @mock.patch.object(ha_cluster_validate.ActionBase, "run")
+    def test_errors(self, mock_run: mock.Mock) -> None:
+        mock_run.return_value = {}
+        result = self._action().run(
+            task_vars=self._task_vars(
+                ha_cluster_hacluster_password="", ha_cluster_sbd_enabled=True
+            )
+        )
+        self.assertEqual(
+            result,
+            dict(
+                changed=False,
+                failed=True,
+                errors=[PASSWORD_ERROR, SBD_ERROR],
+                msg=f"{PASSWORD_ERROR}\n{SBD_ERROR}",
+            ),
+        )
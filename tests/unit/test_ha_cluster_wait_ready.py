@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Red Hat, Inc.
+# Author: Tomas Jelinek <tojeline@redhat.com>
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+from typing import List, Tuple
+from unittest import TestCase, mock
+
+import ha_cluster_wait_ready
+
+QUORUM_OUTPUT = """\
+Quorum information
+------------------
+Date:             Mon Oct 19 10:00:00 2026
+Quorum provider:  corosync_votequorum
+Nodes:            2
+Node ID:          1
+Ring ID:          1.10
+Quorate:          Yes
+
+Votequorum information
+----------------------
+Expected votes:   3
+Highest expected: 3
+Total votes:      2
+Quorum:           2
+Flags:            Quorate
+
+Membership information
+----------------------
+    Nodeid      Votes Name
+         1          1 node1 (local)
+         2          1 node2
+"""
+
+QUORUM_OUTPUT_QDEVICE = """\
+Quorate:          No
+
+Membership information
+----------------------
+    Nodeid      Votes    Qdevice Name
+         1          1    A,V,NMW node1 (local)
+         0          1            Qdevice
+"""
+
+STATUS_XML = """
+<pacemaker-result api-version="2.30" request="crm_mon --output-as=xml">
+  <summary>
+    <current_dc present="true" name="node1" id="1"/>
+  </summary>
+  <nodes>
+    <node name="node1" id="1" online="true" type="member"/>
+    <node name="node2" id="2" online="false" type="member"/>
+  </nodes>
+</pacemaker-result>
+"""
+
+
+class ParseQuorumStatus(TestCase):
+    def test_quorate(self) -> None:
+        self.assertEqual(
+            ha_cluster_wait_ready.parse_quorum_status(QUORUM_OUTPUT),
+            (True, ["node1", "node2"]),
+        )
+
+    def test_qdevice(self) -> None:
+        self.assertEqual(
+            ha_cluster_wait_ready.parse_quorum_status(QUORUM_OUTPUT_QDEVICE),
+            (False, ["node1"]),
+        )
+
+    def test_empty(self) -> None:
+        self.assertEqual(
+            ha_cluster_wait_ready.parse_quorum_status(""), (False, [])
+        )
+
+
+class ParsePacemakerStatus(TestCase):
+    def test_dc_elected(self) -> None:
+        self.assertEqual(
+            ha_cluster_wait_ready.parse_pacemaker_status(STATUS_XML),
+            (True, ["node1"]),
+        )
+
+    def test_no_dc(self) -> None:
+        self.assertEqual(
+            ha_cluster_wait_ready.parse_pacemaker_status(
+                STATUS_XML.replace('present="true"', 'present="false"')
+            ),
+            (False, ["node1"]),
+        )
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeProbe:
+    def __init__(
+        self,
+        quorum: List[Tuple[bool, List[str]]],
+        pacemaker: List[Tuple[bool, List[str]]],
+    ) -> None:
+        self._quorum = quorum
+        self._pacemaker = pacemaker
+
+    def quorum(self) -> Tuple[bool, List[str]]:
+        return self._quorum.pop(0) if len(self._quorum) > 1 else self._quorum[0]
+
+    def pacemaker(self) -> Tuple[bool, List[str]]:
+        return (
+            self._pacemaker.pop(0)
+            if len(self._pacemaker) > 1
+            else self._pacemaker[0]
+        )
+
+
+class WaitReady(TestCase):
+    def _wait(
+        self, probe: FakeProbe, timeout: float = 10
+    ) -> Tuple[dict, List[str], FakeClock]:
+        clock = FakeClock()
+        timings, lagging = ha_cluster_wait_ready.wait_ready(
+            probe,  # type: ignore[arg-type]
+            ["node1", "node2"],
+            timeout,
+            clock=clock.clock,
+            sleep=clock.sleep,
+        )
+        return timings, lagging, clock
+
+    def test_ready_immediately(self) -> None:
+        timings, lagging, clock = self._wait(
+            FakeProbe(
+                [(True, ["node1", "node2"])], [(True, ["node1", "node2"])]
+            )
+        )
+        self.assertEqual(
+            timings, dict(quorate=0.0, dc_elected=0.0, nodes_online=0.0)
+        )
+        self.assertEqual(lagging, [])
+        self.assertEqual(clock.sleeps, [])
+
+    def test_stages(self) -> None:
+        timings, lagging, clock = self._wait(
+            FakeProbe(
+                [(False, []), (False, ["node1"]), (True, ["node1", "node2"])],
+                [
+                    (False, []),
+                    (True, ["node1"]),
+                    (True, ["node1", "node2"]),
+                ],
+            )
+        )
+        self.assertEqual(lagging, [])
+        self.assertEqual(
+            list(timings), ["quorate", "dc_elected", "nodes_online"]
+        )
+        self.assertLessEqual(timings["quorate"], timings["dc_elected"])
+        self.assertLessEqual(timings["dc_elected"], timings["nodes_online"])
+        # the interval grows while waiting and is reset on progress
+        self.assertEqual(clock.sleeps, [0.375, 0.5625, 0.25, 0.25])
+
+    def test_interval_limit(self) -> None:
+        # wokeignore:rule=dummy
+        dummy_timings, dummy_lagging, clock = self._wait(
+            FakeProbe([(False, [])], [(False, [])]), timeout=20
+        )
+        self.assertEqual(
+            max(clock.sleeps), ha_cluster_wait_ready.MAX_POLL_INTERVAL
+        )
+        self.assertEqual(clock.now, 20)
+
+    def test_timeout_quorum(self) -> None:
+        # wokeignore:rule=dummy
+        timings, lagging, dummy_clock = self._wait(
+            FakeProbe([(False, ["node1"])], [(False, [])])
+        )
+        self.assertEqual(timings, {})
+        self.assertEqual(lagging, ["node2"])
+
+    def test_timeout_nodes_online(self) -> None:
+        # wokeignore:rule=dummy
+        timings, lagging, dummy_clock = self._wait(
+            FakeProbe([(True, ["node1", "node2"])], [(True, ["node1"])])
+        )
+        self.assertEqual(timings, dict(quorate=0.0, dc_elected=0.0))
+        self.assertEqual(lagging, ["node2"])
+
+
+class RunModule(TestCase):
+    def setUp(self) -> None:
+        module_patcher = mock.patch.object(
+            ha_cluster_wait_ready, "AnsibleModule"
+        )
+        self.module_mock = module_patcher.start().return_value
+        self.addCleanup(module_patcher.stop)
+        self.module_mock.params = dict(nodes=["node1", "node2"], timeout=60)
+        self.module_mock.fail_json.side_effect = SystemExit
+
+        wait_ready_patcher = mock.patch.object(
+            ha_cluster_wait_ready, "wait_ready"
+        )
+        self.wait_ready_mock = wait_ready_patcher.start()
+        self.addCleanup(wait_ready_patcher.stop)
+
+    def test_ready(self) -> None:
+        timings = dict(quorate=1.0, dc_elected=2.0, nodes_online=3.0)
+        self.wait_ready_mock.return_value = (timings, [])
+        ha_cluster_wait_ready.run_module()
+        self.module_mock.fail_json.assert_not_called()
+        kwargs = self.module_mock.exit_json.call_args.kwargs
+        self.assertEqual(kwargs["timings"], timings)
+        self.assertFalse(kwargs["changed"])
+
+    def test_timeout(self) -> None:
+        self.wait_ready_mock.return_value = (dict(quorate=1.0), ["node2"])
+        with self.assertRaises(SystemExit):
+            ha_cluster_wait_ready.run_module()
+        kwargs = self.module_mock.fail_json.call_args.kwargs
+        self.assertEqual(
+            kwargs["msg"],
+            "Cluster did not start in 60 seconds, stage 'dc_elected' has not "
+            "been reached, lagging nodes: node2",
+        )
+        self.assertEqual(kwargs["lagging_nodes"], ["node2"])
@@ -199,34 +199,113 @@ class GetSelinuxHaClusterPorts(TestCase):
         )
 
 
-class IsServiceEnabled(TestCase):
+SERVICES_STATUS_CMD = [
+    "systemctl",
+    "show",
+    "--property=LoadState,ActiveState,SubState,UnitFileState",
+    "--",
+]
+
+
+class GetServicesStatus(TestCase):
     def setUp(self) -> None:
         self.runner_mock = mock.Mock()
 
-    def test_is_enabled(self) -> None:
-        self.runner_mock.return_value = (0, "enabled", "")
-        self.assertTrue(loader.is_service_enabled(self.runner_mock, "corosync"))
+    def test_success(self) -> None:
+        self.runner_mock.return_value = (
+            0,
+            dedent("""\
+                LoadState=loaded
+                ActiveState=active
+                SubState=running
+                UnitFileState=enabled
+
+                LoadState=loaded
+                ActiveState=inactive
+                SubState=dead
+                UnitFileState=disabled
+
+                LoadState=not-found
+                ActiveState=inactive
+                SubState=dead
+                UnitFileState=
+                """),
+            "",
+        )
+        self.assertEqual(
+            loader.get_services_status(
+                self.runner_mock, ["corosync", "sbd", "pcmk"]
+            ),
+            dict(
+                corosync=dict(
+                    installed=True,
+                    running=True,
+                    enabled=True,
+                    load_state="loaded",
+                    active_state="active",
+                    unit_file_state="enabled",
+                ),
+                sbd=dict(
+                    installed=True,
+                    running=False,
+                    enabled=False,
+                    load_state="loaded",
+                    active_state="inactive",
+                    unit_file_state="disabled",
+                ),
+                pcmk=dict(
+                    installed=False,
+                    running=False,
+                    enabled=False,
+                    load_state="not-found",
+                    active_state="inactive",
+                    unit_file_state="",
+                ),
+            ),
+        )
         self.runner_mock.assert_called_once_with(
-            ["systemctl", "is-enabled", "corosync.service"],
+            SERVICES_STATUS_CMD
+            + ["corosync.service", "sbd.service", "pcmk.service"],
             {"LC_ALL": "C"},
         )
 
-    def test_is_disabled(self) -> None:
-        self.runner_mock.return_value = (1, "disabled", "")
-        self.assertFalse(
-            loader.is_service_enabled(self.runner_mock, "pacemaker")
+    def test_static_masked(self) -> None:
+        self.runner_mock.return_value = (
+            0,
+            "LoadState=loaded\nActiveState=active\nSubState=exited\n"
+            "UnitFileState=static\n\n"
+            "LoadState=masked\nActiveState=inactive\nSubState=dead\n"
+            "UnitFileState=masked\n",
+            "",
         )
-        self.runner_mock.assert_called_once_with(
-            ["systemctl", "is-enabled", "pacemaker.service"],
-            {"LC_ALL": "C"},
+        status = loader.get_services_status(
+            self.runner_mock, ["corosync", "pacemaker"]
+        )
+        assert status is not None
+        self.assertEqual(
+            [
+                (item["installed"], item["running"], item["enabled"])
+                for item in status.values()
+            ],
+            [(True, False, True), (False, False, False)],
+        )
+
+    def test_no_services(self) -> None:
+        self.assertEqual(loader.get_services_status(self.runner_mock, []), {})
+        self.runner_mock.assert_not_called()
+
+    def test_error(self) -> None:
+        self.runner_mock.return_value = (1, "", "Failed to connect to bus")
+        self.assertIsNone(
+            loader.get_services_status(self.runner_mock, ["corosync"])
         )
 
     def test_unexpected_output(self) -> None:
-        self.runner_mock.return_value = (4, "not-found", "")
-        self.assertFalse(loader.is_service_enabled(self.runner_mock, "pcmk"))
-        self.runner_mock.assert_called_once_with(
-            ["systemctl", "is-enabled", "pcmk.service"],
-            {"LC_ALL": "C"},
+        self.runner_mock.return_value = (0, "LoadState=loaded\n", "")
+        self.assertIsNone(
+            loader.get_services_status(
+                self.runner_mock, ["corosync", "pacemaker"]
+            )
         )
 
 
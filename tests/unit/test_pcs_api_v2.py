@@ -107,3 +107,175 @@ class Pcs(TestCase):
                 "(char 0)\n'not valid json'"
             )
         )
+
+
+class PcsBatch(TestCase):
+    cmd_options = CommandOptionsDto(request_timeout=60)
+    commands = [
+        dict(cmd_name="command 1", cmd_params=dict(a="b")),
+        dict(cmd_name="command 2", cmd_params=dict()),
+        dict(cmd_name="command 3", cmd_params=dict(c="d")),
+    ]
+
+    def setUp(self) -> None:
+        self.module_mock = mock.Mock()
+        connection_patcher = mock.patch("pcs_api_v2.api_utils.ApiConnection")
+        self.connection_mock = connection_patcher.start()
+        self.addCleanup(connection_patcher.stop)
+        self.call_api_mock = (
+            self.connection_mock.return_value.__enter__.return_value.call_api
+        )
+
+    def _dto(self, index: int) -> CommandDto:
+        return CommandDto(
+            self.commands[index]["cmd_name"],
+            self.commands[index]["cmd_params"],
+            self.cmd_options,
+        )
+
+    def _api_result(self, index: int) -> pcs_api_v2.api_utils.ApiResult:
+        return pcs_api_v2.api_utils.ApiResult(
+            to_dict(fixture.task_result_dto(command=self._dto(index)))
+        )
+
+    def _result(self, index: int) -> dict:
+        return self._api_result(index).to_dict()
+
+    def test_success(self) -> None:
+        self.call_api_mock.side_effect = [
+            self._api_result(index) for index in range(3)
+        ]
+
+        pcs_api_v2.pcs_batch(
+            self.module_mock, self.commands, self.cmd_options, True
+        )
+
+        self.connection_mock.assert_called_once_with(self.module_mock)
+        self.call_api_mock.assert_has_calls(
+            [mock.call(self._dto(index)) for index in range(3)]
+        )
+        self.module_mock.exit_json.assert_called_once_with(
+            changed=True,
+            pcs_results=[
+                dict(
+                    cmd_name=f"command {index + 1}",
+                    status="success",
+                    pcs_result=self._result(index),
+                )
+                for index in range(3)
+            ],
+        )
+        self.module_mock.fail_json.assert_not_called()
+
+    def test_stop_on_error(self) -> None:
+        self.call_api_mock.side_effect = [
+            self._api_result(0),
+            pcs_api_v2.api_utils.ResponseFormatError("some error"),
+        ]
+
+        pcs_api_v2.pcs_batch(
+            self.module_mock, self.commands, self.cmd_options, True
+        )
+
+        self.assertEqual(self.call_api_mock.call_count, 2)
+        self.module_mock.exit_json.assert_not_called()
+        self.module_mock.fail_json.assert_called_once_with(
+            msg="1 of 3 commands failed",
+            changed=True,
+            pcs_results=[
+                dict(
+                    cmd_name="command 1",
+                    status="success",
+                    pcs_result=self._result(0),
+                ),
+                dict(cmd_name="command 2", status="failed", msg="some error"),
+                dict(cmd_name="command 3", status="skipped"),
+            ],
+        )
+
+    def test_continue_on_error(self) -> None:
+        self.call_api_mock.side_effect = [
+            pcs_api_v2.api_utils.ResponseFormatError("some error"),
+            self._api_result(1),
+            self._api_result(2),
+        ]
+
+        pcs_api_v2.pcs_batch(
+            self.module_mock, self.commands, self.cmd_options, False
+        )
+
+        self.assertEqual(self.call_api_mock.call_count, 3)
+        self.module_mock.exit_json.assert_not_called()
+        self.module_mock.fail_json.assert_called_once_with(
+            msg="1 of 3 commands failed",
+            changed=True,
+            pcs_results=[
+                dict(cmd_name="command 1", status="failed", msg="some error"),
+                dict(
+                    cmd_name="command 2",
+                    status="success",
+                    pcs_result=self._result(1),
+                ),
+                dict(
+                    cmd_name="command 3",
+                    status="success",
+                    pcs_result=self._result(2),
+                ),
+            ],
+        )
+
+    @mock.patch("pcs_api_v2.api_utils.run_tasks")
+    def test_parallel(self, run_tasks_mock: mock.Mock) -> None:
+        run_tasks_mock.return_value = [
+            self._api_result(0),
+            None,
+            None,
+        ]
+
+        pcs_api_v2.pcs_batch(
+            self.module_mock, self.commands, self.cmd_options, True, 2, 60
+        )
+
+        run_tasks_mock.assert_called_once_with(
+            self.connection_mock.return_value.__enter__.return_value,
+            [self._dto(index) for index in range(3)],
+            True,
+            2,
+            60,
+        )
+        self.call_api_mock.assert_not_called()
+        self.module_mock.exit_json.assert_called_once_with(
+            changed=True,
+            pcs_results=[
+                dict(
+                    cmd_name="command 1",
+                    status="success",
+                    pcs_result=self._result(0),
+                ),
+                dict(cmd_name="command 2", status="skipped"),
+                dict(cmd_name="command 3", status="skipped"),
+            ],
+        )
+
+
+class RunModule(TestCase):
+    def setUp(self) -> None:
+        module_patcher = mock.patch("pcs_api_v2.AnsibleModule")
+        self.module_mock = module_patcher.start().return_value
+        self.addCleanup(module_patcher.stop)
+        self.module_mock.fail_json.side_effect = SystemExit
+
+    @mock.patch("pcs_api_v2.pcs_batch")
+    def test_invalid_max_parallel(self, pcs_batch_mock: mock.Mock) -> None:
+        self.module_mock.params = dict(
+            commands=[dict(cmd_name="command 1", cmd_params={})],
+            stop_on_error=True,
+            max_parallel=0,
+            task_timeout=10,
+        )
+        with self.assertRaises(SystemExit):
+            pcs_api_v2.run_module()
+        self.module_mock.fail_json.assert_called_once_with(
+            msg="max_parallel must be at least 1"
+        )
+        pcs_batch_mock.assert_not_called()
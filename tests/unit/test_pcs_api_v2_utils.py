@@ -43,6 +43,7 @@ fixture_api_result_command_dict: dict[str, Any] = {
         "request_timeout": None,
     },
 }
+fixture_all_params_result = {"some": "result", "with": ["complex", "value"]}
 fixture_api_result_dict_minimal: dict[str, Any] = {
     "task_ident": "identifier",
     "command": fixture_api_result_command_dict,
@@ -53,7 +54,74 @@ fixture_api_result_dict_minimal: dict[str, Any] = {
 }
 
 
-class ReportItemToDict(TestCase):
+def all_params_dto() -> TaskResultDto:
+    return TaskResultDto(
+        task_ident="identifier",
+        command=CommandDto(
+            command_name="test-command",
+            params={"param1": "value1", "param2": "value2"},
+            options=CommandOptionsDto(
+                request_timeout=10,
+                effective_username="user",
+                effective_groups=["group1", "group2"],
+            ),
+        ),
+        reports=[
+            ReportItemDto(
+                severity=ReportItemSeverityDto(
+                    level=ReportItemSeverity.INFO,
+                    force_code=None,
+                ),
+                message=ReportItemMessageDto(
+                    code=MessageCode("CODE"),
+                    message=f"text message {i}",
+                    payload={},
+                ),
+                context=None,
+            )
+            for i in range(2)
+        ],
+        state=TaskState.FINISHED,
+        task_finish_type=TaskFinishType.KILL,
+        kill_reason=TaskKillReason.COMPLETION_TIMEOUT,
+        result=fixture_all_params_result,
+    )
+
+
+fixture_api_result_dict_all_params: dict[str, Any] = {
+    "task_ident": "identifier",
+    "command": {
+        "command_name": "test-command",
+        "params": {"param1": "value1", "param2": "value2"},
+        "options": {
+            "request_timeout": 10,
+            "effective_username": "user",
+            "effective_groups": ["group1", "group2"],
+        },
+    },
+    "task_finish_type": str(TaskFinishType.KILL),
+    "result": fixture_all_params_result,
+    "reports": [
+        {
+            "code": "CODE",
+            "force_code": None,
+            "message": f"INFO: text message {i}",
+            "node": None,
+            "payload": {},
+            "severity": "INFO",
+        }
+        for i in range(2)
+    ],
+    "kill_reason": str(TaskKillReason.COMPLETION_TIMEOUT),
+}
+
+
+class ReportToDict(TestCase):
+    def _reports(self, dto: ReportItemDto) -> list[dict[str, Any]]:
+        return pcs_api_v2_utils.ApiResult(
+            to_dict(fixture.task_result_dto(reports=[dto]))
+        ).to_dict()["reports"]
+
     def test_minimal(self) -> None:
         dto = ReportItemDto(
             severity=ReportItemSeverityDto(
@@ -68,15 +136,17 @@ class ReportItemToDict(TestCase):
             context=None,
         )
         self.assertEqual(
-            pcs_api_v2_utils.report_item_to_dict(dto),
-            {
-                "code": "CODE",
-                "force_code": None,
-                "message": "WARNING: text message",
-                "node": None,
-                "payload": {},
-                "severity": "WARNING",
-            },
+            self._reports(dto),
+            [
+                {
+                    "code": "CODE",
+                    "force_code": None,
+                    "message": "WARNING: text message",
+                    "node": None,
+                    "payload": {},
+                    "severity": "WARNING",
+                }
+            ],
         )
 
     def test_all_params(self) -> None:
@@ -94,89 +164,49 @@ class ReportItemToDict(TestCase):
             context=ReportItemContextDto(node="node1"),
         )
         self.assertEqual(
-            pcs_api_v2_utils.report_item_to_dict(dto),
-            {
-                "code": "CODE",
-                "force_code": "FORCE",
-                "message": "ERROR: node1: text message",
-                "node": "node1",
-                "payload": payload,
-                "severity": "ERROR",
-            },
+            self._reports(dto),
+            [
+                {
+                    "code": "CODE",
+                    "force_code": "FORCE",
+                    "message": "ERROR: node1: text message",
+                    "node": "node1",
+                    "payload": payload,
+                    "severity": "ERROR",
+                }
+            ],
         )
 
 
-class ApiResultToDict(TestCase):
+class ApiResult(TestCase):
     maxDiff = None
 
     def test_minimal(self) -> None:
-        self.assertEqual(
-            pcs_api_v2_utils.api_result_to_dict(fixture.task_result_dto()),
-            fixture_api_result_dict_minimal,
+        api_result = pcs_api_v2_utils.ApiResult(
+            to_dict(fixture.task_result_dto())
         )
+        self.assertEqual(api_result.to_dict(), fixture_api_result_dict_minimal)
+        self.assertEqual(api_result.to_dto(), fixture.task_result_dto())
 
     def test_all_params(self) -> None:
-        result = {"some": "result", "with": ["complex", "value"]}
-        dto = TaskResultDto(
-            task_ident="identifier",
-            command=CommandDto(
-                command_name="test-command",
-                params={"param1": "value1", "param2": "value2"},
-                options=CommandOptionsDto(
-                    request_timeout=10,
-                    effective_username="user",
-                    effective_groups=["group1", "group2"],
-                ),
-            ),
-            reports=[
-                ReportItemDto(
-                    severity=ReportItemSeverityDto(
-                        level=ReportItemSeverity.INFO,
-                        force_code=None,
-                    ),
-                    message=ReportItemMessageDto(
-                        code=MessageCode("CODE"),
-                        message=f"text message {i}",
-                        payload={},
-                    ),
-                    context=None,
-                )
-                for i in range(2)
-            ],
-            state=TaskState.FINISHED,
-            task_finish_type=TaskFinishType.KILL,
-            kill_reason=TaskKillReason.COMPLETION_TIMEOUT,
-            result=result,
+        api_result = pcs_api_v2_utils.ApiResult(to_dict(all_params_dto()))
+        self.assertEqual(api_result.task_ident, "identifier")
+        self.assertEqual(api_result.state, TaskState.FINISHED)
+        self.assertEqual(api_result.task_finish_type, TaskFinishType.KILL)
+        self.assertEqual(
+            api_result.kill_reason, TaskKillReason.COMPLETION_TIMEOUT
         )
+        self.assertEqual(api_result.error_messages, [])
         self.assertEqual(
-            pcs_api_v2_utils.api_result_to_dict(dto),
-            {
-                "task_ident": "identifier",
-                "command": {
-                    "command_name": "test-command",
-                    "params": {"param1": "value1", "param2": "value2"},
-                    "options": {
-                        "request_timeout": 10,
-                        "effective_username": "user",
-                        "effective_groups": ["group1", "group2"],
-                    },
-                },
-                "task_finish_type": str(TaskFinishType.KILL),
-                "result": result,
-                "reports": [
-                    {
-                        "code": "CODE",
-                        "force_code": None,
-                        "message": f"INFO: text message {i}",
-                        "node": None,
-                        "payload": {},
-                        "severity": "INFO",
-                    }
-                    for i in range(2)
-                ],
-                "kill_reason": str(TaskKillReason.COMPLETION_TIMEOUT),
-            },
+            api_result.to_dict(), fixture_api_result_dict_all_params
         )
+        self.assertEqual(api_result.to_dto(), all_params_dto())
+
+    def test_bad_enum_value(self) -> None:
+        data = to_dict(fixture.task_result_dto())
+        data["task_finish_type"] = "unknown"
+        with self.assertRaises(ValueError):
+            pcs_api_v2_utils.ApiResult(data)
 
 
 class ParseApiResponse(TestCase):
@@ -190,7 +220,7 @@ class ParseApiResponse(TestCase):
         result = pcs_api_v2_utils.parse_api_response(
             self.module, json.dumps(to_dict(fixture.task_result_dto())).encode()
         )
-        self.assertEqual(result, fixture.task_result_dto())
+        self.assertEqual(result.to_dto(), fixture.task_result_dto())
 
     def test_response_not_json(self) -> None:
         with self.assertRaises(pcs_api_v2_utils.ResponseFormatError) as context:
@@ -381,3 +411,236 @@ class ParseApiResponse(TestCase):
                 kill_reason=None,
             ),
         )
+
+
+class ApiConnection(TestCase):
+    def setUp(self) -> None:
+        self.module = mock.Mock()
+        self.module.from_json = json.loads
+        self.module.jsonify = json.dumps
+        connection_patcher = mock.patch(
+            "ha_cluster_lsr.pcs_api_v2_utils._UnixSocketHTTPConnection"
+        )
+        self.connection_class = connection_patcher.start()
+        self.addCleanup(connection_patcher.stop)
+        self.connection = self.connection_class.return_value
+
+    @staticmethod
+    def _response(status: int, data: bytes) -> mock.Mock:
+        response = mock.Mock(status=status, will_close=False)
+        response.read.return_value = data
+        return response
+
+    def test_keep_alive(self) -> None:
+        data = json.dumps(to_dict(fixture.task_result_dto())).encode()
+        self.connection.getresponse.side_effect = [
+            self._response(200, data),
+            self._response(200, data),
+        ]
+        with pcs_api_v2_utils.ApiConnection(self.module) as connection:
+            for _ in range(2):
+                self.assertEqual(
+                    connection.call_api(
+                        fixture.task_result_dto().command
+                    ).to_dto(),
+                    fixture.task_result_dto(),
+                )
+        self.connection_class.assert_called_once_with(
+            pcs_api_v2_utils.PCSD_SOCKET, pcs_api_v2_utils.API_TIMEOUT
+        )
+        self.assertEqual(self.connection.request.call_count, 2)
+        self.connection.request.assert_called_with(
+            "POST",
+            pcs_api_v2_utils.API_PATH,
+            body=json.dumps(to_dict(fixture.task_result_dto().command)),
+            headers={
+                "Content-Type": "application/json",
+                "Connection": "keep-alive",
+            },
+        )
+        self.connection.close.assert_called_once_with()
+
+    def test_resend_on_closed_connection(self) -> None:
+        data = json.dumps(to_dict(fixture.task_result_dto())).encode()
+        self.connection.getresponse.side_effect = [
+            self._response(200, data),
+            ConnectionResetError(),
+            self._response(200, data),
+        ]
+        connection = pcs_api_v2_utils.ApiConnection(self.module)
+        for _ in range(2):
+            connection.call_api(fixture.task_result_dto().command)
+        self.assertEqual(self.connection.request.call_count, 3)
+
+    def test_connection_error(self) -> None:
+        self.connection.request.side_effect = FileNotFoundError(
+            "No such file or directory"
+        )
+        connection = pcs_api_v2_utils.ApiConnection(self.module)
+        with self.assertRaises(pcs_api_v2_utils.ResponseFormatError) as context:
+            connection.call_api(fixture.task_result_dto().command)
+        self.assertEqual(
+            context.exception.msg,
+            "Unable to communicate with pcsd: No such file or directory",
+        )
+        self.assertEqual(self.connection.request.call_count, 1)
+
+    def test_http_error(self) -> None:
+        self.connection.getresponse.return_value = self._response(
+            404, b"some body data"
+        )
+        connection = pcs_api_v2_utils.ApiConnection(self.module)
+        with self.assertRaises(pcs_api_v2_utils.ResponseFormatError) as context:
+            connection.call_api(fixture.task_result_dto().command)
+        self.assertEqual(context.exception.msg, "some body data")
+
+    def test_create_task(self) -> None:
+        self.connection.getresponse.return_value = self._response(
+            200, b'{"task_ident": "task1"}'
+        )
+        connection = pcs_api_v2_utils.ApiConnection(self.module)
+        self.assertEqual(
+            connection.create_task(fixture.task_result_dto().command), "task1"
+        )
+        self.connection.request.assert_called_once_with(
+            "POST",
+            pcs_api_v2_utils.API_CREATE_PATH,
+            body=json.dumps(to_dict(fixture.task_result_dto().command)),
+            headers={
+                "Content-Type": "application/json",
+                "Connection": "keep-alive",
+            },
+        )
+
+    def test_get_task_result(self) -> None:
+        dto = fixture.task_result_dto(state=TaskState.EXECUTED)
+        self.connection.getresponse.return_value = self._response(
+            200, json.dumps(to_dict(dto)).encode()
+        )
+        connection = pcs_api_v2_utils.ApiConnection(self.module)
+        self.assertEqual(connection.get_task_result("task 1").to_dto(), dto)
+        self.connection.request.assert_called_once_with(
+            "GET",
+            f"{pcs_api_v2_utils.API_RESULT_PATH}?task_ident=task+1",
+            body=None,
+            headers={"Connection": "keep-alive"},
+        )
+
+    def test_kill_task(self) -> None:
+        self.connection.getresponse.return_value = self._response(200, b"")
+        connection = pcs_api_v2_utils.ApiConnection(self.module)
+        connection.kill_task("task1")
+        self.connection.request.assert_called_once_with(
+            "POST",
+            pcs_api_v2_utils.API_KILL_PATH,
+            body='{"task_ident": "task1"}',
+            headers={
+                "Content-Type": "application/json",
+                "Connection": "keep-alive",
+            },
+        )
+
+
+class FakeTasks:
+    """
+    Fake pcsd running asynchronous tasks, the command name is the number of
+    seconds the task runs
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.created: dict[str, float] = {}
+        self.killed: list[str] = []
+        self.max_running = 0
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+    def _finished(self, task_ident: str) -> bool:
+        return task_ident in self.killed or self.now - self.created[
+            task_ident
+        ] >= float(task_ident)
+
+    def create_task(self, api_command: CommandDto) -> str:
+        if api_command.command_name == "error":
+            raise pcs_api_v2_utils.ResponseFormatError("create failed")
+        self.created[api_command.command_name] = self.now
+        self.max_running = max(
+            self.max_running,
+            len([task for task in self.created if not self._finished(task)]),
+        )
+        return api_command.command_name
+
+    def get_task_result(self, task_ident: str) -> pcs_api_v2_utils.ApiResult:
+        if not self._finished(task_ident):
+            dto = fixture.task_result_dto(state=TaskState.EXECUTED)
+        elif task_ident in self.killed:
+            dto = fixture.task_result_dto(
+                finish_type=TaskFinishType.KILL,
+                kill_reason=TaskKillReason.USER,
+            )
+        else:
+            dto = fixture.task_result_dto(result=task_ident)
+        return pcs_api_v2_utils.ApiResult(to_dict(dto))
+
+    def kill_task(self, task_ident: str) -> None:
+        self.killed.append(task_ident)
+
+
+class RunTasks(TestCase):
+    def setUp(self) -> None:
+        self.tasks = FakeTasks()
+
+    def _run(
+        self, durations: list[str], stop_on_error: bool = True, **kwargs: Any
+    ) -> list[Any]:
+        return pcs_api_v2_utils.run_tasks(
+            self.tasks,  # type: ignore[arg-type]
+            [
+                CommandDto(duration, {}, CommandOptionsDto())
+                for duration in durations
+            ],
+            stop_on_error,
+            clock=self.tasks.clock,
+            sleep=self.tasks.sleep,
+            **kwargs,
+        )
+
+    def test_parallel(self) -> None:
+        outcomes = self._run(["1", "5", "1", "1"], max_parallel=2)
+        self.assertEqual(
+            [outcome.result for outcome in outcomes], ["1", "5", "1", "1"]
+        )
+        self.assertEqual(self.tasks.max_running, 2)
+        self.assertLess(self.tasks.now, 8)
+
+    def test_timeout(self) -> None:
+        outcomes = self._run(["1", "100"], max_parallel=2, timeout=10)
+        self.assertEqual(outcomes[0].result, "1")
+        self.assertIsInstance(outcomes[1], pcs_api_v2_utils.TaskFailedError)
+        self.assertEqual(outcomes[1].msg, "Task processing timed out")
+        self.assertEqual(self.tasks.killed, ["100"])
+
+    def test_invalid_max_parallel(self) -> None:
+        for max_parallel in (0, -1):
+            with self.subTest(max_parallel=max_parallel):
+                with self.assertRaises(ValueError):
+                    self._run(["1"], max_parallel=max_parallel, timeout=10)
+        self.assertEqual(self.tasks.created, {})
+
+    def test_stop_on_error(self) -> None:
+        outcomes = self._run(["5", "error", "1"], max_parallel=2)
+        self.assertEqual(outcomes[0].result, "5")
+        self.assertEqual(outcomes[1].msg, "create failed")
+        self.assertIsNone(outcomes[2])
+
+    def test_continue_on_error(self) -> None:
+        outcomes = self._run(
+            ["5", "error", "1"], stop_on_error=False, max_parallel=2
+        )
+        self.assertEqual(outcomes[0].result, "5")
+        self.assertEqual(outcomes[1].msg, "create failed")
+        self.assertEqual(outcomes[2].result, "1")
@@ -17,12 +17,18 @@ sys.modules["ansible.module_utils.ha_cluster_lsr"] = import_module(
 )
 
 import pcs_qdevice_certs
-from pcs.common.async_tasks.dto import CommandDto, CommandOptionsDto
+from pcs.common.async_tasks.dto import (
+    CommandDto,
+    CommandOptionsDto,
+    TaskResultDto,
+)
 from pcs.common.async_tasks.types import TaskFinishType
 from pcs.common.interface.dto import to_dict
 
 from . import fixture
 
+api_utils = pcs_qdevice_certs.api_utils
+
 
 class Pcs(TestCase):
     qnetd_host = "node-q"
@@ -43,27 +49,28 @@ class Pcs(TestCase):
         self.module_mock.from_json = json.loads
         self.module_mock.check_mode = False
 
-        call_api_patcher = mock.patch("pcs_api_v2.api_utils.call_api_raw")
-        self.call_api_mock = call_api_patcher.start()
-        self.addCleanup(call_api_patcher.stop)
+        connection_patcher = mock.patch(
+            "pcs_qdevice_certs.api_utils.ApiConnection"
+        )
+        self.connection_mock = connection_patcher.start()
+        self.addCleanup(connection_patcher.stop)
+        self.call_api_mock = (
+            self.connection_mock.return_value.__enter__.return_value.call_api
+        )
+
+    def set_responses(self, *dtos: TaskResultDto) -> None:
+        responses = iter(dtos)
+        self.call_api_mock.side_effect = (
+            lambda api_command: api_utils.check_api_result(
+                api_utils.ApiResult(to_dict(next(responses)))
+            )
+        )
 
     def test_success_setup(self) -> None:
-        self.call_api_mock.side_effect = [
-            (
-                fixture.response_from_dto(
-                    fixture.task_result_dto(
-                        result=False, command=self.cmd_check_dto
-                    )
-                ),
-                dict(status=200, body="some body data"),
-            ),
-            (
-                fixture.response_from_dto(
-                    fixture.task_result_dto(command=self.cmd_setup_dto)
-                ),
-                dict(status=200, body="some body data"),
-            ),
-        ]
+        self.set_responses(
+            fixture.task_result_dto(result=False, command=self.cmd_check_dto),
+            fixture.task_result_dto(command=self.cmd_setup_dto),
+        )
 
         pcs_qdevice_certs.pcs(
             self.module_mock, self.cmd_params, self.cmd_options
@@ -71,8 +78,8 @@ class Pcs(TestCase):
 
         self.call_api_mock.assert_has_calls(
             [
-                mock.call(self.module_mock, self.cmd_check_dto),
-                mock.call(self.module_mock, self.cmd_setup_dto),
+                mock.call(self.cmd_check_dto),
+                mock.call(self.cmd_setup_dto),
             ]
         )
         self.module_mock.exit_json.assert_called_once_with(
@@ -93,23 +100,18 @@ class Pcs(TestCase):
         self.module_mock.fail_json.assert_not_called()
 
     def assert_check_call_only(self, certs_already_configured: bool) -> None:
-        self.call_api_mock.return_value = (
-            fixture.response_from_dto(
-                fixture.task_result_dto(
-                    result=certs_already_configured,
-                    command=self.cmd_check_dto,
-                )
-            ),
-            dict(status=200, body="some body data"),
+        self.set_responses(
+            fixture.task_result_dto(
+                result=certs_already_configured,
+                command=self.cmd_check_dto,
+            )
         )
 
         pcs_qdevice_certs.pcs(
             self.module_mock, self.cmd_params, self.cmd_options
         )
 
-        self.call_api_mock.assert_called_once_with(
-            self.module_mock, self.cmd_check_dto
-        )
+        self.call_api_mock.assert_called_once_with(self.cmd_check_dto)
         self.module_mock.exit_json.assert_called_once_with(
             changed=not certs_already_configured,
             pcs_result=dict(
@@ -139,23 +141,18 @@ class Pcs(TestCase):
         self.assert_check_call_only(False)
 
     def test_error_check(self) -> None:
-        self.call_api_mock.return_value = (
-            fixture.response_from_dto(
-                fixture.task_result_dto(
-                    result=None,
-                    finish_type=TaskFinishType.UNHANDLED_EXCEPTION,
-                    command=self.cmd_check_dto,
-                )
-            ),
-            dict(status=200, body="some body data"),
+        self.set_responses(
+            fixture.task_result_dto(
+                result=None,
+                finish_type=TaskFinishType.UNHANDLED_EXCEPTION,
+                command=self.cmd_check_dto,
+            )
         )
 
         pcs_qdevice_certs.pcs(
             self.module_mock, self.cmd_params, self.cmd_options
         )
-        self.call_api_mock.assert_called_once_with(
-            self.module_mock, self.cmd_check_dto
-        )
+        self.call_api_mock.assert_called_once_with(self.cmd_check_dto)
         self.module_mock.exit_json.assert_not_called()
         self.module_mock.fail_json.assert_called_once_with(
             msg="Unhandled exception",
@@ -175,26 +172,14 @@ class Pcs(TestCase):
         )
 
     def test_error_setup(self) -> None:
-        self.call_api_mock.side_effect = [
-            (
-                fixture.response_from_dto(
-                    fixture.task_result_dto(
-                        result=False, command=self.cmd_check_dto
-                    )
-                ),
-                dict(status=200, body="some body data"),
-            ),
-            (
-                fixture.response_from_dto(
-                    fixture.task_result_dto(
-                        result=None,
-                        finish_type=TaskFinishType.UNHANDLED_EXCEPTION,
-                        command=self.cmd_setup_dto,
-                    )
-                ),
-                dict(status=200, body="some body data"),
+        self.set_responses(
+            fixture.task_result_dto(result=False, command=self.cmd_check_dto),
+            fixture.task_result_dto(
+                result=None,
+                finish_type=TaskFinishType.UNHANDLED_EXCEPTION,
+                command=self.cmd_setup_dto,
             ),
-        ]
+        )
 
         pcs_qdevice_certs.pcs(
             self.module_mock, self.cmd_params, self.cmd_options
@@ -202,8 +187,8 @@ class Pcs(TestCase):
 
         self.call_api_mock.assert_has_calls(
             [
-                mock.call(self.module_mock, self.cmd_check_dto),
-                mock.call(self.module_mock, self.cmd_setup_dto),
+                mock.call(self.cmd_check_dto),
+                mock.call(self.cmd_setup_dto),
             ]
         )
         self.module_mock.exit_json.assert_not_called()
@@ -223,3 +208,103 @@ class Pcs(TestCase):
                 kill_reason=None,
             ),
         )
+
+
+class PcsClusters(TestCase):
+    cmd_options = CommandOptionsDto()
+    clusters = [
+        dict(qnetd_host="node-q", cluster_name="cluster1"),
+        dict(qnetd_host="node-q", cluster_name="cluster2"),
+        dict(qnetd_host="node-q", cluster_name="cluster3"),
+    ]
+
+    def setUp(self) -> None:
+        self.module_mock = mock.Mock()
+        self.module_mock.check_mode = False
+
+        connection_patcher = mock.patch(
+            "pcs_qdevice_certs.api_utils.ApiConnection"
+        )
+        self.connection_mock = connection_patcher.start()
+        self.addCleanup(connection_patcher.stop)
+        self.call_api_mock = (
+            self.connection_mock.return_value.__enter__.return_value.call_api
+        )
+        # cluster1: certificates present, cluster2: set up, cluster3: error
+        self.call_api_mock.side_effect = self.call_api
+
+    @staticmethod
+    def call_api(
+        api_command: CommandDto,
+    ) -> "pcs_qdevice_certs.api_utils.ApiResult":
+        cluster_name = api_command.params["cluster_name"]
+        if api_command.command_name.endswith("_check_local"):
+            dto = fixture.task_result_dto(
+                result=cluster_name == "cluster1", command=api_command
+            )
+        elif cluster_name == "cluster3":
+            raise api_utils.ResponseFormatError("some error")
+        else:
+            dto = fixture.task_result_dto(command=api_command)
+        return api_utils.ApiResult(to_dict(dto))
+
+    def test_clusters(self) -> None:
+        pcs_qdevice_certs.pcs_clusters(
+            self.module_mock, self.clusters, self.cmd_options
+        )
+
+        self.assertEqual(self.connection_mock.call_count, 3)
+        self.assertEqual(
+            [
+                (
+                    call.args[0].params["cluster_name"],
+                    call.args[0].command_name,
+                )
+                for call in self.call_api_mock.call_args_list
+            ],
+            [
+                ("cluster1", "quorum.device_net_certificate_check_local"),
+                ("cluster2", "quorum.device_net_certificate_check_local"),
+                ("cluster2", "quorum.device_net_certificate_setup_local"),
+                ("cluster3", "quorum.device_net_certificate_check_local"),
+                ("cluster3", "quorum.device_net_certificate_setup_local"),
+            ],
+        )
+        self.module_mock.exit_json.assert_not_called()
+        kwargs = self.module_mock.fail_json.call_args.kwargs
+        self.assertEqual(
+            kwargs["msg"],
+            "Unable to set up qdevice certificates for clusters: cluster3",
+        )
+        self.assertTrue(kwargs["changed"])
+        self.assertEqual(
+            [
+                (
+                    result["cluster_name"],
+                    result["changed"],
+                    result["failed"],
+                    result.get("msg"),
+                )
+                for result in kwargs["results"]
+            ],
+            [
+                ("cluster1", False, False, None),
+                ("cluster2", True, False, None),
+                ("cluster3", True, True, "some error"),
+            ],
+        )
+
+    def test_check_mode(self) -> None:
+        self.module_mock.check_mode = True
+        pcs_qdevice_certs.pcs_clusters(
+            self.module_mock, self.clusters, self.cmd_options
+        )
+
+        self.assertEqual(self.call_api_mock.call_count, 3)
+        self.module_mock.fail_json.assert_not_called()
+        kwargs = self.module_mock.exit_json.call_args.kwargs
+        self.assertTrue(kwargs["changed"])
+        self.assertEqual(
+            [result["changed"] for result in kwargs["results"]],
+            [False, True, True],
+        )
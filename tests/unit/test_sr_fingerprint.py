@@ -8,6 +8,7 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import errno
 import json
 import os
 import re
@@ -159,6 +160,42 @@ class TestSrFingerprint(unittest.TestCase):
         finally:
             _cleanup_log(log_file)
 
+    def test_write_jsonl_log_without_lock_when_not_trimming(self):
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".jsonl") as tmp:
+            log_file = tmp.name
+
+        try:
+            record = _sample_fingerprint_record()
+            for _i in range(3):
+                sr_fingerprint._write_jsonl_log(log_file, record, max_size=2000000)
+
+            with open(log_file, "r") as log_fd:
+                lines = log_fd.read().splitlines()
+
+            self.assertEqual(len(lines), 3)
+            self.assertFalse(os.path.exists(log_file + ".lock"))
+        finally:
+            _cleanup_log(log_file)
+
+    def test_write_jsonl_log_long_record_takes_lock(self):
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".jsonl") as tmp:
+            log_file = tmp.name
+
+        try:
+            record = dict(
+                _sample_fingerprint_record(),
+                role_path="x" * sr_fingerprint.LOG_ATOMIC_WRITE_SIZE,
+            )
+            sr_fingerprint._write_jsonl_log(log_file, record)
+
+            with open(log_file, "r") as log_fd:
+                parsed = json.loads(log_fd.readline())
+
+            self.assertEqual(parsed, record)
+            self.assertTrue(os.path.exists(log_file + ".lock"))
+        finally:
+            _cleanup_log(log_file)
+
     def test_write_jsonl_log_creates_parent_dir(self):
         tmpdir = tempfile.mkdtemp()
         log_file = os.path.join(tmpdir, "subdir", "fingerprint.jsonl")
@@ -211,10 +248,12 @@ class TestSrFingerprint(unittest.TestCase):
             with open(log_file, "r") as log_fd:
                 lines = log_fd.read().splitlines()
 
-            self.assertEqual(len(lines), 5)
+            # The file is trimmed to 3 records when writing role_5 and
+            # role_8, so it is not trimmed on every write.
+            self.assertEqual(len(lines), 4)
             first = json.loads(lines[0])
             last = json.loads(lines[-1])
-            self.assertEqual(first["role_name"], "role_5")
+            self.assertEqual(first["role_name"], "role_6")
             self.assertEqual(last["role_name"], "role_9")
         finally:
             _cleanup_log(log_file)
@@ -242,7 +281,8 @@ class TestSrFingerprint(unittest.TestCase):
             self.assertEqual(len(initial_lines), n_initial)
 
             # New record larger than one existing line (up to two) via a very
-            # long role_path, so trim removes exactly two oldest records.
+            # long role_path, so trim removes three oldest records to get the
+            # file below the low water mark.
             base_record = dict(record, role_name="role_long", role_path="")
             base_size = len(
                 sr_fingerprint._format_fingerprint_jsonl(base_record) + "\n"
@@ -260,11 +300,11 @@ class TestSrFingerprint(unittest.TestCase):
             with open(log_file, "r") as log_fd:
                 lines = log_fd.read().splitlines()
 
-            # Exactly two oldest records removed; new record appended.
-            self.assertEqual(len(lines), n_initial - 2 + 1)
+            # Exactly three oldest records removed; new record appended.
+            self.assertEqual(len(lines), n_initial - 3 + 1)
             parsed = [json.loads(line) for line in lines]
             role_names = [entry["role_name"] for entry in parsed]
-            self.assertEqual(role_names, ["role_2", "role_3", "role_long"])
+            self.assertEqual(role_names, ["role_3", "role_long"])
             self.assertEqual(parsed[-1], long_record)
             self.assertEqual(parsed[-1]["role_path"], long_path)
             self.assertNotIn("role_0", role_names)
@@ -272,6 +312,121 @@ class TestSrFingerprint(unittest.TestCase):
         finally:
             _cleanup_log(log_file)
 
+    def test_trim_to_low_water_mark(self):
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".jsonl") as tmp:
+            log_file = tmp.name
+
+        try:
+            record = _sample_fingerprint_record()
+            line_size = len(sr_fingerprint._format_fingerprint_jsonl(record) + "\n")
+            max_size = line_size * 100
+            for _i in range(101):
+                sr_fingerprint._write_jsonl_log(log_file, record, max_size=max_size)
+
+            size = os.path.getsize(log_file)
+            self.assertLessEqual(size, max_size * sr_fingerprint.LOG_TRIM_RATIO)
+            self.assertEqual(size % line_size, 0)
+        finally:
+            _cleanup_log(log_file)
+
+    def test_rotate_keeps_segments(self):
+        tmpdir = tempfile.mkdtemp()
+        log_file = os.path.join(tmpdir, "fingerprint.jsonl")
+
+        try:
+            record = _sample_fingerprint_record()
+            line_size = len(
+                sr_fingerprint._format_fingerprint_jsonl(
+                    dict(record, role_name="role_0")
+                )
+                + "\n"
+            )
+            for _i in range(10):
+                sr_fingerprint._write_jsonl_log(
+                    log_file,
+                    dict(record, role_name="role_%d" % _i),
+                    max_size=line_size * 2,
+                    segments=2,
+                )
+
+            self.assertEqual(
+                sorted(os.listdir(tmpdir)),
+                [
+                    "fingerprint.jsonl",
+                    "fingerprint.jsonl.1",
+                    "fingerprint.jsonl.2",
+                    "fingerprint.jsonl.lock",
+                ],
+            )
+            role_names = []
+            for path in (log_file + ".2", log_file + ".1", log_file):
+                with open(path, "r") as log_fd:
+                    role_names.extend(
+                        json.loads(line)["role_name"]
+                        for line in log_fd.read().splitlines()
+                    )
+            self.assertEqual(role_names, ["role_%d" % _i for _i in range(4, 10)])
+        finally:
+            for name in os.listdir(tmpdir):
+                os.unlink(os.path.join(tmpdir, name))
+            os.rmdir(tmpdir)
+
+    def test_rotate_fewer_segments_than_allowed(self):
+        tmpdir = tempfile.mkdtemp()
+        log_file = os.path.join(tmpdir, "fingerprint.jsonl")
+
+        try:
+            with open(log_file, "w") as log_fd:
+                log_fd.write("old\n")
+            sr_fingerprint._rotate_log_file(log_file, 5)
+
+            self.assertEqual(os.listdir(tmpdir), ["fingerprint.jsonl.1"])
+            with open(log_file + ".1", "r") as log_fd:
+                self.assertEqual(log_fd.read(), "old\n")
+        finally:
+            for name in os.listdir(tmpdir):
+                os.unlink(os.path.join(tmpdir, name))
+            os.rmdir(tmpdir)
+
+    def test_find_trim_offset(self):
+        with tempfile.TemporaryFile() as log_fd:
+            log_fd.write(b"a\n" + b"b" * 100 + b"\nc\n")
+            self.assertEqual(sr_fingerprint._find_trim_offset(log_fd, 0), 0)
+            self.assertEqual(sr_fingerprint._find_trim_offset(log_fd, 1), 2)
+            self.assertEqual(sr_fingerprint._find_trim_offset(log_fd, 2), 2)
+            self.assertEqual(sr_fingerprint._find_trim_offset(log_fd, 3), 103)
+            self.assertEqual(sr_fingerprint._find_trim_offset(log_fd, 104), 105)
+            # the caller limits the offset to the file size
+            self.assertGreaterEqual(sr_fingerprint._find_trim_offset(log_fd, 200), 105)
+
+    def test_find_trim_offset_long_line(self):
+        with tempfile.TemporaryFile() as log_fd:
+            long_line = b"x" * (sr_fingerprint.LOG_CHUNK_SIZE * 2 + 10) + b"\n"
+            log_fd.write(long_line + b"y\n")
+            self.assertEqual(
+                sr_fingerprint._find_trim_offset(log_fd, 5), len(long_line)
+            )
+
+    def test_copy_file_range_without_sendfile(self):
+        original = getattr(sr_fingerprint.os, "sendfile", None)
+
+        def _sendfile_unsupported(*args):
+            raise OSError(errno.EINVAL, "Invalid argument")
+
+        with tempfile.TemporaryFile() as src, tempfile.TemporaryFile() as dst:
+            src.write(b"0123456789" * 10000)
+            src.flush()
+            sr_fingerprint.os.sendfile = _sendfile_unsupported
+            try:
+                sr_fingerprint._copy_file_range(src.fileno(), dst.fileno(), 5, 99990)
+            finally:
+                if original is None:
+                    del sr_fingerprint.os.sendfile
+                else:
+                    sr_fingerprint.os.sendfile = original
+            dst.seek(0)
+            self.assertEqual(dst.read(), (b"0123456789" * 10000)[5:99995])
+
     def test_trim_disabled_when_zero(self):
         with tempfile.NamedTemporaryFile(delete=False, suffix=".jsonl") as tmp:
             log_file = tmp.name
@@ -310,6 +465,9 @@ class TestSrFingerprint(unittest.TestCase):
                 "status": "begin",
                 "write_log_file": False,
                 "max_log_size": 2000000,
+                "log_segments": 0,
+                "phases": {},
+                "state_dir": tempfile.gettempdir(),
                 "role_name": "systemd",
                 "role_path": "/usr/share/ansible/roles/linux-system-roles.systemd",
                 "ansible_play_hosts_all": ["host1"],
@@ -334,6 +492,9 @@ class TestSrFingerprint(unittest.TestCase):
                 "write_log_file": True,
                 "log_file": log_path,
                 "max_log_size": 2000000,
+                "log_segments": 0,
+                "phases": {},
+                "state_dir": tempfile.gettempdir(),
                 "role_name": "systemd",
                 "role_path": "/usr/share/ansible/roles/linux-system-roles.systemd",
                 "ansible_play_hosts_all": ["host1"],
@@ -358,6 +519,9 @@ class TestSrFingerprint(unittest.TestCase):
                 "write_log_file": True,
                 "log_file": log_path,
                 "max_log_size": 2000000,
+                "log_segments": 0,
+                "phases": {},
+                "state_dir": tempfile.gettempdir(),
                 "role_name": "systemd",
                 "role_path": "/usr/share/ansible/roles/linux-system-roles.systemd",
                 "ansible_play_hosts_all": ["host1"],
@@ -387,6 +551,9 @@ class TestSrFingerprint(unittest.TestCase):
                 "status": "begin",
                 "write_log_file": False,
                 "max_log_size": -1,
+                "log_segments": 0,
+                "phases": {},
+                "state_dir": tempfile.gettempdir(),
                 "role_name": "systemd",
                 "role_path": "/usr/share/ansible/roles/linux-system-roles.systemd",
                 "ansible_play_hosts_all": ["host1"],
@@ -402,6 +569,95 @@ class TestSrFingerprint(unittest.TestCase):
             ctx.exception.kwargs["msg"],
         )
 
+    def test_handle_fingerprint_rejects_negative_log_segments(self):
+        module = _FakeModule(
+            {
+                "status": "begin",
+                "write_log_file": False,
+                "max_log_size": 2000000,
+                "log_segments": -1,
+                "phases": {},
+                "state_dir": tempfile.gettempdir(),
+                "role_name": "systemd",
+                "role_path": "/usr/share/ansible/roles/linux-system-roles.systemd",
+                "ansible_play_hosts_all": ["host1"],
+                "distribution": "RedHat",
+                "distribution_version": "9.4",
+            },
+            check_mode=False,
+        )
+        with self.assertRaises(_FailJsonException) as ctx:
+            sr_fingerprint._handle_fingerprint(module)
+        self.assertIn(
+            "log_segments must be 0 or a positive integer",
+            ctx.exception.kwargs["msg"],
+        )
+
+    def test_handle_fingerprint_records_run_timing(self):
+        state_dir = tempfile.mkdtemp()
+        params = {
+            "write_log_file": False,
+            "max_log_size": 2000000,
+            "log_segments": 0,
+            "phases": {},
+            "state_dir": state_dir,
+            "role_name": "systemd",
+            "role_path": "/usr/share/ansible/roles/linux-system-roles.systemd",
+            "ansible_play_hosts_all": ["host1"],
+            "distribution": "RedHat",
+            "distribution_version": "9.4",
+        }
+        state_file = os.path.join(state_dir, "systemd.json")
+
+        try:
+            module = _FakeModule(dict(params, status="begin"))
+            with self.assertRaises(_ExitJsonException) as ctx:
+                sr_fingerprint._handle_fingerprint(module)
+            begin = ctx.exception.kwargs["fingerprint"]
+            self.assertTrue(os.path.exists(state_file))
+            self.assertIn("run_id=%s" % begin["run_id"], module.logged[0])
+            self.assertNotIn("duration_seconds", begin)
+
+            module = _FakeModule(
+                dict(
+                    params,
+                    status="success",
+                    phases={"package_install": 1.5, "cluster_setup": 3.25},
+                )
+            )
+            with self.assertRaises(_ExitJsonException) as ctx:
+                sr_fingerprint._handle_fingerprint(module)
+            success = ctx.exception.kwargs["fingerprint"]
+            self.assertFalse(os.path.exists(state_file))
+            self.assertEqual(success["run_id"], begin["run_id"])
+            self.assertGreaterEqual(success["duration_seconds"], 0)
+            self.assertEqual(
+                success["phases"], {"package_install": 1.5, "cluster_setup": 3.25}
+            )
+            self.assertTrue(
+                module.logged[0].endswith(
+                    " phases=package_install:1.5,cluster_setup:3.25"
+                )
+            )
+        finally:
+            for name in os.listdir(state_dir):
+                os.unlink(os.path.join(state_dir, name))
+            os.rmdir(state_dir)
+
+    def test_finish_run_without_begin(self):
+        state_dir = tempfile.mkdtemp()
+
+        try:
+            record = _sample_fingerprint_record()
+            sr_fingerprint._finish_run(
+                os.path.join(state_dir, "systemd.json"),
+                record,
+                {"package_install": 1.5},
+            )
+            self.assertEqual(record, _sample_fingerprint_record())
+        finally:
+            os.rmdir(state_dir)
+
     def test_local_iso8601_no_microseconds_has_no_fraction(self):
         timestamp = sr_fingerprint._local_iso8601_no_microseconds()
         match = re.match(
@@ -13,6 +13,6 @@ echo -e "Test files:\n$TEST_LIST"
 
 source "$PYENV_ROOT/bin/activate"
 pcs --version
-export PYTHONPATH="./library:./module_utils:${PYTHONPATH:-""}"
+export PYTHONPATH="./library:./module_utils:./action_plugins:${PYTHONPATH:-""}"
 # shellcheck disable=SC2086
 python -m unittest --verbose $TEST_LIST